@@ -0,0 +1,76 @@
+"""Add composite and partial indexes for incident and medication filters
+
+Revision ID: 026f4e445eef
+Revises: 8b5210d3717d
+Create Date: 2026-10-16 10:48:15.570935
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '026f4e445eef'
+down_revision: Union[str, None] = '8b5210d3717d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Child timelines and type filters order by newest first
+    op.create_index(
+        'ix_incident_child_date', 'incident_reports',
+        ['child_id', sa.text('incident_date DESC'), sa.text('incident_time DESC')],
+        unique=False
+    )
+    op.create_index(
+        'ix_incident_type_date', 'incident_reports',
+        ['incident_type', sa.text('incident_date DESC')],
+        unique=False
+    )
+    # Partial indexes for the parent and DCFS notification worklists
+    op.create_index(
+        'ix_incident_pending_parent', 'incident_reports',
+        [sa.text('incident_date DESC'), sa.text('incident_time DESC')],
+        unique=False, postgresql_where=sa.text('parent_notified = false')
+    )
+    op.create_index(
+        'ix_incident_dcfs_required', 'incident_reports', [sa.text('incident_date DESC')],
+        unique=False, postgresql_where=sa.text('dcfs_notification_required = true')
+    )
+    op.create_index(
+        'ix_medauth_active_today', 'medication_authorizations',
+        ['is_active', 'start_date', 'end_date'],
+        unique=False
+    )
+    # Superseded by the composite and partial indexes above
+    op.drop_index('ix_incident_reports_child_id', table_name='incident_reports')
+    op.drop_index('ix_incident_reports_incident_type', table_name='incident_reports')
+    op.drop_index('ix_incident_reports_dcfs_notification_required', table_name='incident_reports')
+    op.drop_index('ix_medication_authorizations_is_active', table_name='medication_authorizations')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_medication_authorizations_is_active', 'medication_authorizations', ['is_active'],
+        unique=False
+    )
+    op.create_index(
+        'ix_incident_reports_dcfs_notification_required', 'incident_reports', ['dcfs_notification_required'],
+        unique=False
+    )
+    op.create_index(
+        'ix_incident_reports_incident_type', 'incident_reports', ['incident_type'],
+        unique=False
+    )
+    op.create_index(
+        'ix_incident_reports_child_id', 'incident_reports', ['child_id'],
+        unique=False
+    )
+    op.drop_index('ix_medauth_active_today', table_name='medication_authorizations')
+    op.drop_index('ix_incident_dcfs_required', table_name='incident_reports')
+    op.drop_index('ix_incident_pending_parent', table_name='incident_reports')
+    op.drop_index('ix_incident_type_date', table_name='incident_reports')
+    op.drop_index('ix_incident_child_date', table_name='incident_reports')
@@ -0,0 +1,72 @@
+"""Add unique constraint on attendance child and day
+
+Revision ID: 096b1a45c0c8
+Revises: 43e755271c5e
+Create Date: 2026-10-16 09:28:52.418916
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '096b1a45c0c8'
+down_revision: Union[str, None] = '43e755271c5e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Merge duplicate records for the same child and day into the earliest
+    # check-in, carrying over the day's last check-out
+    op.execute("""
+        UPDATE attendance AS a
+        SET check_out_time = last_out.check_out_time,
+            check_out_by_name = last_out.check_out_by_name,
+            check_out_signature_url = last_out.check_out_signature_url,
+            is_late_pickup = last_out.is_late_pickup,
+            late_pickup_minutes = last_out.late_pickup_minutes
+        FROM (
+            SELECT DISTINCT ON (child_id, attendance_date)
+                   child_id, attendance_date, check_out_time, check_out_by_name,
+                   check_out_signature_url, is_late_pickup, late_pickup_minutes
+            FROM attendance
+            WHERE check_out_time IS NOT NULL
+            ORDER BY child_id, attendance_date, check_out_time DESC, id
+        ) AS last_out
+        WHERE a.child_id = last_out.child_id
+          AND a.attendance_date = last_out.attendance_date
+          AND EXISTS (
+              SELECT 1 FROM attendance AS other
+              WHERE other.child_id = a.child_id
+                AND other.attendance_date = a.attendance_date
+                AND other.id <> a.id
+          )
+          AND NOT EXISTS (
+              SELECT 1 FROM attendance AS earlier
+              WHERE earlier.child_id = a.child_id
+                AND earlier.attendance_date = a.attendance_date
+                AND (earlier.check_in_time, earlier.created_at, earlier.id)
+                    < (a.check_in_time, a.created_at, a.id)
+          )
+    """)
+    op.execute("""
+        DELETE FROM attendance AS a
+        USING attendance AS earlier
+        WHERE earlier.child_id = a.child_id
+          AND earlier.attendance_date = a.attendance_date
+          AND (earlier.check_in_time, earlier.created_at, earlier.id)
+              < (a.check_in_time, a.created_at, a.id)
+    """)
+
+    # One attendance record per child per day; check-in relies on this for ON CONFLICT
+    op.create_unique_constraint(
+        'uq_attendance_child_day', 'attendance', ['child_id', 'attendance_date']
+    )
+
+
+def downgrade() -> None:
+    # Records merged by upgrade() are not split back out
+    op.drop_constraint('uq_attendance_child_day', 'attendance', type_='unique')
@@ -0,0 +1,51 @@
+"""Add unique constraint on emergency contact priority per child
+
+Revision ID: 1ed3fc0b11ef
+Revises: e0bf10b48b52
+Create Date: 2026-10-16 10:19:23.152019
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1ed3fc0b11ef'
+down_revision: Union[str, None] = 'e0bf10b48b52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Children with two contacts in the same slot get their contacts renumbered
+    # 1..n, keeping the existing order (oldest first within a shared slot)
+    op.execute("""
+        UPDATE emergency_contacts AS ec
+        SET priority_order = ranked.new_order
+        FROM (
+            SELECT id,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY child_id ORDER BY priority_order, created_at, id
+                   ) AS new_order
+            FROM emergency_contacts
+            WHERE child_id IN (
+                SELECT child_id
+                FROM emergency_contacts
+                GROUP BY child_id, priority_order
+                HAVING COUNT(*) > 1
+            )
+        ) AS ranked
+        WHERE ec.id = ranked.id
+          AND ec.priority_order <> ranked.new_order
+    """)
+
+    # One contact per priority slot per child; contact creation relies on this for ON CONFLICT
+    op.create_unique_constraint(
+        'uq_contact_priority', 'emergency_contacts', ['child_id', 'priority_order']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_contact_priority', 'emergency_contacts', type_='unique')
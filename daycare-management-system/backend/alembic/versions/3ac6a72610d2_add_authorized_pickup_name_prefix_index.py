@@ -0,0 +1,31 @@
+"""Add lower(name) pattern index for prefix pickup search
+
+Revision ID: 3ac6a72610d2
+Revises: e6221da74c47
+Create Date: 2026-10-16 10:04:57.942561
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3ac6a72610d2'
+down_revision: Union[str, None] = 'e6221da74c47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # text_pattern_ops lets LIKE 'prefix%' use a btree regardless of collation
+    op.create_index(
+        'idx_authorized_pickup_name_lower_pattern', 'authorized_pickup',
+        [sa.text('lower(name) text_pattern_ops')],
+        unique=False, postgresql_where=sa.text('is_active')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_authorized_pickup_name_lower_pattern', table_name='authorized_pickup')
@@ -0,0 +1,116 @@
+"""Use native enums for activity type and mood
+
+Revision ID: 43e755271c5e
+Revises: f6774e6ed6b4
+Create Date: 2026-10-16 09:21:39.314187
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '43e755271c5e'
+down_revision: Union[str, None] = 'f6774e6ed6b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+activity_type_enum = postgresql.ENUM(
+    'meal', 'nap', 'diaper', 'play', 'learning', 'outdoor',
+    name='activity_type_enum'
+)
+activity_mood_enum = postgresql.ENUM(
+    'happy', 'sad', 'energetic', 'tired', 'cranky', 'neutral',
+    name='activity_mood_enum'
+)
+
+# Same definition as 79845bbd484b, with enum columns cast to text so the
+# view keeps its original column types
+DAILY_ACTIVITY_SUMMARY_VIEW = """
+    CREATE MATERIALIZED VIEW mv_daily_activity_summary AS
+    SELECT
+        a.child_id,
+        a.activity_date,
+        COUNT(*) AS total,
+        t.type_counts,
+        COALESCE(SUM(a.duration_minutes) FILTER (WHERE a.activity_type = 'nap'), 0) AS total_nap_minutes,
+        COUNT(*) FILTER (WHERE a.activity_type = 'meal') AS meal_count,
+        COUNT(*) FILTER (WHERE a.activity_type = 'diaper') AS diaper_count,
+        COALESCE(
+            array_agg(a.mood::text ORDER BY a.activity_time) FILTER (WHERE a.mood IS NOT NULL),
+            '{}'
+        ) AS moods,
+        mode() WITHIN GROUP (ORDER BY a.mood::text) AS predominant_mood
+    FROM activities a
+    JOIN (
+        SELECT child_id, activity_date, jsonb_object_agg(activity_type::text, cnt) AS type_counts
+        FROM (
+            SELECT child_id, activity_date, activity_type, COUNT(*) AS cnt
+            FROM activities
+            GROUP BY child_id, activity_date, activity_type
+        ) per_type
+        GROUP BY child_id, activity_date
+    ) t ON t.child_id = a.child_id AND t.activity_date = a.activity_date
+    GROUP BY a.child_id, a.activity_date, t.type_counts
+"""
+
+
+def _drop_summary_view() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_mv_daily_activity_summary_child_date")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_daily_activity_summary")
+
+
+def _create_summary_view(definition: str) -> None:
+    op.execute(definition)
+    op.execute("""
+        CREATE UNIQUE INDEX ix_mv_daily_activity_summary_child_date
+        ON mv_daily_activity_summary (child_id, activity_date)
+    """)
+
+
+def upgrade() -> None:
+    # The summary view depends on both columns, so it is rebuilt around the type change
+    _drop_summary_view()
+
+    activity_type_enum.create(op.get_bind(), checkfirst=True)
+    activity_mood_enum.create(op.get_bind(), checkfirst=True)
+    op.alter_column(
+        'activities', 'activity_type',
+        type_=activity_type_enum,
+        existing_nullable=False,
+        postgresql_using='activity_type::activity_type_enum'
+    )
+    op.alter_column(
+        'activities', 'mood',
+        type_=activity_mood_enum,
+        existing_nullable=True,
+        postgresql_using='mood::activity_mood_enum'
+    )
+
+    _create_summary_view(DAILY_ACTIVITY_SUMMARY_VIEW)
+
+
+def downgrade() -> None:
+    _drop_summary_view()
+
+    op.alter_column(
+        'activities', 'mood',
+        type_=sa.String(length=50),
+        existing_nullable=True,
+        postgresql_using='mood::text'
+    )
+    op.alter_column(
+        'activities', 'activity_type',
+        type_=sa.String(length=50),
+        existing_nullable=False,
+        postgresql_using='activity_type::text'
+    )
+    activity_mood_enum.drop(op.get_bind(), checkfirst=True)
+    activity_type_enum.drop(op.get_bind(), checkfirst=True)
+
+    # Text columns again, so the casts are harmless
+    _create_summary_view(DAILY_ACTIVITY_SUMMARY_VIEW)
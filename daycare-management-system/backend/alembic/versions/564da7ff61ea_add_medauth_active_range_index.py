@@ -0,0 +1,42 @@
+"""Replace the active-medication btree with a GiST daterange index
+
+Revision ID: 564da7ff61ea
+Revises: 026f4e445eef
+Create Date: 2026-10-16 10:55:28.675664
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '564da7ff61ea'
+down_revision: Union[str, None] = '026f4e445eef'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+RANGE_EXPRESSION = (
+    "(CASE WHEN end_date < start_date THEN 'empty'::daterange "
+    "ELSE daterange(start_date, end_date, '[]') END)"
+)
+
+
+def upgrade() -> None:
+    # Active-on-a-date lookups become a single range containment probe
+    op.create_index(
+        'ix_medauth_active_range', 'medication_authorizations', [sa.text(RANGE_EXPRESSION)],
+        unique=False, postgresql_using='gist', postgresql_where=sa.text('is_active')
+    )
+    op.drop_index('ix_medauth_active_today', table_name='medication_authorizations')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_medauth_active_today', 'medication_authorizations',
+        ['is_active', 'start_date', 'end_date'],
+        unique=False
+    )
+    op.drop_index('ix_medauth_active_range', table_name='medication_authorizations')
@@ -0,0 +1,78 @@
+"""Generate late pickup columns from check out time
+
+Revision ID: 662abb1855a8
+Revises: 096b1a45c0c8
+Create Date: 2026-10-16 09:36:05.523645
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = '662abb1855a8'
+down_revision: Union[str, None] = '096b1a45c0c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# The grace period is read once, when this migration runs, and stored in
+# the column definitions; changing the setting afterwards takes a new
+# migration that re-creates both columns
+GRACE_MINUTES = int(settings.LATE_PICKUP_GRACE_MINUTES)
+
+# Minutes past the 6:00 PM pickup time, less the grace period;
+# 0 until checked out or when on time
+LATE_PICKUP_MINUTES_SQL = (
+    "COALESCE(GREATEST(0, "
+    f"FLOOR(EXTRACT(EPOCH FROM (check_out_time - TIME '18:00')) / 60)::integer - {GRACE_MINUTES}), 0)"
+)
+# Late from the first whole minute past the grace period
+IS_LATE_PICKUP_SQL = (
+    f"COALESCE(check_out_time >= TIME '18:00' + INTERVAL '{GRACE_MINUTES + 1} minutes', false)"
+)
+
+
+def upgrade() -> None:
+    op.drop_index('ix_attendance_late', table_name='attendance')
+    op.drop_column('attendance', 'is_late_pickup')
+    op.drop_column('attendance', 'late_pickup_minutes')
+
+    # Stored generated columns backfill existing rows from check_out_time
+    op.add_column('attendance', sa.Column(
+        'is_late_pickup', sa.Boolean(), sa.Computed(IS_LATE_PICKUP_SQL, persisted=True), nullable=False
+    ))
+    op.add_column('attendance', sa.Column(
+        'late_pickup_minutes', sa.Integer(), sa.Computed(LATE_PICKUP_MINUTES_SQL, persisted=True), nullable=False
+    ))
+    op.create_index(
+        'ix_attendance_late_gen', 'attendance', ['attendance_date'],
+        unique=False, postgresql_where=sa.text('late_pickup_minutes > 0')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_attendance_late_gen', table_name='attendance')
+    op.drop_column('attendance', 'late_pickup_minutes')
+    op.drop_column('attendance', 'is_late_pickup')
+
+    op.add_column('attendance', sa.Column(
+        'is_late_pickup', sa.Boolean(), server_default=sa.text('false'), nullable=False
+    ))
+    op.add_column('attendance', sa.Column(
+        'late_pickup_minutes', sa.Integer(), server_default=sa.text('0'), nullable=False
+    ))
+    # Keep the values the generated columns held
+    op.execute(f"""
+        UPDATE attendance
+        SET is_late_pickup = {IS_LATE_PICKUP_SQL},
+            late_pickup_minutes = {LATE_PICKUP_MINUTES_SQL}
+    """)
+    op.create_index(
+        'ix_attendance_late', 'attendance', [sa.text('attendance_date DESC')],
+        unique=False, postgresql_where=sa.text('is_late_pickup = TRUE')
+    )
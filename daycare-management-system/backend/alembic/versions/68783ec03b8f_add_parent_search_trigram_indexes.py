@@ -0,0 +1,47 @@
+"""Add trigram indexes for parent search
+
+Revision ID: 68783ec03b8f
+Revises: 89e868dd07e9
+Create Date: 2026-10-16 11:09:54.885122
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '68783ec03b8f'
+down_revision: Union[str, None] = '89e868dd07e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # GIN trigram indexes let the ILIKE '%term%' parent search avoid sequential scans
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'idx_parents_first_name_trgm', 'parents', ['first_name'],
+        unique=False, postgresql_using='gin', postgresql_ops={'first_name': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'idx_parents_last_name_trgm', 'parents', ['last_name'],
+        unique=False, postgresql_using='gin', postgresql_ops={'last_name': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'idx_parents_email_trgm', 'parents', ['email'],
+        unique=False, postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'idx_parents_phone_primary_trgm', 'parents', ['phone_primary'],
+        unique=False, postgresql_using='gin', postgresql_ops={'phone_primary': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_parents_phone_primary_trgm', table_name='parents')
+    op.drop_index('idx_parents_email_trgm', table_name='parents')
+    op.drop_index('idx_parents_last_name_trgm', table_name='parents')
+    op.drop_index('idx_parents_first_name_trgm', table_name='parents')
+    # pg_trgm is left installed; other objects may depend on it
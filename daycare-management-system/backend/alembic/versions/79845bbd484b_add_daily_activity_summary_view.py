@@ -0,0 +1,60 @@
+"""Add daily activity summary materialized view
+
+Revision ID: 79845bbd484b
+Revises: 3c22baf615ad
+Create Date: 2026-10-16 09:07:13.104729
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '79845bbd484b'
+down_revision: Union[str, None] = '3c22baf615ad'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # One row per (child, day) so the summary endpoint reads a single row
+    # instead of aggregating every activity in Python
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_daily_activity_summary AS
+        SELECT
+            a.child_id,
+            a.activity_date,
+            COUNT(*) AS total,
+            t.type_counts,
+            COALESCE(SUM(a.duration_minutes) FILTER (WHERE a.activity_type = 'nap'), 0) AS total_nap_minutes,
+            COUNT(*) FILTER (WHERE a.activity_type = 'meal') AS meal_count,
+            COUNT(*) FILTER (WHERE a.activity_type = 'diaper') AS diaper_count,
+            COALESCE(
+                array_agg(a.mood ORDER BY a.activity_time) FILTER (WHERE a.mood IS NOT NULL),
+                '{}'
+            ) AS moods,
+            mode() WITHIN GROUP (ORDER BY a.mood) AS predominant_mood
+        FROM activities a
+        JOIN (
+            SELECT child_id, activity_date, jsonb_object_agg(activity_type, cnt) AS type_counts
+            FROM (
+                SELECT child_id, activity_date, activity_type, COUNT(*) AS cnt
+                FROM activities
+                GROUP BY child_id, activity_date, activity_type
+            ) per_type
+            GROUP BY child_id, activity_date
+        ) t ON t.child_id = a.child_id AND t.activity_date = a.activity_date
+        GROUP BY a.child_id, a.activity_date, t.type_counts
+    """)
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute("""
+        CREATE UNIQUE INDEX ix_mv_daily_activity_summary_child_date
+        ON mv_daily_activity_summary (child_id, activity_date)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_mv_daily_activity_summary_child_date")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_daily_activity_summary")
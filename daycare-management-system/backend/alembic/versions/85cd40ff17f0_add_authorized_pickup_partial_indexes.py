@@ -0,0 +1,35 @@
+"""Add partial indexes for active authorized pickup lists
+
+Revision ID: 85cd40ff17f0
+Revises: a0f0a5941883
+Create Date: 2026-10-16 09:50:31.733103
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '85cd40ff17f0'
+down_revision: Union[str, None] = 'a0f0a5941883'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Active-only lists: /active (ordered by name, id) and photo-verification-required
+    op.create_index(
+        'idx_authorized_pickup_active_name', 'authorized_pickup', ['name', 'id'],
+        unique=False, postgresql_where=sa.text('is_active')
+    )
+    op.create_index(
+        'idx_authorized_pickup_active_no_photo', 'authorized_pickup', ['created_at'],
+        unique=False, postgresql_where=sa.text('is_active AND photo_url IS NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_authorized_pickup_active_no_photo', table_name='authorized_pickup')
+    op.drop_index('idx_authorized_pickup_active_name', table_name='authorized_pickup')
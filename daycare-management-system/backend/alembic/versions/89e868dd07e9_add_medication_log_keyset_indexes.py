@@ -0,0 +1,48 @@
+"""Add keyset indexes for per-child and per-authorization medication logs
+
+Revision ID: 89e868dd07e9
+Revises: 564da7ff61ea
+Create Date: 2026-10-16 11:02:41.780393
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '89e868dd07e9'
+down_revision: Union[str, None] = '564da7ff61ea'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keyset pagination order for the per-child and per-authorization histories
+    op.create_index(
+        'ix_medlog_child_date_time_id', 'medication_logs',
+        ['child_id', sa.text('administration_date DESC'), sa.text('administration_time DESC'), sa.text('id DESC')],
+        unique=False
+    )
+    op.create_index(
+        'ix_medlog_auth_date_time_id', 'medication_logs',
+        ['authorization_id', sa.text('administration_date DESC'), sa.text('administration_time DESC'), sa.text('id DESC')],
+        unique=False
+    )
+    # Superseded by the composites above, which lead with the same columns
+    op.drop_index('ix_medication_logs_child_id', table_name='medication_logs')
+    op.drop_index('ix_medication_logs_authorization_id', table_name='medication_logs')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_medication_logs_authorization_id', 'medication_logs', ['authorization_id'],
+        unique=False
+    )
+    op.create_index(
+        'ix_medication_logs_child_id', 'medication_logs', ['child_id'],
+        unique=False
+    )
+    op.drop_index('ix_medlog_auth_date_time_id', table_name='medication_logs')
+    op.drop_index('ix_medlog_child_date_time_id', table_name='medication_logs')
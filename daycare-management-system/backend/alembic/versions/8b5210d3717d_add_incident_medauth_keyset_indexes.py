@@ -0,0 +1,43 @@
+"""Add keyset pagination indexes for incidents and medication authorizations
+
+Revision ID: 8b5210d3717d
+Revises: c4b02cd91036
+Create Date: 2026-10-16 10:41:02.466206
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b5210d3717d'
+down_revision: Union[str, None] = 'c4b02cd91036'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Match the list endpoints' ORDER BY so each page is one index range scan
+    op.create_index(
+        'ix_incident_date_time_id', 'incident_reports',
+        [sa.text('incident_date DESC'), sa.text('incident_time DESC'), sa.text('id DESC')],
+        unique=False
+    )
+    op.create_index(
+        'ix_medauth_start_id', 'medication_authorizations',
+        [sa.text('start_date DESC'), sa.text('id DESC')],
+        unique=False
+    )
+    # Covered by the leading column of ix_incident_date_time_id
+    op.drop_index('ix_incident_reports_incident_date', table_name='incident_reports')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_incident_reports_incident_date', 'incident_reports', ['incident_date'],
+        unique=False
+    )
+    op.drop_index('ix_medauth_start_id', table_name='medication_authorizations')
+    op.drop_index('ix_incident_date_time_id', table_name='incident_reports')
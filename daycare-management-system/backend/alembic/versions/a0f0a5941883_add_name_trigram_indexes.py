@@ -0,0 +1,42 @@
+"""Add trigram indexes for child and authorized pickup name search
+
+Revision ID: a0f0a5941883
+Revises: 662abb1855a8
+Create Date: 2026-10-16 09:43:18.628374
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a0f0a5941883'
+down_revision: Union[str, None] = '662abb1855a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # GIN trigram indexes let ILIKE '%term%' searches avoid sequential scans
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'idx_authorized_pickup_name_trgm', 'authorized_pickup', ['name'],
+        unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'idx_children_first_name_trgm', 'children', ['first_name'],
+        unique=False, postgresql_using='gin', postgresql_ops={'first_name': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'idx_children_last_name_trgm', 'children', ['last_name'],
+        unique=False, postgresql_using='gin', postgresql_ops={'last_name': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_children_last_name_trgm', table_name='children')
+    op.drop_index('idx_children_first_name_trgm', table_name='children')
+    op.drop_index('idx_authorized_pickup_name_trgm', table_name='authorized_pickup')
+    # pg_trgm is left installed; other objects may depend on it
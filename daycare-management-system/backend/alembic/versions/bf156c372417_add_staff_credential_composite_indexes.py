@@ -0,0 +1,51 @@
+"""Add staff credential composite and partial expiration indexes
+
+Revision ID: bf156c372417
+Revises: 1ed3fc0b11ef
+Create Date: 2026-10-16 10:26:36.256748
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'bf156c372417'
+down_revision: Union[str, None] = '1ed3fc0b11ef'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_staff_credentials_user_expiration', 'staff_credentials', ['user_id', 'expiration_date'],
+        unique=False
+    )
+    # Credentials without an expiration date never expire, so leave them out
+    op.create_index(
+        'idx_staff_credentials_expiring', 'staff_credentials', ['expiration_date'],
+        unique=False, postgresql_where=sa.text('expiration_date IS NOT NULL')
+    )
+    # Covered by the leading column of the indexes above / uq_contact_priority
+    op.drop_index('ix_staff_credentials_user_id', table_name='staff_credentials')
+    op.drop_index('ix_staff_credentials_expiration_date', table_name='staff_credentials')
+    op.drop_index('ix_emergency_contacts_child_id', table_name='emergency_contacts')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_emergency_contacts_child_id', 'emergency_contacts', ['child_id'],
+        unique=False
+    )
+    op.create_index(
+        'ix_staff_credentials_expiration_date', 'staff_credentials', ['expiration_date'],
+        unique=False
+    )
+    op.create_index(
+        'ix_staff_credentials_user_id', 'staff_credentials', ['user_id'],
+        unique=False
+    )
+    op.drop_index('idx_staff_credentials_expiring', table_name='staff_credentials')
+    op.drop_index('idx_staff_credentials_user_expiration', table_name='staff_credentials')
@@ -0,0 +1,40 @@
+"""Drop stored is_expired flag from staff credentials
+
+Revision ID: c4b02cd91036
+Revises: bf156c372417
+Create Date: 2026-10-16 10:33:49.361477
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4b02cd91036'
+down_revision: Union[str, None] = 'bf156c372417'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # is_expired is now derived from expiration_date (StaffCredential.is_expired hybrid)
+    op.drop_index('ix_staff_credentials_is_expired', table_name='staff_credentials')
+    op.drop_column('staff_credentials', 'is_expired')
+
+
+def downgrade() -> None:
+    op.add_column(
+        'staff_credentials',
+        sa.Column('is_expired', sa.Boolean(), server_default=sa.false(), nullable=False)
+    )
+    op.execute(
+        "UPDATE staff_credentials SET is_expired = TRUE "
+        "WHERE expiration_date < CURRENT_DATE"
+    )
+    op.alter_column('staff_credentials', 'is_expired', server_default=None)
+    op.create_index(
+        'ix_staff_credentials_is_expired', 'staff_credentials', ['is_expired'],
+        unique=False
+    )
@@ -0,0 +1,31 @@
+"""Add trigram expression index for child full-name search
+
+Revision ID: e0bf10b48b52
+Revises: 3ac6a72610d2
+Create Date: 2026-10-16 10:12:10.047290
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e0bf10b48b52'
+down_revision: Union[str, None] = '3ac6a72610d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Must match the get_children full_name predicate for the planner to use it
+    op.create_index(
+        'idx_children_full_name_trgm', 'children',
+        [sa.text("lower(first_name || ' ' || last_name) gin_trgm_ops")],
+        unique=False, postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_children_full_name_trgm', table_name='children')
@@ -0,0 +1,35 @@
+"""Replace immunization expiration index with a partial index
+
+Revision ID: e6221da74c47
+Revises: 85cd40ff17f0
+Create Date: 2026-10-16 09:57:44.837832
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6221da74c47'
+down_revision: Union[str, None] = '85cd40ff17f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Undated records never expire, so leave them out of the index
+    op.create_index(
+        'idx_immunizations_expiring', 'immunization_records', ['expiration_date'],
+        unique=False, postgresql_where=sa.text('expiration_date IS NOT NULL')
+    )
+    op.drop_index('ix_immunization_records_expiration_date', table_name='immunization_records')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_immunization_records_expiration_date', 'immunization_records', ['expiration_date'],
+        unique=False
+    )
+    op.drop_index('idx_immunizations_expiring', table_name='immunization_records')
@@ -0,0 +1,48 @@
+"""Add composite and partial indexes for activity and attendance lists
+
+Revision ID: f6774e6ed6b4
+Revises: 79845bbd484b
+Create Date: 2026-10-16 09:14:26.209458
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6774e6ed6b4'
+down_revision: Union[str, None] = '79845bbd484b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Child timelines filter by child and order by newest first
+    op.create_index(
+        'ix_activities_child_date_time', 'activities',
+        ['child_id', sa.text('activity_date DESC'), sa.text('activity_time DESC')],
+        unique=False
+    )
+    op.create_index(
+        'ix_attendance_child_date', 'attendance',
+        ['child_id', sa.text('attendance_date DESC')],
+        unique=False
+    )
+    # Partial indexes for the currently checked-in and late pickup lists
+    op.create_index(
+        'ix_attendance_open', 'attendance', ['attendance_date'],
+        unique=False, postgresql_where=sa.text('check_out_time IS NULL')
+    )
+    op.create_index(
+        'ix_attendance_late', 'attendance', [sa.text('attendance_date DESC')],
+        unique=False, postgresql_where=sa.text('is_late_pickup = TRUE')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_attendance_late', table_name='attendance')
+    op.drop_index('ix_attendance_open', table_name='attendance')
+    op.drop_index('ix_attendance_child_date', table_name='attendance')
+    op.drop_index('ix_activities_child_date_time', table_name='activities')
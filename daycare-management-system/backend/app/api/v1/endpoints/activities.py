@@ -1,30 +1,111 @@
 # Activities Management Endpoints
 # ============================================
 
+import logging
+import threading
 from datetime import date, datetime
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
-
-from app.database import get_db
-from app.models.daily_operations import Activity
-from app.models.child import Child
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status, Query
+from sqlalchemy.orm import Session, load_only, raiseload
+from sqlalchemy import and_, case, delete, func, select, text, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from app.database import SessionLocal, get_db
+from app.models.daily_operations import Activity, daily_activity_summary_view
 from app.models.user import User
 from app.schemas.daily_operations import (
     ActivityCreate,
     ActivityUpdate,
     ActivityResponse,
+    ActivityListItem,
+    ActivityType,
 )
 from app.core.security import get_current_user
+from app.dependencies import ensure_child_exists, get_child_name
+from app.core.cache import cache, cached
+from app.core.http_cache import etag
+from app.core.pagination import keyset_paginate, offset_page
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Columns selected by list endpoints (matches ActivityListItem)
+ACTIVITY_LIST_COLUMNS = (
+    Activity.id,
+    Activity.child_id,
+    Activity.activity_date,
+    Activity.activity_time,
+    Activity.activity_type,
+    Activity.activity_name,
+    Activity.mood,
+    Activity.duration_minutes,
+)
+
+# Columns needed to build ActivityResponse from a full Activity row
+ACTIVITY_RESPONSE_COLUMNS = tuple(
+    getattr(Activity, field) for field in ActivityResponse.model_fields
+)
+
+
+# Coalesces summary refreshes within this process: at most one runs at a
+# time, and writes that land while it runs share a single follow-up pass
+_refresh_lock = threading.Lock()
+_refresh_running = False
+_refresh_pending = False
+
+
+def _refresh_summary_view() -> None:
+    """Run one concurrent refresh of the daily summary view"""
+    db = SessionLocal()
+    try:
+        db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_daily_activity_summary"))
+        db.commit()
+    except SQLAlchemyError as exc:
+        logger.warning("Daily activity summary refresh failed: %s", exc)
+        return
+    finally:
+        db.close()
+    cache.delete_pattern("activities:*")
+
+
+def refresh_daily_activity_summary():
+    """
+    Refresh the daily summary materialized view after an activity write.
+    Runs as a background task with its own session, then drops cached
+    summaries that were built from the previous view contents.
+
+    A burst of writes triggers one refresh plus at most one rerun rather
+    than a full refresh per write; until the view catches up, days missing
+    from it are summarized from the live rows (see _summarize_activities).
+    """
+    global _refresh_running, _refresh_pending
+
+    with _refresh_lock:
+        if _refresh_running:
+            _refresh_pending = True
+            return
+        _refresh_running = True
+
+    try:
+        while True:
+            with _refresh_lock:
+                _refresh_pending = False
+            _refresh_summary_view()
+            with _refresh_lock:
+                if not _refresh_pending:
+                    break
+    finally:
+        with _refresh_lock:
+            _refresh_running = False
+
 
 @router.post("/", response_model=ActivityResponse, status_code=status.HTTP_201_CREATED)
-async def create_activity(
+def create_activity(
     activity_data: ActivityCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -32,49 +113,36 @@ async def create_activity(
     Log a new activity for a child.
     Activities include: meals, naps, diaper changes, play, learning, outdoor time.
     """
-    # Verify child exists
-    child = db.query(Child).filter(Child.id == activity_data.child_id).first()
-    if not child:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Child with ID {activity_data.child_id} not found"
-        )
-
-    # Validate activity type
-    valid_types = ['meal', 'nap', 'diaper', 'play', 'learning', 'outdoor']
-    if activity_data.activity_type not in valid_types:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid activity type. Must be one of: {', '.join(valid_types)}"
-        )
-
-    # Validate mood if provided
-    if activity_data.mood:
-        valid_moods = ['happy', 'sad', 'energetic', 'tired', 'cranky', 'neutral']
-        if activity_data.mood not in valid_moods:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid mood. Must be one of: {', '.join(valid_moods)}"
-            )
-
     new_activity = Activity(
         **activity_data.model_dump(),
         logged_by=current_user.id
     )
 
+    # The child_id foreign key doubles as the existence check
     db.add(new_activity)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Child with ID {activity_data.child_id} not found"
+        )
     db.refresh(new_activity)
+    cache.delete_pattern("activities:*")
+    background_tasks.add_task(refresh_daily_activity_summary)
 
     return new_activity
 
 
-@router.get("/", response_model=List[ActivityResponse])
-async def get_activities(
+@router.get("/", response_model=List[ActivityListItem])
+def get_activities(
+    response: Response,
     activity_date: Optional[date] = Query(None, description="Filter by specific date"),
     child_id: Optional[UUID] = Query(None, description="Filter by child ID"),
-    activity_type: Optional[str] = Query(None, description="Filter by activity type"),
-    page: int = Query(1, ge=1, description="Page number"),
+    activity_type: Optional[ActivityType] = Query(None, description="Filter by activity type"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    page: Optional[int] = Query(None, ge=1, description="Page number (legacy offset pagination)"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -82,7 +150,7 @@ async def get_activities(
     """
     Get activity records with optional filtering.
     """
-    query = db.query(Activity)
+    query = db.query(*ACTIVITY_LIST_COLUMNS)
 
     # Apply filters
     if activity_date:
@@ -94,20 +162,30 @@ async def get_activities(
     if activity_type:
         query = query.filter(Activity.activity_type == activity_type)
 
-    # Apply pagination
-    offset = (page - 1) * page_size
-    activities = query.order_by(Activity.activity_date.desc(), Activity.activity_time.desc())\
-                     .offset(offset)\
-                     .limit(page_size)\
-                     .all()
+    sort_key = [Activity.activity_date, Activity.activity_time, Activity.id]
+
+    # Legacy offset pagination for clients that still send ?page=
+    if page is not None:
+        return offset_page(query, sort_key, page, page_size)
+
+    # Apply keyset pagination
+    activities = keyset_paginate(
+        query,
+        sort_key,
+        cursor,
+        page_size,
+        response
+    )
 
     return activities
 
 
-@router.get("/today", response_model=List[ActivityResponse])
-async def get_today_activities(
+@router.get("/today", response_model=List[ActivityListItem])
+@etag(max_age=10)
+@cached(prefix="activities", expire=60, response_model=List[ActivityListItem])
+def get_today_activities(
     child_id: Optional[UUID] = Query(None, description="Filter by child ID"),
-    activity_type: Optional[str] = Query(None, description="Filter by activity type"),
+    activity_type: Optional[ActivityType] = Query(None, description="Filter by activity type"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -116,7 +194,7 @@ async def get_today_activities(
     Useful for real-time daily report generation.
     """
     today = date.today()
-    query = db.query(Activity).filter(Activity.activity_date == today)
+    query = db.query(*ACTIVITY_LIST_COLUMNS).filter(Activity.activity_date == today)
 
     if child_id:
         query = query.filter(Activity.child_id == child_id)
@@ -129,13 +207,15 @@ async def get_today_activities(
     return activities
 
 
-@router.get("/child/{child_id}", response_model=List[ActivityResponse])
-async def get_child_activities(
+@router.get("/child/{child_id}", response_model=List[ActivityListItem])
+def get_child_activities(
     child_id: UUID,
+    response: Response,
     start_date: Optional[date] = Query(None, description="Start date"),
     end_date: Optional[date] = Query(None, description="End date"),
-    activity_type: Optional[str] = Query(None, description="Filter by activity type"),
-    page: int = Query(1, ge=1),
+    activity_type: Optional[ActivityType] = Query(None, description="Filter by activity type"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    page: Optional[int] = Query(None, ge=1, description="Page number (legacy offset pagination)"),
     page_size: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -145,14 +225,9 @@ async def get_child_activities(
     Useful for analyzing patterns and generating reports.
     """
     # Verify child exists
-    child = db.query(Child).filter(Child.id == child_id).first()
-    if not child:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Child with ID {child_id} not found"
-        )
+    ensure_child_exists(db, child_id)
 
-    query = db.query(Activity).filter(Activity.child_id == child_id)
+    query = db.query(*ACTIVITY_LIST_COLUMNS).filter(Activity.child_id == child_id)
 
     # Apply filters
     if start_date:
@@ -162,18 +237,26 @@ async def get_child_activities(
     if activity_type:
         query = query.filter(Activity.activity_type == activity_type)
 
-    # Apply pagination
-    offset = (page - 1) * page_size
-    activities = query.order_by(Activity.activity_date.desc(), Activity.activity_time.desc())\
-                     .offset(offset)\
-                     .limit(page_size)\
-                     .all()
+    sort_key = [Activity.activity_date, Activity.activity_time, Activity.id]
+
+    # Legacy offset pagination for clients that still send ?page=
+    if page is not None:
+        return offset_page(query, sort_key, page, page_size)
+
+    # Apply keyset pagination
+    activities = keyset_paginate(
+        query,
+        sort_key,
+        cursor,
+        page_size,
+        response
+    )
 
     return activities
 
 
 @router.get("/child/{child_id}/date/{activity_date}", response_model=List[ActivityResponse])
-async def get_child_activities_by_date(
+def get_child_activities_by_date(
     child_id: UUID,
     activity_date: date,
     db: Session = Depends(get_db),
@@ -184,14 +267,12 @@ async def get_child_activities_by_date(
     Used for generating daily reports.
     """
     # Verify child exists
-    child = db.query(Child).filter(Child.id == child_id).first()
-    if not child:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Child with ID {child_id} not found"
-        )
+    ensure_child_exists(db, child_id)
 
+    # Load only ActivityResponse columns; it has no nested relations, so
+    # raise on any accidental lazy load
     activities = db.query(Activity)\
+        .options(load_only(*ACTIVITY_RESPONSE_COLUMNS), raiseload("*"))\
         .filter(
             and_(
                 Activity.child_id == child_id,
@@ -205,7 +286,9 @@ async def get_child_activities_by_date(
 
 
 @router.get("/summary/child/{child_id}/date/{activity_date}")
-async def get_child_daily_activity_summary(
+@etag(max_age=10)
+@cached(prefix="activities", expire=60, single_flight=True)
+def get_child_daily_activity_summary(
     child_id: UUID,
     activity_date: date,
     db: Session = Depends(get_db),
@@ -216,70 +299,90 @@ async def get_child_daily_activity_summary(
     Returns counts by activity type and overall statistics.
     Useful for AI report generation.
     """
-    # Verify child exists
-    child = db.query(Child).filter(Child.id == child_id).first()
-    if not child:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Child with ID {child_id} not found"
+    summary = {
+        "child_id": str(child_id),
+        "child_name": get_child_name(db, child_id),
+        "date": activity_date.isoformat(),
+    }
+
+    # Read the pre-aggregated row from the materialized view
+    row = db.execute(
+        select(daily_activity_summary_view).where(
+            daily_activity_summary_view.c.child_id == child_id,
+            daily_activity_summary_view.c.activity_date == activity_date
         )
+    ).mappings().first()
+
+    if row:
+        summary.update({
+            "total_activities": row["total"],
+            "activities_by_type": row["type_counts"],
+            "moods": list(row["moods"]),
+            "total_nap_duration": row["total_nap_minutes"],
+            "meal_count": row["meal_count"],
+            "diaper_count": row["diaper_count"],
+            "predominant_mood": row["predominant_mood"],
+        })
+    else:
+        # View not refreshed yet for this day - aggregate the live rows
+        summary.update(_summarize_activities(db, child_id, activity_date))
 
-    # Get all activities for the day
-    activities = db.query(Activity)\
+    return summary
+
+
+def _summarize_activities(db: Session, child_id: UUID, activity_date: date) -> dict:
+    """
+    Compute daily summary statistics directly from the activities table.
+    """
+    # ROLLUP yields one row per activity type plus a grand-total row
+    # (activity_type grouping flag = 1) carrying the day-wide mood stats
+    rows = db.query(
+        Activity.activity_type,
+        func.grouping(Activity.activity_type).label("is_total"),
+        func.count(Activity.id).label("count"),
+        func.coalesce(
+            func.sum(case((Activity.activity_type == "nap", Activity.duration_minutes), else_=0)), 0
+        ).label("nap_minutes"),
+        func.array_agg(aggregate_order_by(Activity.mood, Activity.activity_time))
+            .filter(Activity.mood.isnot(None)).label("moods"),
+        func.mode().within_group(Activity.mood).label("predominant_mood")
+    )\
         .filter(
             and_(
                 Activity.child_id == child_id,
                 Activity.activity_date == activity_date
             )
         )\
+        .group_by(func.rollup(Activity.activity_type))\
         .all()
 
-    # Calculate summary statistics
     summary = {
-        "child_id": str(child_id),
-        "child_name": f"{child.first_name} {child.last_name}",
-        "date": activity_date.isoformat(),
-        "total_activities": len(activities),
+        "total_activities": 0,
         "activities_by_type": {},
         "moods": [],
         "total_nap_duration": 0,
         "meal_count": 0,
         "diaper_count": 0,
+        "predominant_mood": None,
     }
 
-    # Process activities
-    for activity in activities:
-        # Count by type
-        activity_type = activity.activity_type
-        if activity_type not in summary["activities_by_type"]:
-            summary["activities_by_type"][activity_type] = 0
-        summary["activities_by_type"][activity_type] += 1
-
-        # Track moods
-        if activity.mood:
-            summary["moods"].append(activity.mood)
-
-        # Track specific metrics
-        if activity_type == "nap" and activity.duration_minutes:
-            summary["total_nap_duration"] += activity.duration_minutes
-        elif activity_type == "meal":
-            summary["meal_count"] += 1
-        elif activity_type == "diaper":
-            summary["diaper_count"] += 1
-
-    # Calculate most common mood
-    if summary["moods"]:
-        from collections import Counter
-        mood_counts = Counter(summary["moods"])
-        summary["predominant_mood"] = mood_counts.most_common(1)[0][0]
-    else:
-        summary["predominant_mood"] = None
+    for row in rows:
+        if row.is_total:
+            summary["total_activities"] = row.count
+            summary["moods"] = row.moods or []
+            summary["total_nap_duration"] = row.nap_minutes
+            summary["predominant_mood"] = row.predominant_mood
+        else:
+            summary["activities_by_type"][row.activity_type] = row.count
+
+    summary["meal_count"] = summary["activities_by_type"].get("meal", 0)
+    summary["diaper_count"] = summary["activities_by_type"].get("diaper", 0)
 
     return summary
 
 
 @router.get("/{activity_id}", response_model=ActivityResponse)
-async def get_activity(
+def get_activity(
     activity_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -287,7 +390,7 @@ async def get_activity(
     """
     Get a specific activity by ID.
     """
-    activity = db.query(Activity).filter(Activity.id == activity_id).first()
+    activity = db.get(Activity, activity_id)
 
     if not activity:
         raise HTTPException(
@@ -299,9 +402,10 @@ async def get_activity(
 
 
 @router.put("/{activity_id}", response_model=ActivityResponse)
-async def update_activity(
+def update_activity(
     activity_id: UUID,
     activity_data: ActivityUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -309,35 +413,42 @@ async def update_activity(
     Update an activity record.
     Only the staff member who logged it or an admin can update.
     """
-    activity = db.query(Activity).filter(Activity.id == activity_id).first()
+    # Only the owner column is needed for the permission check
+    logged_by = db.query(Activity.logged_by).filter(Activity.id == activity_id).scalar()
 
-    if not activity:
+    if logged_by is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Activity with ID {activity_id} not found"
         )
 
     # Check permissions
-    if activity.logged_by != current_user.id and current_user.role != "admin":
+    if logged_by != current_user.id and current_user.role != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You can only update activities you logged"
         )
 
-    # Update only provided fields
+    # Update only provided fields in a single UPDATE ... RETURNING
     update_data = activity_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(activity, field, value)
+    activity = db.execute(
+        update(Activity)
+        .where(Activity.id == activity_id)
+        .values(**update_data)
+        .returning(Activity)
+    ).scalar_one()
 
     db.commit()
-    db.refresh(activity)
+    cache.delete_pattern("activities:*")
+    background_tasks.add_task(refresh_daily_activity_summary)
 
     return activity
 
 
 @router.delete("/{activity_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_activity(
+def delete_activity(
     activity_id: UUID,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -345,22 +456,28 @@ async def delete_activity(
     Delete an activity record.
     Only the staff member who logged it or an admin can delete.
     """
-    activity = db.query(Activity).filter(Activity.id == activity_id).first()
+    # Permission check and delete in one statement
+    stmt = delete(Activity).where(Activity.id == activity_id)
+    if current_user.role != "admin":
+        stmt = stmt.where(Activity.logged_by == current_user.id)
 
-    if not activity:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Activity with ID {activity_id} not found"
-        )
+    deleted = db.execute(stmt.returning(Activity.id)).first()
 
-    # Check permissions
-    if activity.logged_by != current_user.id and current_user.role != "admin":
+    if deleted is None:
+        # Nothing deleted: tell a missing row apart from someone else's
+        exists = db.query(db.query(Activity.id).filter(Activity.id == activity_id).exists()).scalar()
+        if not exists:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Activity with ID {activity_id} not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You can only delete activities you logged"
         )
 
-    db.delete(activity)
     db.commit()
+    cache.delete_pattern("activities:*")
+    background_tasks.add_task(refresh_daily_activity_summary)
 
     return None
@@ -1,12 +1,14 @@
 # Attendance Management Endpoints
 # ============================================
 
-from datetime import date, datetime, time
+from datetime import date
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import and_, bindparam, literal, select
+from sqlalchemy.dialects.postgresql import insert
 
 from app.database import get_db
 from app.models.daily_operations import Attendance
@@ -18,13 +20,38 @@ from app.schemas.daily_operations import (
     AttendanceResponse,
 )
 from app.core.security import get_current_user
-from app.core.config import settings
+from app.core.pagination import keyset_paginate, offset_page
+from app.dependencies import ensure_child_exists
+from app.core.cache import cache, cached
+from app.core.http_cache import etag
+from app.core.streaming import json_array_response, ndjson_response
 
 router = APIRouter()
 
+# Dashboard queries built once at import; only the date is bound per request
+SELECT_TODAY_ATTENDANCE = select(Attendance)\
+    .options(raiseload("*"))\
+    .where(Attendance.attendance_date == bindparam("day"))\
+    .order_by(Attendance.check_in_time)
+
+SELECT_CHECKED_IN = select(Attendance)\
+    .options(raiseload("*"))\
+    .where(
+        and_(
+            Attendance.attendance_date == bindparam("day"),
+            Attendance.check_out_time.is_(None)
+        )
+    )\
+    .order_by(Attendance.check_in_time)
+
+# Columns serialized by the streaming endpoint, in AttendanceResponse order
+ATTENDANCE_RESPONSE_COLUMNS = tuple(
+    getattr(Attendance, field) for field in AttendanceResponse.model_fields
+)
+
 
 @router.post("/check-in", response_model=AttendanceResponse, status_code=status.HTTP_201_CREATED)
-async def check_in_child(
+def check_in_child(
     attendance_data: AttendanceCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -33,56 +60,58 @@ async def check_in_child(
     Check in a child for the day.
     Records who dropped off the child and the check-in time.
     """
-    # Verify child exists
-    child = db.query(Child).filter(Child.id == attendance_data.child_id).first()
-    if not child:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Child with ID {attendance_data.child_id} not found"
-        )
-
-    # Check if child is active
-    if not child.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot check in inactive child"
-        )
-
-    # Check if already checked in today
-    today = date.today()
-    existing = db.query(Attendance).filter(
+    # Single INSERT ... SELECT: the row is only written when the child exists,
+    # is active and has no record today (unique constraint, so race-free)
+    values = {
+        "attendance_date": date.today(),
+        "check_in_time": attendance_data.check_in_time,
+        "check_in_by_name": attendance_data.check_in_by_name,
+        "check_in_signature_url": attendance_data.check_in_signature_url,
+        "notes": attendance_data.notes,
+        "recorded_by": current_user.id,
+    }
+    source = select(
+        Child.id,
+        *(literal(value, getattr(Attendance, name).type) for name, value in values.items())
+    ).where(
         and_(
-            Attendance.child_id == attendance_data.child_id,
-            Attendance.attendance_date == today
+            Child.id == attendance_data.child_id,
+            Child.is_active == True
         )
-    ).first()
-
-    if existing:
+    )
+    stmt = insert(Attendance)\
+        .from_select(["child_id", *values], source)\
+        .on_conflict_do_nothing(index_elements=["child_id", "attendance_date"])\
+        .returning(Attendance)
+
+    new_attendance = db.scalars(stmt).first()
+    if new_attendance is None:
+        db.rollback()
+        # Nothing inserted - work out why
+        is_active = db.query(Child.is_active).filter(Child.id == attendance_data.child_id).scalar()
+        if is_active is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Child with ID {attendance_data.child_id} not found"
+            )
+        if not is_active:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cannot check in inactive child"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Child already checked in today at {existing.check_in_time}"
+            detail="Child already checked in today"
         )
 
-    # Create attendance record
-    new_attendance = Attendance(
-        child_id=attendance_data.child_id,
-        attendance_date=today,
-        check_in_time=attendance_data.check_in_time,
-        check_in_by_name=attendance_data.check_in_by_name,
-        check_in_signature_url=attendance_data.check_in_signature_url,
-        notes=attendance_data.notes,
-        recorded_by=current_user.id
-    )
-
-    db.add(new_attendance)
     db.commit()
-    db.refresh(new_attendance)
+    cache.delete_pattern("attendance:*")
 
     return new_attendance
 
 
 @router.patch("/{attendance_id}/check-out", response_model=AttendanceResponse)
-async def check_out_child(
+def check_out_child(
     attendance_id: UUID,
     checkout_data: AttendanceCheckOut,
     db: Session = Depends(get_db),
@@ -92,7 +121,7 @@ async def check_out_child(
     Check out a child at the end of the day.
     Records who picked up the child and calculates late pickup if applicable.
     """
-    attendance = db.query(Attendance).filter(Attendance.id == attendance_id).first()
+    attendance = db.get(Attendance, attendance_id)
 
     if not attendance:
         raise HTTPException(
@@ -119,33 +148,23 @@ async def check_out_child(
         else:
             attendance.notes = checkout_data.notes
 
-    # Calculate late pickup
-    # Assuming standard pickup time is 6:00 PM (18:00)
-    standard_pickup = time(18, 0)  # 6:00 PM
-
-    if checkout_data.check_out_time > standard_pickup:
-        # Calculate minutes late
-        checkout_datetime = datetime.combine(date.today(), checkout_data.check_out_time)
-        standard_datetime = datetime.combine(date.today(), standard_pickup)
-        late_minutes = int((checkout_datetime - standard_datetime).total_seconds() / 60)
-
-        # Apply grace period
-        if late_minutes > settings.LATE_PICKUP_GRACE_MINUTES:
-            attendance.is_late_pickup = True
-            attendance.late_pickup_minutes = late_minutes - settings.LATE_PICKUP_GRACE_MINUTES
-
+    # is_late_pickup / late_pickup_minutes are generated by the database
+    # from check_out_time; the refresh below picks them up
     db.commit()
     db.refresh(attendance)
+    cache.delete_pattern("attendance:*")
 
     return attendance
 
 
 @router.get("/", response_model=List[AttendanceResponse])
-async def get_attendance_records(
+def get_attendance_records(
+    response: Response,
     attendance_date: Optional[date] = Query(None, description="Filter by specific date"),
     child_id: Optional[UUID] = Query(None, description="Filter by child ID"),
     checked_out: Optional[bool] = Query(None, description="Filter by checkout status"),
-    page: int = Query(1, ge=1, description="Page number"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    page: Optional[int] = Query(None, ge=1, description="Page number (legacy offset pagination)"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -153,7 +172,8 @@ async def get_attendance_records(
     """
     Get attendance records with optional filtering.
     """
-    query = db.query(Attendance)
+    # AttendanceResponse has no nested relations; raise on any accidental lazy load
+    query = db.query(Attendance).options(raiseload("*"))
 
     # Apply filters
     if attendance_date:
@@ -168,18 +188,28 @@ async def get_attendance_records(
         else:
             query = query.filter(Attendance.check_out_time.is_(None))
 
-    # Apply pagination
-    offset = (page - 1) * page_size
-    records = query.order_by(Attendance.attendance_date.desc(), Attendance.check_in_time.desc())\
-                   .offset(offset)\
-                   .limit(page_size)\
-                   .all()
+    sort_key = [Attendance.attendance_date, Attendance.check_in_time, Attendance.id]
+
+    # Legacy offset pagination for clients that still send ?page=
+    if page is not None:
+        return offset_page(query, sort_key, page, page_size)
+
+    # Apply keyset pagination
+    records = keyset_paginate(
+        query,
+        sort_key,
+        cursor,
+        page_size,
+        response
+    )
 
     return records
 
 
 @router.get("/today", response_model=List[AttendanceResponse])
-async def get_today_attendance(
+@etag(max_age=10)
+@cached(prefix="attendance", expire=60, response_model=List[AttendanceResponse])
+def get_today_attendance(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -187,43 +217,34 @@ async def get_today_attendance(
     Get all attendance records for today.
     Useful for displaying current attendance on dashboard.
     """
-    today = date.today()
-    records = db.query(Attendance)\
-        .filter(Attendance.attendance_date == today)\
-        .order_by(Attendance.check_in_time)\
-        .all()
+    records = db.execute(SELECT_TODAY_ATTENDANCE, {"day": date.today()}).scalars().all()
 
     return records
 
 
 @router.get("/today/checked-in", response_model=List[AttendanceResponse])
-async def get_currently_checked_in(
+@etag(max_age=10)
+@cached(prefix="attendance", expire=60, response_model=List[AttendanceResponse])
+def get_currently_checked_in(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get all children currently checked in (not yet checked out today).
     """
-    today = date.today()
-    records = db.query(Attendance)\
-        .filter(
-            and_(
-                Attendance.attendance_date == today,
-                Attendance.check_out_time.is_(None)
-            )
-        )\
-        .order_by(Attendance.check_in_time)\
-        .all()
+    records = db.execute(SELECT_CHECKED_IN, {"day": date.today()}).scalars().all()
 
     return records
 
 
 @router.get("/child/{child_id}", response_model=List[AttendanceResponse])
-async def get_child_attendance_history(
+def get_child_attendance_history(
     child_id: UUID,
+    response: Response,
     start_date: Optional[date] = Query(None, description="Start date"),
     end_date: Optional[date] = Query(None, description="End date"),
-    page: int = Query(1, ge=1),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    page: Optional[int] = Query(None, ge=1, description="Page number (legacy offset pagination)"),
     page_size: int = Query(30, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -232,14 +253,11 @@ async def get_child_attendance_history(
     Get attendance history for a specific child.
     """
     # Verify child exists
-    child = db.query(Child).filter(Child.id == child_id).first()
-    if not child:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Child with ID {child_id} not found"
-        )
+    ensure_child_exists(db, child_id)
 
-    query = db.query(Attendance).filter(Attendance.child_id == child_id)
+    query = db.query(Attendance)\
+        .options(raiseload("*"))\
+        .filter(Attendance.child_id == child_id)
 
     # Apply date filters
     if start_date:
@@ -247,18 +265,26 @@ async def get_child_attendance_history(
     if end_date:
         query = query.filter(Attendance.attendance_date <= end_date)
 
-    # Apply pagination
-    offset = (page - 1) * page_size
-    records = query.order_by(Attendance.attendance_date.desc())\
-                   .offset(offset)\
-                   .limit(page_size)\
-                   .all()
+    sort_key = [Attendance.attendance_date, Attendance.id]
+
+    # Legacy offset pagination for clients that still send ?page=
+    if page is not None:
+        return offset_page(query, sort_key, page, page_size)
+
+    # Apply keyset pagination
+    records = keyset_paginate(
+        query,
+        sort_key,
+        cursor,
+        page_size,
+        response
+    )
 
     return records
 
 
 @router.get("/{attendance_id}", response_model=AttendanceResponse)
-async def get_attendance_record(
+def get_attendance_record(
     attendance_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -266,7 +292,7 @@ async def get_attendance_record(
     """
     Get a specific attendance record by ID.
     """
-    attendance = db.query(Attendance).filter(Attendance.id == attendance_id).first()
+    attendance = db.get(Attendance, attendance_id)
 
     if not attendance:
         raise HTTPException(
@@ -278,7 +304,7 @@ async def get_attendance_record(
 
 
 @router.delete("/{attendance_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_attendance_record(
+def delete_attendance_record(
     attendance_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -294,7 +320,7 @@ async def delete_attendance_record(
             detail="Only administrators can delete attendance records"
         )
 
-    attendance = db.query(Attendance).filter(Attendance.id == attendance_id).first()
+    attendance = db.get(Attendance, attendance_id)
 
     if not attendance:
         raise HTTPException(
@@ -304,12 +330,13 @@ async def delete_attendance_record(
 
     db.delete(attendance)
     db.commit()
+    cache.delete_pattern("attendance:*")
 
     return None
 
 
-@router.get("/late-pickups/", response_model=List[AttendanceResponse])
-async def get_late_pickups(
+@router.get("/late-pickups/", response_model=None, response_class=StreamingResponse)
+def get_late_pickups(
     start_date: Optional[date] = Query(None, description="Start date"),
     end_date: Optional[date] = Query(None, description="End date"),
     db: Session = Depends(get_db),
@@ -318,8 +345,37 @@ async def get_late_pickups(
     """
     Get all late pickup incidents.
     Useful for billing and compliance tracking.
+    Streamed as a JSON array so wide date ranges use constant memory.
+    """
+    return json_array_response(
+        db,
+        lambda session: _late_pickups_query(session, start_date, end_date),
+        lambda row: row._asdict()
+    )
+
+
+@router.get("/late-pickups/export", response_model=None, response_class=StreamingResponse)
+def export_late_pickups(
+    start_date: Optional[date] = Query(None, description="Start date"),
+    end_date: Optional[date] = Query(None, description="End date"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
     """
-    query = db.query(Attendance).filter(Attendance.is_late_pickup == True)
+    Stream late pickup incidents as NDJSON (one object per line).
+    Same records as /late-pickups/, for full billing exports.
+    """
+    return ndjson_response(
+        db,
+        lambda session: _late_pickups_query(session, start_date, end_date),
+        lambda row: row._asdict()
+    )
+
+
+def _late_pickups_query(db: Session, start_date: Optional[date], end_date: Optional[date]):
+    """Late pickup records in AttendanceResponse shape, most recent first"""
+    query = db.query(*ATTENDANCE_RESPONSE_COLUMNS)\
+        .filter(Attendance.late_pickup_minutes > 0)
 
     # Apply date filters
     if start_date:
@@ -327,6 +383,4 @@ async def get_late_pickups(
     if end_date:
         query = query.filter(Attendance.attendance_date <= end_date)
 
-    records = query.order_by(Attendance.attendance_date.desc()).all()
-
-    return records
+    return query.order_by(Attendance.attendance_date.desc())
@@ -1,10 +1,11 @@
 # Authorized Pickup Management Endpoints
 # ============================================
 
-from typing import List, Optional
+from typing import List, Literal, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.orm import Session
+from sqlalchemy import func, update
 
 from app.database import get_db
 from app.models.child import AuthorizedPickup, Child
@@ -13,14 +14,30 @@ from app.schemas.child import (
     AuthorizedPickupCreate,
     AuthorizedPickupUpdate,
     AuthorizedPickupResponse,
+    VerifyPickupResponse,
 )
 from app.core.security import get_current_user
+from app.core.pagination import keyset_paginate, offset_page
+from app.core.cache import cache
+from app.dependencies import child_exists
 
 router = APIRouter()
 
+# Verification results are reused for repeat lookups during the pickup rush
+VERIFY_CACHE_TTL = 60
+
+
+def _verify_cache_key(child_id: UUID, pickup_name: str) -> str:
+    return f"pickup-verify:{child_id}:{pickup_name.lower()}"
+
+
+def _invalidate_verify_cache(child_id: UUID) -> None:
+    """Drop cached verification results for a child after its pickup list changes"""
+    cache.delete_pattern(f"pickup-verify:{child_id}:*")
+
 
 @router.post("/", response_model=AuthorizedPickupResponse, status_code=status.HTTP_201_CREATED)
-async def create_authorized_pickup(
+def create_authorized_pickup(
     pickup_data: AuthorizedPickupCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -30,8 +47,7 @@ async def create_authorized_pickup(
     Includes photo verification capability for enhanced security.
     """
     # Verify child exists
-    child = db.query(Child).filter(Child.id == pickup_data.child_id).first()
-    if not child:
+    if not child_exists(db, pickup_data.child_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Child with ID {pickup_data.child_id} not found"
@@ -42,12 +58,13 @@ async def create_authorized_pickup(
     db.add(new_pickup)
     db.commit()
     db.refresh(new_pickup)
+    _invalidate_verify_cache(new_pickup.child_id)
 
     return new_pickup
 
 
 @router.get("/child/{child_id}", response_model=List[AuthorizedPickupResponse])
-async def get_child_authorized_pickups(
+def get_child_authorized_pickups(
     child_id: UUID,
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     db: Session = Depends(get_db),
@@ -58,8 +75,7 @@ async def get_child_authorized_pickups(
     Optionally filter by active status.
     """
     # Verify child exists
-    child = db.query(Child).filter(Child.id == child_id).first()
-    if not child:
+    if not child_exists(db, child_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Child with ID {child_id} not found"
@@ -76,8 +92,10 @@ async def get_child_authorized_pickups(
 
 
 @router.get("/active", response_model=List[AuthorizedPickupResponse])
-async def get_all_active_authorized_pickups(
-    page: int = Query(1, ge=1),
+def get_all_active_authorized_pickups(
+    response: Response,
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    page: Optional[int] = Query(None, ge=1, description="Page number (legacy offset pagination)"),
     page_size: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -86,20 +104,29 @@ async def get_all_active_authorized_pickups(
     Get all active authorized pickup persons across all children.
     Useful for quick lookup during pickup time.
     """
-    offset = (page - 1) * page_size
+    query = db.query(AuthorizedPickup).filter(AuthorizedPickup.is_active == True)
 
-    pickups = db.query(AuthorizedPickup)\
-        .filter(AuthorizedPickup.is_active == True)\
-        .order_by(AuthorizedPickup.name)\
-        .offset(offset)\
-        .limit(page_size)\
-        .all()
+    sort_key = [AuthorizedPickup.name, AuthorizedPickup.id]
+
+    # Legacy offset pagination for clients that still send ?page=
+    if page is not None:
+        return offset_page(query, sort_key, page, page_size, descending=False)
+
+    # Apply keyset pagination
+    pickups = keyset_paginate(
+        query,
+        sort_key,
+        cursor,
+        page_size,
+        response,
+        descending=False
+    )
 
     return pickups
 
 
 @router.get("/{pickup_id}", response_model=AuthorizedPickupResponse)
-async def get_authorized_pickup(
+def get_authorized_pickup(
     pickup_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -107,7 +134,7 @@ async def get_authorized_pickup(
     """
     Get a specific authorized pickup person by ID.
     """
-    pickup = db.query(AuthorizedPickup).filter(AuthorizedPickup.id == pickup_id).first()
+    pickup = db.get(AuthorizedPickup, pickup_id)
 
     if not pickup:
         raise HTTPException(
@@ -119,7 +146,7 @@ async def get_authorized_pickup(
 
 
 @router.put("/{pickup_id}", response_model=AuthorizedPickupResponse)
-async def update_authorized_pickup(
+def update_authorized_pickup(
     pickup_id: UUID,
     pickup_data: AuthorizedPickupUpdate,
     db: Session = Depends(get_db),
@@ -129,7 +156,17 @@ async def update_authorized_pickup(
     Update an authorized pickup person's information.
     Can update contact info, photo, password requirements, etc.
     """
-    pickup = db.query(AuthorizedPickup).filter(AuthorizedPickup.id == pickup_id).first()
+    # Update only provided fields in a single UPDATE ... RETURNING
+    update_data = pickup_data.model_dump(exclude_unset=True)
+    if update_data:
+        pickup = db.execute(
+            update(AuthorizedPickup)
+            .where(AuthorizedPickup.id == pickup_id)
+            .values(**update_data)
+            .returning(AuthorizedPickup)
+        ).scalar_one_or_none()
+    else:
+        pickup = db.get(AuthorizedPickup, pickup_id)
 
     if not pickup:
         raise HTTPException(
@@ -137,19 +174,14 @@ async def update_authorized_pickup(
             detail=f"Authorized pickup with ID {pickup_id} not found"
         )
 
-    # Update only provided fields
-    update_data = pickup_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(pickup, field, value)
-
     db.commit()
-    db.refresh(pickup)
+    _invalidate_verify_cache(pickup.child_id)
 
     return pickup
 
 
 @router.patch("/{pickup_id}/deactivate", response_model=AuthorizedPickupResponse)
-async def deactivate_authorized_pickup(
+def deactivate_authorized_pickup(
     pickup_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -158,7 +190,7 @@ async def deactivate_authorized_pickup(
     Deactivate an authorized pickup person (soft delete).
     Recommended over hard delete for audit trail.
     """
-    pickup = db.query(AuthorizedPickup).filter(AuthorizedPickup.id == pickup_id).first()
+    pickup = db.get(AuthorizedPickup, pickup_id)
 
     if not pickup:
         raise HTTPException(
@@ -169,12 +201,13 @@ async def deactivate_authorized_pickup(
     pickup.is_active = False
     db.commit()
     db.refresh(pickup)
+    _invalidate_verify_cache(pickup.child_id)
 
     return pickup
 
 
 @router.patch("/{pickup_id}/activate", response_model=AuthorizedPickupResponse)
-async def activate_authorized_pickup(
+def activate_authorized_pickup(
     pickup_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -182,7 +215,7 @@ async def activate_authorized_pickup(
     """
     Reactivate an authorized pickup person.
     """
-    pickup = db.query(AuthorizedPickup).filter(AuthorizedPickup.id == pickup_id).first()
+    pickup = db.get(AuthorizedPickup, pickup_id)
 
     if not pickup:
         raise HTTPException(
@@ -193,12 +226,13 @@ async def activate_authorized_pickup(
     pickup.is_active = True
     db.commit()
     db.refresh(pickup)
+    _invalidate_verify_cache(pickup.child_id)
 
     return pickup
 
 
 @router.delete("/{pickup_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_authorized_pickup(
+def delete_authorized_pickup(
     pickup_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -214,7 +248,7 @@ async def delete_authorized_pickup(
             detail="Only administrators can permanently delete authorized pickup persons"
         )
 
-    pickup = db.query(AuthorizedPickup).filter(AuthorizedPickup.id == pickup_id).first()
+    pickup = db.get(AuthorizedPickup, pickup_id)
 
     if not pickup:
         raise HTTPException(
@@ -222,28 +256,41 @@ async def delete_authorized_pickup(
             detail=f"Authorized pickup with ID {pickup_id} not found"
         )
 
+    child_id = pickup.child_id
     db.delete(pickup)
     db.commit()
+    _invalidate_verify_cache(child_id)
 
     return None
 
 
 @router.get("/search/by-name", response_model=List[AuthorizedPickupResponse])
-async def search_authorized_pickups_by_name(
+def search_authorized_pickups_by_name(
     name: str = Query(..., min_length=2, description="Search by name (minimum 2 characters)"),
     is_active: bool = Query(True, description="Filter by active status"),
+    mode: Literal["contains", "prefix"] = Query(
+        "contains", description="Match anywhere in the name, or only at the start"
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Search authorized pickup persons by name.
     Useful during pickup time to quickly find and verify authorization.
+
+    Prefix mode matches the start of the name only, which can use the
+    lower(name) pattern index; contains mode uses the trigram index.
     """
-    search_filter = f"%{name}%"
+    if mode == "prefix":
+        # Escape LIKE wildcards so the input is matched literally
+        prefix = name.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        name_filter = func.lower(AuthorizedPickup.name).like(f"{prefix}%", escape="\\")
+    else:
+        name_filter = AuthorizedPickup.name.ilike(f"%{name}%")
 
     pickups = db.query(AuthorizedPickup)\
         .filter(
-            AuthorizedPickup.name.ilike(search_filter),
+            name_filter,
             AuthorizedPickup.is_active == is_active
         )\
         .order_by(AuthorizedPickup.name)\
@@ -252,8 +299,12 @@ async def search_authorized_pickups_by_name(
     return pickups
 
 
-@router.get("/verify/{child_id}/{pickup_name}")
-async def verify_pickup_authorization(
+@router.get(
+    "/verify/{child_id}/{pickup_name}",
+    response_model=VerifyPickupResponse,
+    response_model_exclude_unset=True
+)
+def verify_pickup_authorization(
     child_id: UUID,
     pickup_name: str,
     db: Session = Depends(get_db),
@@ -264,9 +315,20 @@ async def verify_pickup_authorization(
     Returns authorization details including photo, password requirements, etc.
 
     Use this endpoint during pickup to quickly verify authorization.
+    Results are cached briefly per child and name.
     """
+    cache_key = _verify_cache_key(child_id, pickup_name)
+    hit = cache.get(cache_key)
+    if hit is not None:
+        # The key is case-insensitive; echo the name as this caller sent it
+        if "pickup_name" in hit:
+            hit["pickup_name"] = pickup_name
+        return hit
+
     # Verify child exists
-    child = db.query(Child).filter(Child.id == child_id).first()
+    child = db.query(Child.first_name, Child.last_name)\
+        .filter(Child.id == child_id)\
+        .first()
     if not child:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -284,34 +346,29 @@ async def verify_pickup_authorization(
         .first()
 
     if not pickup:
-        return {
-            "authorized": False,
-            "child_id": str(child_id),
-            "child_name": f"{child.first_name} {child.last_name}",
-            "pickup_name": pickup_name,
-            "message": "This person is NOT authorized to pick up this child"
-        }
-
-    return {
-        "authorized": True,
-        "child_id": str(child_id),
-        "child_name": f"{child.first_name} {child.last_name}",
-        "pickup_person": {
-            "id": str(pickup.id),
-            "name": pickup.name,
-            "relationship_type": pickup.relationship_type,
-            "phone": pickup.phone,
-            "photo_url": pickup.photo_url,
-            "requires_password": pickup.requires_password,
-            "password_hint": pickup.password_hint if pickup.requires_password else None,
-            "identification_notes": pickup.identification_notes
-        },
-        "message": "This person IS authorized to pick up this child"
-    }
+        result = VerifyPickupResponse(
+            authorized=False,
+            child_id=child_id,
+            child_name=f"{child.first_name} {child.last_name}",
+            pickup_name=pickup_name,
+            message="This person is NOT authorized to pick up this child"
+        )
+    else:
+        result = VerifyPickupResponse(
+            authorized=True,
+            child_id=child_id,
+            child_name=f"{child.first_name} {child.last_name}",
+            pickup_person=pickup,
+            message="This person IS authorized to pick up this child"
+        )
+
+    # Cache only the fields that were set, matching the response shape
+    cache.set(cache_key, result.model_dump(mode="json", exclude_unset=True), VERIFY_CACHE_TTL)
+    return result
 
 
 @router.get("/photo-verification-required", response_model=List[AuthorizedPickupResponse])
-async def get_pickups_requiring_photo_verification(
+def get_pickups_requiring_photo_verification(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -5,7 +5,7 @@ from typing import List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import func, literal_column, or_, update
 
 from app.database import get_db
 from app.models.child import Child
@@ -17,12 +17,15 @@ from app.schemas.child import (
     ChildListResponse,
 )
 from app.core.security import get_current_user
+from app.core.pagination import keyset_page, require_offset_pagination
+from app.core.cache import cache
+from app.dependencies import invalidate_child_cache
 
 router = APIRouter()
 
 
 @router.post("/", response_model=ChildResponse, status_code=status.HTTP_201_CREATED)
-async def create_child(
+def create_child(
     child_data: ChildCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -39,15 +42,20 @@ async def create_child(
     db.add(new_child)
     db.commit()
     db.refresh(new_child)
+    invalidate_child_cache(new_child.id)
+    # A new child has no contacts yet, so belongs on the missing-contacts report
+    cache.delete_pattern("emergency-contacts:*")
 
     return new_child
 
 
 @router.get("/", response_model=ChildListResponse)
-async def get_children(
-    page: int = Query(1, ge=1, description="Page number"),
+def get_children(
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    page: Optional[int] = Query(None, ge=1, description="Page number (legacy offset pagination)"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     search: Optional[str] = Query(None, description="Search by name"),
+    full_name: Optional[str] = Query(None, description="Search by full name, e.g. \"Emma Johnson\""),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -68,29 +76,63 @@ async def get_children(
             )
         )
 
+    if full_name:
+        # Mirrors the idx_children_full_name_trgm expression (with the separator
+        # inlined rather than bound) so the planner can match the index
+        query = query.filter(
+            func.lower(Child.first_name + literal_column("' '") + Child.last_name)
+                .like(f"%{full_name.lower()}%")
+        )
+
     if is_active is not None:
         query = query.filter(Child.is_active == is_active)
 
-    # Get total count
-    total = query.count()
-
-    # Apply pagination
-    offset = (page - 1) * page_size
-    children = query.order_by(Child.last_name, Child.first_name)\
+    # Legacy offset pagination for clients that still send ?page=
+    if page is not None:
+        require_offset_pagination()
+        offset = (page - 1) * page_size
+        # COUNT(*) OVER () returns the total alongside the page in one query
+        rows = query.add_columns(func.count().over().label("total"))\
+                    .order_by(Child.last_name, Child.first_name, Child.id)\
                     .offset(offset)\
                     .limit(page_size)\
                     .all()
 
+        if rows:
+            total = rows[0].total
+        else:
+            # Past the last page no row carries the total
+            total = query.count() if offset else 0
+
+        return {
+            "children": [row[0] for row in rows],
+            "total": total,
+            "page": page,
+            "page_size": page_size
+        }
+
+    # Get total count
+    total = query.count()
+
+    # Apply keyset pagination
+    children, next_cursor = keyset_page(
+        query,
+        [Child.last_name, Child.first_name, Child.id],
+        cursor,
+        page_size,
+        descending=False
+    )
+
     return {
         "children": children,
         "total": total,
-        "page": page,
-        "page_size": page_size
+        "page_size": page_size,
+        "next_cursor": next_cursor
     }
 
 
 @router.get("/{child_id}", response_model=ChildResponse)
-async def get_child(
+def get_child(
     child_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -98,7 +140,7 @@ async def get_child(
     """
     Get a specific child by ID.
     """
-    child = db.query(Child).filter(Child.id == child_id).first()
+    child = db.get(Child, child_id)
 
     if not child:
         raise HTTPException(
@@ -110,7 +152,7 @@ async def get_child(
 
 
 @router.put("/{child_id}", response_model=ChildResponse)
-async def update_child(
+def update_child(
     child_id: UUID,
     child_data: ChildUpdate,
     db: Session = Depends(get_db),
@@ -120,7 +162,17 @@ async def update_child(
     Update a child's information.
     Only updates fields that are provided.
     """
-    child = db.query(Child).filter(Child.id == child_id).first()
+    # Update only provided fields in a single UPDATE ... RETURNING
+    update_data = child_data.model_dump(exclude_unset=True)
+    if update_data:
+        child = db.execute(
+            update(Child)
+            .where(Child.id == child_id)
+            .values(**update_data)
+            .returning(Child)
+        ).scalar_one_or_none()
+    else:
+        child = db.get(Child, child_id)
 
     if not child:
         raise HTTPException(
@@ -128,19 +180,17 @@ async def update_child(
             detail=f"Child with ID {child_id} not found"
         )
 
-    # Update only provided fields
-    update_data = child_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(child, field, value)
-
     db.commit()
-    db.refresh(child)
+    invalidate_child_cache(child_id)
+    cache.delete_pattern(f"pickup-verify:{child_id}:*")
+    # Names and active status appear in the missing-contacts report
+    cache.delete_pattern("emergency-contacts:*")
 
     return child
 
 
 @router.delete("/{child_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_child(
+def delete_child(
     child_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -156,7 +206,7 @@ async def delete_child(
             detail="Only administrators can delete child profiles"
         )
 
-    child = db.query(Child).filter(Child.id == child_id).first()
+    child = db.get(Child, child_id)
 
     if not child:
         raise HTTPException(
@@ -166,12 +216,15 @@ async def delete_child(
 
     db.delete(child)
     db.commit()
+    invalidate_child_cache(child_id)
+    cache.delete_pattern(f"pickup-verify:{child_id}:*")
+    cache.delete_pattern("emergency-contacts:*")
 
     return None
 
 
 @router.patch("/{child_id}/deactivate", response_model=ChildResponse)
-async def deactivate_child(
+def deactivate_child(
     child_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -180,7 +233,7 @@ async def deactivate_child(
     Deactivate a child (soft delete).
     Recommended over hard delete for record keeping.
     """
-    child = db.query(Child).filter(Child.id == child_id).first()
+    child = db.get(Child, child_id)
 
     if not child:
         raise HTTPException(
@@ -191,12 +244,15 @@ async def deactivate_child(
     child.is_active = False
     db.commit()
     db.refresh(child)
+    invalidate_child_cache(child_id)
+    # Only active children are listed on the missing-contacts report
+    cache.delete_pattern("emergency-contacts:*")
 
     return child
 
 
 @router.patch("/{child_id}/activate", response_model=ChildResponse)
-async def activate_child(
+def activate_child(
     child_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -204,7 +260,7 @@ async def activate_child(
     """
     Reactivate a child.
     """
-    child = db.query(Child).filter(Child.id == child_id).first()
+    child = db.get(Child, child_id)
 
     if not child:
         raise HTTPException(
@@ -215,5 +271,6 @@ async def activate_child(
     child.is_active = True
     db.commit()
     db.refresh(child)
+    cache.delete_pattern("emergency-contacts:*")
 
     return child
@@ -6,7 +6,9 @@ from datetime import date
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import case, insert, update
+from sqlalchemy.exc import IntegrityError
 
 from app.database import get_db
 from app.models.compliance import EnrollmentForm, ImmunizationRecord, StaffCredential
@@ -17,23 +19,43 @@ from app.schemas.compliance import (
     EnrollmentFormUpdate,
     EnrollmentFormResponse,
     ImmunizationRecordCreate,
+    ImmunizationRecordBulkCreate,
     ImmunizationRecordUpdate,
     ImmunizationRecordResponse,
     StaffCredentialCreate,
+    StaffCredentialBulkCreate,
     StaffCredentialUpdate,
     StaffCredentialResponse,
 )
-from app.core.security import get_current_user
+from app.core.security import get_current_user, require_admin
+from app.core.cache import cache, cached
+from app.core.sql import days_between
+from app.core.streaming import ndjson_response
+from app.dependencies import child_exists, user_exists
 
 router = APIRouter()
 
+# Staff credential types recognised for DCFS compliance
+CREDENTIAL_TYPES = (
+    'CPR', 'First Aid', 'Background Check', 'TB Test', 'DCFS Training',
+    'Fingerprinting', 'Mandated Reporter'
+)
+VALID_CREDENTIAL_TYPES = frozenset(CREDENTIAL_TYPES)
+INVALID_CREDENTIAL_TYPE_DETAIL = f"Invalid credential type. Must be one of: {', '.join(CREDENTIAL_TYPES)}"
+
+# Credential reports are polled by the compliance dashboard; expiring-soon
+# shifts as credentials are renewed so it gets the shorter TTL
+CREDENTIALS_SHORT_TTL = 30
+CREDENTIALS_TTL = 120
+CREDENTIALS_STALE_TTL = 3600
+
 
 # ============================================
 # ENROLLMENT FORMS (DCFS Form 602)
 # ============================================
 
 @router.post("/enrollment-forms/", response_model=EnrollmentFormResponse, status_code=status.HTTP_201_CREATED)
-async def create_enrollment_form(
+def create_enrollment_form(
     form_data: EnrollmentFormCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -42,39 +64,36 @@ async def create_enrollment_form(
     Create DCFS Form 602 - Child Enrollment Record.
     One form per child, contains all enrollment information.
     """
-    # Verify child exists
-    child = db.query(Child).filter(Child.id == form_data.child_id).first()
-    if not child:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Child with ID {form_data.child_id} not found"
-        )
-
-    # Check if enrollment form already exists for this child
-    existing = db.query(EnrollmentForm)\
-        .filter(EnrollmentForm.child_id == form_data.child_id)\
-        .first()
-
-    if existing:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Enrollment form already exists for this child (ID: {existing.id})"
-        )
-
     new_form = EnrollmentForm(
         **form_data.model_dump(),
         completed_by=current_user.id if form_data.is_complete else None
     )
 
+    # child_id is unique and a foreign key, so the insert enforces both checks
     db.add(new_form)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        if not child_exists(db, form_data.child_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Child with ID {form_data.child_id} not found"
+            )
+        existing_id = db.query(EnrollmentForm.id)\
+            .filter(EnrollmentForm.child_id == form_data.child_id)\
+            .scalar()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Enrollment form already exists for this child (ID: {existing_id})"
+        )
     db.refresh(new_form)
 
     return new_form
 
 
 @router.get("/enrollment-forms/", response_model=List[EnrollmentFormResponse])
-async def get_enrollment_forms(
+def get_enrollment_forms(
     is_complete: Optional[bool] = Query(None, description="Filter by completion status"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
@@ -84,7 +103,8 @@ async def get_enrollment_forms(
     """
     Get all enrollment forms with optional filtering.
     """
-    query = db.query(EnrollmentForm)
+    # Responses carry no relationships; fail fast if serialization ever lazy-loads one
+    query = db.query(EnrollmentForm).options(raiseload("*"))
 
     if is_complete is not None:
         query = query.filter(EnrollmentForm.is_complete == is_complete)
@@ -99,7 +119,7 @@ async def get_enrollment_forms(
 
 
 @router.get("/enrollment-forms/child/{child_id}", response_model=EnrollmentFormResponse)
-async def get_child_enrollment_form(
+def get_child_enrollment_form(
     child_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -108,8 +128,7 @@ async def get_child_enrollment_form(
     Get enrollment form for a specific child.
     """
     # Verify child exists
-    child = db.query(Child).filter(Child.id == child_id).first()
-    if not child:
+    if not child_exists(db, child_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Child with ID {child_id} not found"
@@ -128,8 +147,25 @@ async def get_child_enrollment_form(
     return form
 
 
+@router.get("/enrollment-forms/child/{child_id}/exists")
+def check_child_enrollment_form_exists(
+    child_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Check whether a child has an enrollment form without loading it.
+    UIs should call this before fetching the full form for edit screens.
+    """
+    exists = db.query(
+        db.query(EnrollmentForm.id).filter(EnrollmentForm.child_id == child_id).exists()
+    ).scalar()
+
+    return {"exists": exists}
+
+
 @router.get("/enrollment-forms/{form_id}", response_model=EnrollmentFormResponse)
-async def get_enrollment_form(
+def get_enrollment_form(
     form_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -137,7 +173,7 @@ async def get_enrollment_form(
     """
     Get a specific enrollment form by ID.
     """
-    form = db.query(EnrollmentForm).filter(EnrollmentForm.id == form_id).first()
+    form = db.get(EnrollmentForm, form_id)
 
     if not form:
         raise HTTPException(
@@ -149,7 +185,7 @@ async def get_enrollment_form(
 
 
 @router.put("/enrollment-forms/{form_id}", response_model=EnrollmentFormResponse)
-async def update_enrollment_form(
+def update_enrollment_form(
     form_id: UUID,
     form_data: EnrollmentFormUpdate,
     db: Session = Depends(get_db),
@@ -158,7 +194,25 @@ async def update_enrollment_form(
     """
     Update an enrollment form.
     """
-    form = db.query(EnrollmentForm).filter(EnrollmentForm.id == form_id).first()
+    # Update only provided fields in a single UPDATE ... RETURNING
+    update_data = form_data.model_dump(exclude_unset=True)
+
+    # If marking as complete, set completed_by (SET sees the pre-update row)
+    if update_data.get('is_complete'):
+        update_data['completed_by'] = case(
+            (EnrollmentForm.is_complete == False, current_user.id),
+            else_=EnrollmentForm.completed_by
+        )
+
+    if update_data:
+        form = db.execute(
+            update(EnrollmentForm)
+            .where(EnrollmentForm.id == form_id)
+            .values(**update_data)
+            .returning(EnrollmentForm)
+        ).scalar_one_or_none()
+    else:
+        form = db.get(EnrollmentForm, form_id)
 
     if not form:
         raise HTTPException(
@@ -166,24 +220,13 @@ async def update_enrollment_form(
             detail=f"Enrollment form with ID {form_id} not found"
         )
 
-    # Update only provided fields
-    update_data = form_data.model_dump(exclude_unset=True)
-
-    # If marking as complete, set completed_by
-    if 'is_complete' in update_data and update_data['is_complete'] and not form.is_complete:
-        form.completed_by = current_user.id
-
-    for field, value in update_data.items():
-        setattr(form, field, value)
-
     db.commit()
-    db.refresh(form)
 
     return form
 
 
-@router.get("/enrollment-forms/incomplete/list", response_model=List[dict])
-async def get_incomplete_enrollment_forms(
+@router.get("/enrollment-forms/incomplete/list")
+def get_incomplete_enrollment_forms(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -191,22 +234,30 @@ async def get_incomplete_enrollment_forms(
     Get list of children with incomplete enrollment forms.
     Used for DCFS compliance tracking.
     """
-    forms = db.query(EnrollmentForm)\
+    # Select only the columns the response needs; child names come from the join
+    rows = db.query(
+            EnrollmentForm.id,
+            EnrollmentForm.child_id,
+            EnrollmentForm.enrollment_date,
+            EnrollmentForm.parent_signature_url.isnot(None).label("has_parent_signature"),
+            EnrollmentForm.staff_signature_url.isnot(None).label("has_staff_signature"),
+            Child.first_name,
+            Child.last_name
+        )\
+        .join(Child, Child.id == EnrollmentForm.child_id)\
         .filter(EnrollmentForm.is_complete == False)\
         .all()
 
     incomplete_list = []
-    for form in forms:
-        child = db.query(Child).filter(Child.id == form.child_id).first()
-        if child:
-            incomplete_list.append({
-                "form_id": str(form.id),
-                "child_id": str(child.id),
-                "child_name": f"{child.first_name} {child.last_name}",
-                "enrollment_date": form.enrollment_date.isoformat(),
-                "has_parent_signature": form.parent_signature_url is not None,
-                "has_staff_signature": form.staff_signature_url is not None
-            })
+    for row in rows:
+        incomplete_list.append({
+            "form_id": str(row.id),
+            "child_id": str(row.child_id),
+            "child_name": f"{row.first_name} {row.last_name}",
+            "enrollment_date": row.enrollment_date.isoformat(),
+            "has_parent_signature": row.has_parent_signature,
+            "has_staff_signature": row.has_staff_signature
+        })
 
     return incomplete_list
 
@@ -216,7 +267,7 @@ async def get_incomplete_enrollment_forms(
 # ============================================
 
 @router.post("/immunizations/", response_model=ImmunizationRecordResponse, status_code=status.HTTP_201_CREATED)
-async def create_immunization_record(
+def create_immunization_record(
     record_data: ImmunizationRecordCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -225,8 +276,7 @@ async def create_immunization_record(
     Add an immunization record for a child.
     """
     # Verify child exists
-    child = db.query(Child).filter(Child.id == record_data.child_id).first()
-    if not child:
+    if not child_exists(db, record_data.child_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Child with ID {record_data.child_id} not found"
@@ -241,8 +291,42 @@ async def create_immunization_record(
     return new_record
 
 
+@router.post("/immunizations/bulk", response_model=List[ImmunizationRecordResponse], status_code=status.HTTP_201_CREATED)
+def create_immunization_records_bulk(
+    bulk_data: ImmunizationRecordBulkCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Add several immunization records in one request (e.g. backfills).
+    All records are inserted in a single transaction, or none are.
+    """
+    # Verify every child exists with one query
+    child_ids = {record.child_id for record in bulk_data.records}
+    found_ids = {
+        row.id for row in db.query(Child.id).filter(Child.id.in_(child_ids)).all()
+    }
+    missing_ids = child_ids - found_ids
+    if missing_ids:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Children not found: {', '.join(sorted(str(i) for i in missing_ids))}"
+        )
+
+    # Multi-row INSERT ... RETURNING instead of one round trip per record;
+    # rows come back in request order
+    new_records = db.scalars(
+        insert(ImmunizationRecord).returning(ImmunizationRecord, sort_by_parameter_order=True),
+        [record.model_dump() for record in bulk_data.records]
+    ).all()
+
+    db.commit()
+
+    return new_records
+
+
 @router.get("/immunizations/child/{child_id}", response_model=List[ImmunizationRecordResponse])
-async def get_child_immunizations(
+def get_child_immunizations(
     child_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -251,14 +335,14 @@ async def get_child_immunizations(
     Get all immunization records for a specific child.
     """
     # Verify child exists
-    child = db.query(Child).filter(Child.id == child_id).first()
-    if not child:
+    if not child_exists(db, child_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Child with ID {child_id} not found"
         )
 
     records = db.query(ImmunizationRecord)\
+        .options(raiseload("*"))\
         .filter(ImmunizationRecord.child_id == child_id)\
         .order_by(ImmunizationRecord.administration_date.desc())\
         .all()
@@ -267,7 +351,7 @@ async def get_child_immunizations(
 
 
 @router.get("/immunizations/{record_id}", response_model=ImmunizationRecordResponse)
-async def get_immunization_record(
+def get_immunization_record(
     record_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -275,7 +359,7 @@ async def get_immunization_record(
     """
     Get a specific immunization record by ID.
     """
-    record = db.query(ImmunizationRecord).filter(ImmunizationRecord.id == record_id).first()
+    record = db.get(ImmunizationRecord, record_id)
 
     if not record:
         raise HTTPException(
@@ -287,7 +371,7 @@ async def get_immunization_record(
 
 
 @router.put("/immunizations/{record_id}", response_model=ImmunizationRecordResponse)
-async def update_immunization_record(
+def update_immunization_record(
     record_id: UUID,
     record_data: ImmunizationRecordUpdate,
     db: Session = Depends(get_db),
@@ -296,7 +380,17 @@ async def update_immunization_record(
     """
     Update an immunization record.
     """
-    record = db.query(ImmunizationRecord).filter(ImmunizationRecord.id == record_id).first()
+    # Update only provided fields in a single UPDATE ... RETURNING
+    update_data = record_data.model_dump(exclude_unset=True)
+    if update_data:
+        record = db.execute(
+            update(ImmunizationRecord)
+            .where(ImmunizationRecord.id == record_id)
+            .values(**update_data)
+            .returning(ImmunizationRecord)
+        ).scalar_one_or_none()
+    else:
+        record = db.get(ImmunizationRecord, record_id)
 
     if not record:
         raise HTTPException(
@@ -304,34 +398,22 @@ async def update_immunization_record(
             detail=f"Immunization record with ID {record_id} not found"
         )
 
-    # Update only provided fields
-    update_data = record_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(record, field, value)
-
     db.commit()
-    db.refresh(record)
 
     return record
 
 
 @router.delete("/immunizations/{record_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_immunization_record(
+def delete_immunization_record(
     record_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(require_admin)
 ):
     """
     Delete an immunization record.
     Only admins can delete for compliance reasons.
     """
-    if current_user.role != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only administrators can delete immunization records"
-        )
-
-    record = db.query(ImmunizationRecord).filter(ImmunizationRecord.id == record_id).first()
+    record = db.get(ImmunizationRecord, record_id)
 
     if not record:
         raise HTTPException(
@@ -345,8 +427,8 @@ async def delete_immunization_record(
     return None
 
 
-@router.get("/immunizations/expiring/soon", response_model=List[dict])
-async def get_expiring_immunizations(
+@router.get("/immunizations/expiring/soon")
+def get_expiring_immunizations(
     days: int = Query(30, ge=1, le=365, description="Number of days ahead to check"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -359,7 +441,17 @@ async def get_expiring_immunizations(
 
     cutoff_date = date.today() + timedelta(days=days)
 
-    records = db.query(ImmunizationRecord)\
+    # Select only the columns the response needs; child names come from the join
+    rows = db.query(
+            ImmunizationRecord.id,
+            ImmunizationRecord.child_id,
+            ImmunizationRecord.vaccine_name,
+            ImmunizationRecord.expiration_date,
+            ImmunizationRecord.is_verified,
+            Child.first_name,
+            Child.last_name
+        )\
+        .join(Child, Child.id == ImmunizationRecord.child_id)\
         .filter(
             ImmunizationRecord.expiration_date.isnot(None),
             ImmunizationRecord.expiration_date <= cutoff_date,
@@ -369,19 +461,17 @@ async def get_expiring_immunizations(
         .all()
 
     expiring_list = []
-    for record in records:
-        child = db.query(Child).filter(Child.id == record.child_id).first()
-        if child:
-            days_until_expiration = (record.expiration_date - date.today()).days
-            expiring_list.append({
-                "record_id": str(record.id),
-                "child_id": str(child.id),
-                "child_name": f"{child.first_name} {child.last_name}",
-                "vaccine_name": record.vaccine_name,
-                "expiration_date": record.expiration_date.isoformat(),
-                "days_until_expiration": days_until_expiration,
-                "is_verified": record.is_verified
-            })
+    for row in rows:
+        days_until_expiration = (row.expiration_date - date.today()).days
+        expiring_list.append({
+            "record_id": str(row.id),
+            "child_id": str(row.child_id),
+            "child_name": f"{row.first_name} {row.last_name}",
+            "vaccine_name": row.vaccine_name,
+            "expiration_date": row.expiration_date.isoformat(),
+            "days_until_expiration": days_until_expiration,
+            "is_verified": row.is_verified
+        })
 
     return expiring_list
 
@@ -391,7 +481,7 @@ async def get_expiring_immunizations(
 # ============================================
 
 @router.post("/staff-credentials/", response_model=StaffCredentialResponse, status_code=status.HTTP_201_CREATED)
-async def create_staff_credential(
+def create_staff_credential(
     credential_data: StaffCredentialCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -400,41 +490,79 @@ async def create_staff_credential(
     Add a credential for a staff member.
     Required credentials: CPR, First Aid, Background Check, TB Test, DCFS Training
     """
+    # Validate credential type before touching the database
+    if credential_data.credential_type not in VALID_CREDENTIAL_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=INVALID_CREDENTIAL_TYPE_DETAIL
+        )
+
     # Verify user exists
-    user = db.query(User).filter(User.id == credential_data.user_id).first()
-    if not user:
+    if not user_exists(db, credential_data.user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User with ID {credential_data.user_id} not found"
         )
 
-    # Validate credential type
-    valid_types = ['CPR', 'First Aid', 'Background Check', 'TB Test', 'DCFS Training', 'Fingerprinting', 'Mandated Reporter']
-    if credential_data.credential_type not in valid_types:
+    # INSERT ... RETURNING loads the new row without a follow-up SELECT
+    new_credential = db.scalars(
+        insert(StaffCredential)
+        .values(**credential_data.model_dump())
+        .returning(StaffCredential)
+    ).one()
+
+    db.commit()
+    cache.delete_pattern("credentials:*")
+
+    return new_credential
+
+
+@router.post("/staff-credentials/bulk", response_model=List[StaffCredentialResponse], status_code=status.HTTP_201_CREATED)
+def create_staff_credentials_bulk(
+    bulk_data: StaffCredentialBulkCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Add several staff credentials in one request (e.g. onboarding imports).
+    All credentials are inserted in a single transaction, or none are.
+    """
+    invalid_types = {
+        credential.credential_type for credential in bulk_data.credentials
+    } - VALID_CREDENTIAL_TYPES
+    if invalid_types:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid credential type. Must be one of: {', '.join(valid_types)}"
+            detail=INVALID_CREDENTIAL_TYPE_DETAIL
         )
 
-    # Check if credential is expired
-    is_expired = False
-    if credential_data.expiration_date and credential_data.expiration_date < date.today():
-        is_expired = True
+    # Verify every user exists with one query
+    user_ids = {credential.user_id for credential in bulk_data.credentials}
+    found_ids = {
+        row.id for row in db.query(User.id).filter(User.id.in_(user_ids)).all()
+    }
+    missing_ids = user_ids - found_ids
+    if missing_ids:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Users not found: {', '.join(sorted(str(i) for i in missing_ids))}"
+        )
 
-    new_credential = StaffCredential(
-        **credential_data.model_dump(),
-        is_expired=is_expired
-    )
+    # Multi-row INSERT ... RETURNING instead of one round trip per credential;
+    # rows come back in request order
+    new_credentials = db.scalars(
+        insert(StaffCredential).returning(StaffCredential, sort_by_parameter_order=True),
+        [credential.model_dump() for credential in bulk_data.credentials]
+    ).all()
 
-    db.add(new_credential)
     db.commit()
-    db.refresh(new_credential)
+    cache.delete_pattern("credentials:*")
 
-    return new_credential
+    return new_credentials
 
 
 @router.get("/staff-credentials/user/{user_id}", response_model=List[StaffCredentialResponse])
-async def get_user_credentials(
+def get_user_credentials(
     user_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -443,14 +571,14 @@ async def get_user_credentials(
     Get all credentials for a specific staff member.
     """
     # Verify user exists
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    if not user_exists(db, user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User with ID {user_id} not found"
         )
 
     credentials = db.query(StaffCredential)\
+        .options(raiseload("*"))\
         .filter(StaffCredential.user_id == user_id)\
         .order_by(StaffCredential.expiration_date.asc().nullslast())\
         .all()
@@ -459,7 +587,7 @@ async def get_user_credentials(
 
 
 @router.get("/staff-credentials/{credential_id}", response_model=StaffCredentialResponse)
-async def get_staff_credential(
+def get_staff_credential(
     credential_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -467,7 +595,7 @@ async def get_staff_credential(
     """
     Get a specific staff credential by ID.
     """
-    credential = db.query(StaffCredential).filter(StaffCredential.id == credential_id).first()
+    credential = db.get(StaffCredential, credential_id)
 
     if not credential:
         raise HTTPException(
@@ -479,7 +607,7 @@ async def get_staff_credential(
 
 
 @router.put("/staff-credentials/{credential_id}", response_model=StaffCredentialResponse)
-async def update_staff_credential(
+def update_staff_credential(
     credential_id: UUID,
     credential_data: StaffCredentialUpdate,
     db: Session = Depends(get_db),
@@ -488,7 +616,7 @@ async def update_staff_credential(
     """
     Update a staff credential.
     """
-    credential = db.query(StaffCredential).filter(StaffCredential.id == credential_id).first()
+    credential = db.get(StaffCredential, credential_id)
 
     if not credential:
         raise HTTPException(
@@ -498,40 +626,27 @@ async def update_staff_credential(
 
     # Update only provided fields
     update_data = credential_data.model_dump(exclude_unset=True)
-
-    # Re-check expiration if expiration_date is updated
-    if 'expiration_date' in update_data:
-        if update_data['expiration_date'] and update_data['expiration_date'] < date.today():
-            credential.is_expired = True
-        else:
-            credential.is_expired = False
-
     for field, value in update_data.items():
         setattr(credential, field, value)
 
     db.commit()
     db.refresh(credential)
+    cache.delete_pattern("credentials:*")
 
     return credential
 
 
 @router.delete("/staff-credentials/{credential_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_staff_credential(
+def delete_staff_credential(
     credential_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(require_admin)
 ):
     """
     Delete a staff credential.
     Only admins can delete.
     """
-    if current_user.role != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only administrators can delete staff credentials"
-        )
-
-    credential = db.query(StaffCredential).filter(StaffCredential.id == credential_id).first()
+    credential = db.get(StaffCredential, credential_id)
 
     if not credential:
         raise HTTPException(
@@ -541,12 +656,14 @@ async def delete_staff_credential(
 
     db.delete(credential)
     db.commit()
+    cache.delete_pattern("credentials:*")
 
     return None
 
 
-@router.get("/staff-credentials/expiring/soon", response_model=List[dict])
-async def get_expiring_credentials(
+@router.get("/staff-credentials/expiring/soon")
+@cached(prefix="credentials", expire=CREDENTIALS_SHORT_TTL, stale_if_error=CREDENTIALS_STALE_TTL)
+def get_expiring_credentials(
     days: int = Query(30, ge=1, le=365, description="Number of days ahead to check"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -557,37 +674,43 @@ async def get_expiring_credentials(
     """
     from datetime import timedelta
 
-    cutoff_date = date.today() + timedelta(days=days)
-
-    credentials = db.query(StaffCredential)\
-        .filter(
-            StaffCredential.expiration_date.isnot(None),
-            StaffCredential.expiration_date <= cutoff_date,
-            StaffCredential.expiration_date >= date.today()
+    today = date.today()
+    cutoff_date = today + timedelta(days=days)
+
+    # Select only the columns the response needs; user names come from the join
+    rows = db.query(
+            StaffCredential.id,
+            StaffCredential.user_id,
+            StaffCredential.credential_type,
+            StaffCredential.expiration_date,
+            StaffCredential.is_verified,
+            User.first_name,
+            User.last_name,
+            days_between(today, StaffCredential.expiration_date).label("days_until_expiration")
         )\
+        .join(User, User.id == StaffCredential.user_id)\
+        .filter(StaffCredential.expiration_date.between(today, cutoff_date))\
         .order_by(StaffCredential.expiration_date)\
         .all()
 
     expiring_list = []
-    for credential in credentials:
-        user = db.query(User).filter(User.id == credential.user_id).first()
-        if user:
-            days_until_expiration = (credential.expiration_date - date.today()).days
-            expiring_list.append({
-                "credential_id": str(credential.id),
-                "user_id": str(user.id),
-                "user_name": f"{user.first_name} {user.last_name}",
-                "credential_type": credential.credential_type,
-                "expiration_date": credential.expiration_date.isoformat(),
-                "days_until_expiration": days_until_expiration,
-                "is_verified": credential.is_verified
-            })
+    for row in rows:
+        expiring_list.append({
+            "credential_id": str(row.id),
+            "user_id": str(row.user_id),
+            "user_name": f"{row.first_name} {row.last_name}",
+            "credential_type": row.credential_type,
+            "expiration_date": row.expiration_date.isoformat(),
+            "days_until_expiration": row.days_until_expiration,
+            "is_verified": row.is_verified
+        })
 
     return expiring_list
 
 
-@router.get("/staff-credentials/expired/list", response_model=List[dict])
-async def get_expired_credentials(
+@router.get("/staff-credentials/expired/list")
+@cached(prefix="credentials", expire=CREDENTIALS_TTL, stale_if_error=CREDENTIALS_STALE_TTL)
+def get_expired_credentials(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -595,23 +718,49 @@ async def get_expired_credentials(
     Get all expired staff credentials.
     CRITICAL for DCFS compliance - staff with expired credentials cannot work.
     """
-    credentials = db.query(StaffCredential)\
-        .filter(StaffCredential.is_expired == True)\
-        .order_by(StaffCredential.expiration_date.desc())\
-        .all()
+    rows = _expired_credentials_query(db).all()
+
+    return [_expired_credential_item(row) for row in rows]
+
 
-    expired_list = []
-    for credential in credentials:
-        user = db.query(User).filter(User.id == credential.user_id).first()
-        if user:
-            days_expired = (date.today() - credential.expiration_date).days if credential.expiration_date else 0
-            expired_list.append({
-                "credential_id": str(credential.id),
-                "user_id": str(user.id),
-                "user_name": f"{user.first_name} {user.last_name}",
-                "credential_type": credential.credential_type,
-                "expiration_date": credential.expiration_date.isoformat() if credential.expiration_date else None,
-                "days_expired": days_expired
-            })
-
-    return expired_list
+@router.get("/staff-credentials/expired/export")
+def export_expired_credentials(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Stream all expired staff credentials as NDJSON (one object per line).
+    Same records as /staff-credentials/expired/list, for full compliance dumps.
+    """
+    return ndjson_response(db, _expired_credentials_query, _expired_credential_item)
+
+
+def _expired_credentials_query(db: Session):
+    """Expired credentials with user names, most recently expired first"""
+    today = date.today()
+
+    # Select only the columns the response needs; user names come from the join
+    return db.query(
+            StaffCredential.id,
+            StaffCredential.user_id,
+            StaffCredential.credential_type,
+            StaffCredential.expiration_date,
+            User.first_name,
+            User.last_name,
+            days_between(StaffCredential.expiration_date, today).label("days_expired")
+        )\
+        .join(User, User.id == StaffCredential.user_id)\
+        .filter(StaffCredential.expiration_date < today)\
+        .order_by(StaffCredential.expiration_date.desc(), StaffCredential.id)
+
+
+def _expired_credential_item(row) -> Dict[str, Any]:
+    """Report entry for one expired credential row"""
+    return {
+        "credential_id": str(row.id),
+        "user_id": str(row.user_id),
+        "user_name": f"{row.first_name} {row.last_name}",
+        "credential_type": row.credential_type,
+        "expiration_date": row.expiration_date.isoformat(),
+        "days_expired": row.days_expired
+    }
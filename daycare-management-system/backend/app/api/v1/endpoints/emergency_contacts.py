@@ -1,11 +1,13 @@
 # Emergency Contacts Management Endpoints
 # ============================================
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import case, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 
 from app.database import get_db
 from app.models.child import EmergencyContact, Child
@@ -16,12 +18,15 @@ from app.schemas.child import (
     EmergencyContactResponse,
 )
 from app.core.security import get_current_user
+from app.core.cache import cache, cached
+from app.core.streaming import ndjson_response
+from app.dependencies import child_exists
 
 router = APIRouter()
 
 
 @router.post("/", response_model=EmergencyContactResponse, status_code=status.HTTP_201_CREATED)
-async def create_emergency_contact(
+def create_emergency_contact(
     contact_data: EmergencyContactCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -30,39 +35,40 @@ async def create_emergency_contact(
     Create a new emergency contact for a child.
     DCFS requires minimum 2 emergency contacts per child.
     """
-    # Verify child exists
-    child = db.query(Child).filter(Child.id == contact_data.child_id).first()
-    if not child:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Child with ID {contact_data.child_id} not found"
-        )
-
-    # Check if priority order is already taken for this child
-    existing = db.query(EmergencyContact).filter(
-        and_(
-            EmergencyContact.child_id == contact_data.child_id,
-            EmergencyContact.priority_order == contact_data.priority_order
-        )
-    ).first()
-
-    if existing:
+    # Single INSERT ... SELECT: the row is only written when the child exists
+    # and the priority slot is free (unique constraint, so race-free)
+    values = contact_data.model_dump(exclude={"child_id"})
+    source = select(
+        Child.id,
+        *(literal(value, getattr(EmergencyContact, name).type) for name, value in values.items())
+    ).where(Child.id == contact_data.child_id)
+    stmt = insert(EmergencyContact)\
+        .from_select(["child_id", *values], source)\
+        .on_conflict_do_nothing(index_elements=["child_id", "priority_order"])\
+        .returning(EmergencyContact)
+
+    new_contact = db.scalars(stmt).first()
+    if new_contact is None:
+        db.rollback()
+        # Nothing inserted - work out why
+        if not child_exists(db, contact_data.child_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Child with ID {contact_data.child_id} not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Priority order {contact_data.priority_order} is already assigned to another contact for this child"
         )
 
-    new_contact = EmergencyContact(**contact_data.model_dump())
-
-    db.add(new_contact)
     db.commit()
-    db.refresh(new_contact)
+    cache.delete_pattern("emergency-contacts:*")
 
     return new_contact
 
 
 @router.get("/child/{child_id}", response_model=List[EmergencyContactResponse])
-async def get_child_emergency_contacts(
+def get_child_emergency_contacts(
     child_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -71,14 +77,15 @@ async def get_child_emergency_contacts(
     Get all emergency contacts for a specific child, ordered by priority.
     """
     # Verify child exists
-    child = db.query(Child).filter(Child.id == child_id).first()
-    if not child:
+    if not child_exists(db, child_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Child with ID {child_id} not found"
         )
 
+    # Responses carry no relationships; fail fast if serialization ever lazy-loads one
     contacts = db.query(EmergencyContact)\
+        .options(raiseload("*"))\
         .filter(EmergencyContact.child_id == child_id)\
         .order_by(EmergencyContact.priority_order)\
         .all()
@@ -92,7 +99,7 @@ async def get_child_emergency_contacts(
 
 
 @router.get("/{contact_id}", response_model=EmergencyContactResponse)
-async def get_emergency_contact(
+def get_emergency_contact(
     contact_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -100,7 +107,7 @@ async def get_emergency_contact(
     """
     Get a specific emergency contact by ID.
     """
-    contact = db.query(EmergencyContact).filter(EmergencyContact.id == contact_id).first()
+    contact = db.get(EmergencyContact, contact_id)
 
     if not contact:
         raise HTTPException(
@@ -112,7 +119,7 @@ async def get_emergency_contact(
 
 
 @router.put("/{contact_id}", response_model=EmergencyContactResponse)
-async def update_emergency_contact(
+def update_emergency_contact(
     contact_id: UUID,
     contact_data: EmergencyContactUpdate,
     db: Session = Depends(get_db),
@@ -121,43 +128,42 @@ async def update_emergency_contact(
     """
     Update an emergency contact's information.
     """
-    contact = db.query(EmergencyContact).filter(EmergencyContact.id == contact_id).first()
-
-    if not contact:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Emergency contact with ID {contact_id} not found"
-        )
-
-    # If updating priority order, check for conflicts
+    # Update only provided fields in a single UPDATE ... RETURNING;
+    # uq_contact_priority rejects a priority order held by another contact
     update_data = contact_data.model_dump(exclude_unset=True)
-    if 'priority_order' in update_data and update_data['priority_order'] != contact.priority_order:
-        existing = db.query(EmergencyContact).filter(
-            and_(
-                EmergencyContact.child_id == contact.child_id,
-                EmergencyContact.priority_order == update_data['priority_order'],
-                EmergencyContact.id != contact_id
-            )
-        ).first()
-
-        if existing:
+    if update_data:
+        try:
+            contact = db.execute(
+                update(EmergencyContact)
+                .where(EmergencyContact.id == contact_id)
+                .values(**update_data)
+                .returning(EmergencyContact)
+            ).scalar_one_or_none()
+        except IntegrityError as exc:
+            db.rollback()
+            constraint = getattr(getattr(exc.orig, "diag", None), "constraint_name", None)
+            if constraint != "uq_contact_priority":
+                raise
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Priority order {update_data['priority_order']} is already assigned to another contact"
             )
+    else:
+        contact = db.get(EmergencyContact, contact_id)
 
-    # Update only provided fields
-    for field, value in update_data.items():
-        setattr(contact, field, value)
+    if not contact:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Emergency contact with ID {contact_id} not found"
+        )
 
     db.commit()
-    db.refresh(contact)
 
     return contact
 
 
 @router.delete("/{contact_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_emergency_contact(
+def delete_emergency_contact(
     contact_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -166,7 +172,7 @@ async def delete_emergency_contact(
     Delete an emergency contact.
     Warning: DCFS requires minimum 2 emergency contacts per child.
     """
-    contact = db.query(EmergencyContact).filter(EmergencyContact.id == contact_id).first()
+    contact = db.get(EmergencyContact, contact_id)
 
     if not contact:
         raise HTTPException(
@@ -187,12 +193,13 @@ async def delete_emergency_contact(
 
     db.delete(contact)
     db.commit()
+    cache.delete_pattern("emergency-contacts:*")
 
     return None
 
 
 @router.patch("/{contact_id}/reorder/{new_priority}", response_model=EmergencyContactResponse)
-async def reorder_emergency_contact(
+def reorder_emergency_contact(
     contact_id: UUID,
     new_priority: int,
     db: Session = Depends(get_db),
@@ -202,48 +209,63 @@ async def reorder_emergency_contact(
     Change the priority order of an emergency contact.
     Automatically adjusts other contacts' priorities to avoid conflicts.
     """
-    contact = db.query(EmergencyContact).filter(EmergencyContact.id == contact_id).first()
+    # Read just the slot first; a drop back onto the same slot needs no row load
+    current = db.query(EmergencyContact.priority_order, EmergencyContact.child_id)\
+        .filter(EmergencyContact.id == contact_id)\
+        .first()
 
-    if not contact:
+    if not current:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Emergency contact with ID {contact_id} not found"
         )
 
-    old_priority = contact.priority_order
+    old_priority, child_id = current
 
     if old_priority == new_priority:
-        return contact
-
-    # Get all contacts for this child
-    all_contacts = db.query(EmergencyContact)\
-        .filter(EmergencyContact.child_id == contact.child_id)\
-        .order_by(EmergencyContact.priority_order)\
-        .all()
-
-    # Reorder priorities
-    if new_priority < old_priority:
-        # Moving up: shift others down
-        for c in all_contacts:
-            if c.id != contact_id and new_priority <= c.priority_order < old_priority:
-                c.priority_order += 1
-    else:
-        # Moving down: shift others up
-        for c in all_contacts:
-            if c.id != contact_id and old_priority < c.priority_order <= new_priority:
-                c.priority_order -= 1
-
-    # Set new priority
-    contact.priority_order = new_priority
+        return db.get(EmergencyContact, contact_id)
+
+    # Contacts between the old and new slots shift one place to make room
+    low, high = min(old_priority, new_priority), max(old_priority, new_priority)
+    # Moving up shifts the others down, moving down shifts them up
+    shift = 1 if new_priority < old_priority else -1
+
+    # uq_contact_priority is checked row by row, so a shift in place would
+    # collide with its neighbour. Park the slice at its new positions negated,
+    # then flip the signs back.
+    db.query(EmergencyContact)\
+        .filter(
+            EmergencyContact.child_id == child_id,
+            EmergencyContact.priority_order.between(low, high)
+        )\
+        .update(
+            {
+                EmergencyContact.priority_order: -case(
+                    (EmergencyContact.id == contact_id, new_priority),
+                    else_=EmergencyContact.priority_order + shift
+                )
+            },
+            synchronize_session=False
+        )
+    db.query(EmergencyContact)\
+        .filter(
+            EmergencyContact.child_id == child_id,
+            EmergencyContact.priority_order.between(-high, -low)
+        )\
+        .update(
+            {EmergencyContact.priority_order: -EmergencyContact.priority_order},
+            synchronize_session=False
+        )
 
     db.commit()
-    db.refresh(contact)
 
-    return contact
+    # The bulk updates bypass the identity map; reload in case the contact is already in it
+    return db.get(EmergencyContact, contact_id, populate_existing=True)
 
 
-@router.get("/compliance/missing", response_model=List[dict])
-async def get_children_missing_emergency_contacts(
+@router.get("/compliance/missing")
+@cached(prefix="emergency-contacts", expire=120, stale_if_error=3600)
+def get_children_missing_emergency_contacts(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -251,23 +273,41 @@ async def get_children_missing_emergency_contacts(
     Get list of children who don't have the required minimum 2 emergency contacts.
     Used for DCFS compliance reporting.
     """
-    # Get all active children
-    children = db.query(Child).filter(Child.is_active == True).all()
-
-    missing_contacts = []
-
-    for child in children:
-        contact_count = db.query(EmergencyContact)\
-            .filter(EmergencyContact.child_id == child.id)\
-            .count()
-
-        if contact_count < 2:
-            missing_contacts.append({
-                "child_id": str(child.id),
-                "child_name": f"{child.first_name} {child.last_name}",
-                "current_contact_count": contact_count,
-                "required_count": 2,
-                "missing_count": 2 - contact_count
-            })
-
-    return missing_contacts
+    rows = _missing_contacts_query(db).all()
+
+    return [_missing_contacts_item(row) for row in rows]
+
+
+@router.get("/compliance/missing/export")
+def export_children_missing_emergency_contacts(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Stream children without the required 2 emergency contacts as NDJSON
+    (one object per line). Same records as /compliance/missing.
+    """
+    return ndjson_response(db, _missing_contacts_query, _missing_contacts_item)
+
+
+def _missing_contacts_query(db: Session):
+    """Active children with fewer than 2 emergency contacts and their counts"""
+    # Count contacts per active child in one aggregate; children with none
+    # still appear through the outer join with a count of 0
+    contact_count = func.count(EmergencyContact.id)
+    return db.query(Child.id, Child.first_name, Child.last_name, contact_count.label("contact_count"))\
+        .outerjoin(EmergencyContact, EmergencyContact.child_id == Child.id)\
+        .filter(Child.is_active == True)\
+        .group_by(Child.id, Child.first_name, Child.last_name)\
+        .having(contact_count < 2)
+
+
+def _missing_contacts_item(row) -> Dict[str, Any]:
+    """Report entry for one child's contact count row"""
+    return {
+        "child_id": str(row.id),
+        "child_name": f"{row.first_name} {row.last_name}",
+        "current_contact_count": row.contact_count,
+        "required_count": 2,
+        "missing_count": 2 - row.contact_count
+    }
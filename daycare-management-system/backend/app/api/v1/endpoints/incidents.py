@@ -2,11 +2,13 @@
 # ============================================
 # DCFS Form 337 - Incident and Accident Reports
 
-from datetime import date, time
+from datetime import date, datetime, time
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.orm import Session
+from sqlalchemy import Text, and_, case, func, update
+from sqlalchemy.exc import IntegrityError
 
 from app.database import get_db
 from app.models.health_safety import IncidentReport
@@ -15,15 +17,49 @@ from app.models.user import User
 from app.schemas.health_safety import (
     IncidentReportCreate,
     IncidentReportUpdate,
+    IncidentParentNotificationBulk,
     IncidentReportResponse,
+    IncidentReportListItem,
+    IncidentType,
+    NotificationMethod,
 )
 from app.core.security import get_current_user
+from app.core.pagination import keyset_paginate, offset_page
+from app.dependencies import child_exists
+from app.core.cache import cache, cached
+from app.core.sql import hours_since
 
 router = APIRouter()
 
+# Worklists and statistics only change on incident writes, which clear the
+# cache; the short TTL bounds drift in hours_since_incident and child names
+INCIDENTS_TTL = 60
+
+# Worklist descriptions are cut to 100 characters in SQL, so full texts never leave the database
+DESCRIPTION_PREVIEW_LENGTH = 100
+description_preview = case(
+    (
+        func.length(IncidentReport.description) > DESCRIPTION_PREVIEW_LENGTH,
+        func.substr(IncidentReport.description, 1, DESCRIPTION_PREVIEW_LENGTH, type_=Text) + "..."
+    ),
+    else_=IncidentReport.description
+).label("description")
+
+# Columns selected by list endpoints (matches IncidentReportListItem)
+INCIDENT_LIST_COLUMNS = (
+    IncidentReport.id,
+    IncidentReport.child_id,
+    IncidentReport.incident_type,
+    IncidentReport.incident_date,
+    IncidentReport.incident_time,
+    description_preview,
+    IncidentReport.parent_notified,
+    IncidentReport.dcfs_notification_required,
+)
+
 
 @router.post("/", response_model=IncidentReportResponse, status_code=status.HTTP_201_CREATED)
-async def create_incident_report(
+def create_incident_report(
     report_data: IncidentReportCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -34,52 +70,37 @@ async def create_incident_report(
 
     DCFS requires immediate documentation and parent notification.
     """
-    # Verify child exists
-    child = db.query(Child).filter(Child.id == report_data.child_id).first()
-    if not child:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Child with ID {report_data.child_id} not found"
-        )
-
-    # Validate incident type
-    valid_types = ['injury', 'illness', 'behavioral', 'accident', 'other']
-    if report_data.incident_type not in valid_types:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid incident type. Must be one of: {', '.join(valid_types)}"
-        )
-
-    # Validate notification method if provided
-    if report_data.parent_notification_method:
-        valid_methods = ['phone', 'email', 'in-person', 'sms']
-        if report_data.parent_notification_method not in valid_methods:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid notification method. Must be one of: {', '.join(valid_methods)}"
-            )
-
     new_report = IncidentReport(
         **report_data.model_dump(),
         reported_by=current_user.id
     )
 
+    # The child_id foreign key rejects unknown children, so no pre-check is needed
     db.add(new_report)
-    db.commit()
-    db.refresh(new_report)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Child with ID {report_data.child_id} not found"
+        )
+    cache.delete_pattern("incidents:*")
 
     return new_report
 
 
-@router.get("/", response_model=List[IncidentReportResponse])
-async def get_incident_reports(
+@router.get("/", response_model=List[IncidentReportListItem])
+def get_incident_reports(
+    response: Response,
     child_id: Optional[UUID] = Query(None, description="Filter by child"),
-    incident_type: Optional[str] = Query(None, description="Filter by incident type"),
+    incident_type: Optional[IncidentType] = Query(None, description="Filter by incident type"),
     start_date: Optional[date] = Query(None, description="Start date"),
     end_date: Optional[date] = Query(None, description="End date"),
     parent_notified: Optional[bool] = Query(None, description="Filter by parent notification status"),
     dcfs_notification_required: Optional[bool] = Query(None, description="Filter by DCFS notification requirement"),
-    page: int = Query(1, ge=1),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    page: Optional[int] = Query(None, ge=1, description="Page number (legacy offset pagination)"),
     page_size: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -87,7 +108,7 @@ async def get_incident_reports(
     """
     Get incident reports with comprehensive filtering options.
     """
-    query = db.query(IncidentReport)
+    query = db.query(*INCIDENT_LIST_COLUMNS)
 
     # Apply filters
     if child_id:
@@ -108,18 +129,26 @@ async def get_incident_reports(
     if dcfs_notification_required is not None:
         query = query.filter(IncidentReport.dcfs_notification_required == dcfs_notification_required)
 
-    # Apply pagination
-    offset = (page - 1) * page_size
-    reports = query.order_by(IncidentReport.incident_date.desc(), IncidentReport.incident_time.desc())\
-                   .offset(offset)\
-                   .limit(page_size)\
-                   .all()
+    sort_key = [IncidentReport.incident_date, IncidentReport.incident_time, IncidentReport.id]
+
+    # Legacy offset pagination for clients that still send ?page=
+    if page is not None:
+        return offset_page(query, sort_key, page, page_size)
+
+    # Apply keyset pagination
+    reports = keyset_paginate(
+        query,
+        sort_key,
+        cursor,
+        page_size,
+        response
+    )
 
     return reports
 
 
-@router.get("/child/{child_id}", response_model=List[IncidentReportResponse])
-async def get_child_incident_reports(
+@router.get("/child/{child_id}", response_model=List[IncidentReportListItem])
+def get_child_incident_reports(
     child_id: UUID,
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
@@ -130,14 +159,13 @@ async def get_child_incident_reports(
     Get all incident reports for a specific child.
     """
     # Verify child exists
-    child = db.query(Child).filter(Child.id == child_id).first()
-    if not child:
+    if not child_exists(db, child_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Child with ID {child_id} not found"
         )
 
-    query = db.query(IncidentReport).filter(IncidentReport.child_id == child_id)
+    query = db.query(*INCIDENT_LIST_COLUMNS).filter(IncidentReport.child_id == child_id)
 
     if start_date:
         query = query.filter(IncidentReport.incident_date >= start_date)
@@ -150,7 +178,7 @@ async def get_child_incident_reports(
 
 
 @router.get("/{report_id}", response_model=IncidentReportResponse)
-async def get_incident_report(
+def get_incident_report(
     report_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -158,7 +186,7 @@ async def get_incident_report(
     """
     Get a specific incident report by ID.
     """
-    report = db.query(IncidentReport).filter(IncidentReport.id == report_id).first()
+    report = db.get(IncidentReport, report_id)
 
     if not report:
         raise HTTPException(
@@ -170,7 +198,7 @@ async def get_incident_report(
 
 
 @router.put("/{report_id}", response_model=IncidentReportResponse)
-async def update_incident_report(
+def update_incident_report(
     report_id: UUID,
     report_data: IncidentReportUpdate,
     db: Session = Depends(get_db),
@@ -180,7 +208,7 @@ async def update_incident_report(
     Update an incident report.
     Typically used to add parent notification details, signatures, or DCFS notification info.
     """
-    report = db.query(IncidentReport).filter(IncidentReport.id == report_id).first()
+    report = db.get(IncidentReport, report_id)
 
     if not report:
         raise HTTPException(
@@ -194,13 +222,13 @@ async def update_incident_report(
         setattr(report, field, value)
 
     db.commit()
-    db.refresh(report)
+    cache.delete_pattern("incidents:*")
 
     return report
 
 
 @router.delete("/{report_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_incident_report(
+def delete_incident_report(
     report_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -215,7 +243,7 @@ async def delete_incident_report(
             detail="Only administrators can delete incident reports"
         )
 
-    report = db.query(IncidentReport).filter(IncidentReport.id == report_id).first()
+    report = db.get(IncidentReport, report_id)
 
     if not report:
         raise HTTPException(
@@ -225,12 +253,14 @@ async def delete_incident_report(
 
     db.delete(report)
     db.commit()
+    cache.delete_pattern("incidents:*")
 
     return None
 
 
-@router.get("/pending/parent-notification", response_model=List[dict])
-async def get_pending_parent_notifications(
+@router.get("/pending/parent-notification")
+@cached(prefix="incidents", expire=INCIDENTS_TTL)
+def get_pending_parent_notifications(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -238,35 +268,44 @@ async def get_pending_parent_notifications(
     Get incident reports where parents have not yet been notified.
     CRITICAL: DCFS requires immediate parent notification for all incidents.
     """
-    reports = db.query(IncidentReport)\
+    now = datetime.now()
+
+    # Select only the columns the response needs; child names come from the join
+    rows = db.query(
+            IncidentReport.id,
+            IncidentReport.child_id,
+            IncidentReport.incident_type,
+            IncidentReport.incident_date,
+            IncidentReport.incident_time,
+            hours_since(IncidentReport.incident_date, IncidentReport.incident_time, now).label("hours_since_incident"),
+            description_preview,
+            Child.first_name,
+            Child.last_name
+        )\
+        .join(Child, Child.id == IncidentReport.child_id)\
         .filter(IncidentReport.parent_notified == False)\
         .order_by(IncidentReport.incident_date.desc(), IncidentReport.incident_time.desc())\
         .all()
 
     pending_list = []
-    for report in reports:
-        child = db.query(Child).filter(Child.id == report.child_id).first()
-        if child:
-            from datetime import datetime
-            incident_datetime = datetime.combine(report.incident_date, report.incident_time)
-            hours_since_incident = (datetime.now() - incident_datetime).total_seconds() / 3600
-
-            pending_list.append({
-                "report_id": str(report.id),
-                "child_id": str(child.id),
-                "child_name": f"{child.first_name} {child.last_name}",
-                "incident_type": report.incident_type,
-                "incident_date": report.incident_date.isoformat(),
-                "incident_time": report.incident_time.isoformat(),
-                "hours_since_incident": round(hours_since_incident, 1),
-                "description": report.description[:100] + "..." if len(report.description) > 100 else report.description
-            })
+    for row in rows:
+        pending_list.append({
+            "report_id": row.id,
+            "child_id": row.child_id,
+            "child_name": f"{row.first_name} {row.last_name}",
+            "incident_type": row.incident_type,
+            "incident_date": row.incident_date,
+            "incident_time": row.incident_time,
+            "hours_since_incident": round(row.hours_since_incident, 1),
+            "description": row.description
+        })
 
     return pending_list
 
 
-@router.get("/requiring/dcfs-notification", response_model=List[dict])
-async def get_reports_requiring_dcfs_notification(
+@router.get("/requiring/dcfs-notification")
+@cached(prefix="incidents", expire=INCIDENTS_TTL)
+def get_reports_requiring_dcfs_notification(
     notified: Optional[bool] = Query(None, description="Filter by notification status"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -275,7 +314,19 @@ async def get_reports_requiring_dcfs_notification(
     Get incident reports that require DCFS notification.
     Serious incidents must be reported to DCFS within specified timeframes.
     """
-    query = db.query(IncidentReport)\
+    # Select only the columns the response needs; child names come from the join
+    query = db.query(
+            IncidentReport.id,
+            IncidentReport.child_id,
+            IncidentReport.incident_type,
+            IncidentReport.incident_date,
+            IncidentReport.incident_time,
+            IncidentReport.dcfs_notified_at,
+            description_preview,
+            Child.first_name,
+            Child.last_name
+        )\
+        .join(Child, Child.id == IncidentReport.child_id)\
         .filter(IncidentReport.dcfs_notification_required == True)
 
     if notified is not None:
@@ -284,29 +335,28 @@ async def get_reports_requiring_dcfs_notification(
         else:
             query = query.filter(IncidentReport.dcfs_notified_at.is_(None))
 
-    reports = query.order_by(IncidentReport.incident_date.desc()).all()
+    rows = query.order_by(IncidentReport.incident_date.desc()).all()
 
     dcfs_list = []
-    for report in reports:
-        child = db.query(Child).filter(Child.id == report.child_id).first()
-        if child:
-            dcfs_list.append({
-                "report_id": str(report.id),
-                "child_id": str(child.id),
-                "child_name": f"{child.first_name} {child.last_name}",
-                "incident_type": report.incident_type,
-                "incident_date": report.incident_date.isoformat(),
-                "incident_time": report.incident_time.isoformat(),
-                "dcfs_notified": report.dcfs_notified_at is not None,
-                "dcfs_notified_at": report.dcfs_notified_at.isoformat() if report.dcfs_notified_at else None,
-                "description": report.description[:100] + "..." if len(report.description) > 100 else report.description
-            })
+    for row in rows:
+        dcfs_list.append({
+            "report_id": row.id,
+            "child_id": row.child_id,
+            "child_name": f"{row.first_name} {row.last_name}",
+            "incident_type": row.incident_type,
+            "incident_date": row.incident_date,
+            "incident_time": row.incident_time,
+            "dcfs_notified": row.dcfs_notified_at is not None,
+            "dcfs_notified_at": row.dcfs_notified_at,
+            "description": row.description
+        })
 
     return dcfs_list
 
 
-@router.get("/statistics/summary", response_model=dict)
-async def get_incident_statistics(
+@router.get("/statistics/summary")
+@cached(prefix="incidents", expire=INCIDENTS_TTL)
+def get_incident_statistics(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
     db: Session = Depends(get_db),
@@ -316,18 +366,26 @@ async def get_incident_statistics(
     Get incident report statistics for a date range.
     Useful for safety analysis and compliance reporting.
     """
-    query = db.query(IncidentReport)
+    # Aggregate per incident type in the database; one row per type
+    dcfs_required = IncidentReport.dcfs_notification_required == True
+    query = db.query(
+            IncidentReport.incident_type,
+            func.count().label("total"),
+            func.sum(case((IncidentReport.parent_notified == True, 1), else_=0)).label("parent_notified"),
+            func.sum(case((dcfs_required, 1), else_=0)).label("dcfs_required"),
+            func.sum(case((and_(dcfs_required, IncidentReport.dcfs_notified_at.isnot(None)), 1), else_=0)).label("dcfs_completed")
+        )
 
     if start_date:
         query = query.filter(IncidentReport.incident_date >= start_date)
     if end_date:
         query = query.filter(IncidentReport.incident_date <= end_date)
 
-    all_reports = query.all()
+    rows = query.group_by(IncidentReport.incident_type).all()
 
     # Calculate statistics
     stats = {
-        "total_incidents": len(all_reports),
+        "total_incidents": 0,
         "by_type": {},
         "parent_notification": {
             "notified": 0,
@@ -340,42 +398,36 @@ async def get_incident_statistics(
         },
         "injuries": 0,
         "date_range": {
-            "start": start_date.isoformat() if start_date else None,
-            "end": end_date.isoformat() if end_date else None
+            "start": start_date,
+            "end": end_date
         }
     }
 
-    for report in all_reports:
+    for row in rows:
         # Count by type
-        if report.incident_type not in stats["by_type"]:
-            stats["by_type"][report.incident_type] = 0
-        stats["by_type"][report.incident_type] += 1
+        stats["total_incidents"] += row.total
+        stats["by_type"][row.incident_type] = row.total
 
         # Parent notification
-        if report.parent_notified:
-            stats["parent_notification"]["notified"] += 1
-        else:
-            stats["parent_notification"]["pending"] += 1
+        stats["parent_notification"]["notified"] += row.parent_notified
+        stats["parent_notification"]["pending"] += row.total - row.parent_notified
 
         # DCFS notification
-        if report.dcfs_notification_required:
-            stats["dcfs_notification"]["required"] += 1
-            if report.dcfs_notified_at:
-                stats["dcfs_notification"]["completed"] += 1
-            else:
-                stats["dcfs_notification"]["pending"] += 1
+        stats["dcfs_notification"]["required"] += row.dcfs_required
+        stats["dcfs_notification"]["completed"] += row.dcfs_completed
+        stats["dcfs_notification"]["pending"] += row.dcfs_required - row.dcfs_completed
 
         # Count injuries
-        if report.incident_type == "injury":
-            stats["injuries"] += 1
+        if row.incident_type == "injury":
+            stats["injuries"] = row.total
 
     return stats
 
 
 @router.patch("/{report_id}/notify-parent", response_model=IncidentReportResponse)
-async def mark_parent_notified(
+def mark_parent_notified(
     report_id: UUID,
-    notification_method: str = Query(..., description="phone, email, in-person, or sms"),
+    notification_method: NotificationMethod = Query(..., description="phone, email, in-person, or sms"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -383,7 +435,7 @@ async def mark_parent_notified(
     Mark an incident report as parent notified.
     Records the notification method and timestamp.
     """
-    report = db.query(IncidentReport).filter(IncidentReport.id == report_id).first()
+    report = db.get(IncidentReport, report_id)
 
     if not report:
         raise HTTPException(
@@ -391,27 +443,57 @@ async def mark_parent_notified(
             detail=f"Incident report with ID {report_id} not found"
         )
 
-    # Validate notification method
-    valid_methods = ['phone', 'email', 'in-person', 'sms']
-    if notification_method not in valid_methods:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid notification method. Must be one of: {', '.join(valid_methods)}"
-        )
-
-    from datetime import datetime
     report.parent_notified = True
     report.parent_notified_at = datetime.now()
     report.parent_notification_method = notification_method
 
     db.commit()
-    db.refresh(report)
+    cache.delete_pattern("incidents:*")
 
     return report
 
 
+@router.post("/bulk/notify-parent")
+def mark_parents_notified_bulk(
+    bulk_data: IncidentParentNotificationBulk,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Mark several incident reports as parent notified in one request.
+    All reports are updated in a single statement, or none are.
+    """
+    report_ids = set(bulk_data.report_ids)
+
+    # One UPDATE ... RETURNING instead of a SELECT and UPDATE per report
+    updated_ids = set(db.scalars(
+        update(IncidentReport)
+        .where(IncidentReport.id.in_(report_ids))
+        .values(
+            parent_notified=True,
+            parent_notified_at=datetime.now(),
+            parent_notification_method=bulk_data.notification_method
+        )
+        .returning(IncidentReport.id)
+        .execution_options(synchronize_session=False)
+    ).all())
+
+    missing_ids = report_ids - updated_ids
+    if missing_ids:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Incident reports not found: {', '.join(sorted(str(i) for i in missing_ids))}"
+        )
+
+    db.commit()
+    cache.delete_pattern("incidents:*")
+
+    return {"updated": len(updated_ids)}
+
+
 @router.patch("/{report_id}/notify-dcfs", response_model=IncidentReportResponse)
-async def mark_dcfs_notified(
+def mark_dcfs_notified(
     report_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -420,7 +502,7 @@ async def mark_dcfs_notified(
     Mark an incident report as DCFS notified.
     Records the notification timestamp.
     """
-    report = db.query(IncidentReport).filter(IncidentReport.id == report_id).first()
+    report = db.get(IncidentReport, report_id)
 
     if not report:
         raise HTTPException(
@@ -434,10 +516,9 @@ async def mark_dcfs_notified(
             detail="This incident does not require DCFS notification"
         )
 
-    from datetime import datetime
     report.dcfs_notified_at = datetime.now()
 
     db.commit()
-    db.refresh(report)
+    cache.delete_pattern("incidents:*")
 
     return report
@@ -5,13 +5,14 @@
 from datetime import date, time
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import and_, func, literal_column
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.exc import IntegrityError
 
 from app.database import get_db
 from app.models.health_safety import MedicationAuthorization, MedicationLog
-from app.models.child import Child
 from app.models.user import User
 from app.schemas.health_safety import (
     MedicationAuthorizationCreate,
@@ -22,16 +23,69 @@ from app.schemas.health_safety import (
     MedicationLogResponse,
 )
 from app.core.security import get_current_user
+from app.core.pagination import keyset_paginate, offset_page
+from app.core.cache import cache, cached
+from app.core.sql import date_in_period
+from app.dependencies import child_exists, get_child_name
 
 router = APIRouter()
 
+# Sort key for keyset-paginated log histories, newest first
+LOG_PAGE_ORDER = [MedicationLog.administration_date, MedicationLog.administration_time, MedicationLog.id]
+
+# Today's log is polled by dashboards; a few seconds of staleness is fine
+# and every log write clears it anyway
+TODAYS_LOGS_TTL = 10
+
+
+# ============================================
+# LOOKUP DEPENDENCIES
+# ============================================
+# FastAPI resolves a dependency once per request, so handlers and other
+# dependencies that ask for the same row share a single lookup
+
+def get_authorization_or_404(
+    authorization_id: UUID,
+    db: Session = Depends(get_db)
+) -> MedicationAuthorization:
+    """
+    Load a medication authorization by ID, raising 404 if it does not exist.
+    """
+    authorization = db.get(MedicationAuthorization, authorization_id)
+
+    if not authorization:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Medication authorization with ID {authorization_id} not found"
+        )
+
+    return authorization
+
+
+def get_log_or_404(
+    log_id: UUID,
+    db: Session = Depends(get_db)
+) -> MedicationLog:
+    """
+    Load a medication log by ID, raising 404 if it does not exist.
+    """
+    log = db.get(MedicationLog, log_id)
+
+    if not log:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Medication log with ID {log_id} not found"
+        )
+
+    return log
+
 
 # ============================================
 # MEDICATION AUTHORIZATIONS
 # ============================================
 
 @router.post("/authorizations/", response_model=MedicationAuthorizationResponse, status_code=status.HTTP_201_CREATED)
-async def create_medication_authorization(
+def create_medication_authorization(
     auth_data: MedicationAuthorizationCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -46,28 +100,29 @@ async def create_medication_authorization(
     - Start and end dates
     - Parent signature (digital signature URL)
     """
-    # Verify child exists
-    child = db.query(Child).filter(Child.id == auth_data.child_id).first()
-    if not child:
+    new_authorization = MedicationAuthorization(**auth_data.model_dump())
+
+    # The child_id foreign key rejects unknown children, so no pre-check is needed
+    db.add(new_authorization)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Child with ID {auth_data.child_id} not found"
         )
 
-    new_authorization = MedicationAuthorization(**auth_data.model_dump())
-
-    db.add(new_authorization)
-    db.commit()
-    db.refresh(new_authorization)
-
     return new_authorization
 
 
 @router.get("/authorizations/", response_model=List[MedicationAuthorizationResponse])
-async def get_medication_authorizations(
+def get_medication_authorizations(
+    response: Response,
     child_id: Optional[UUID] = Query(None, description="Filter by child"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
-    page: int = Query(1, ge=1),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    page: Optional[int] = Query(None, ge=1, description="Page number (legacy offset pagination)"),
     page_size: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -75,7 +130,7 @@ async def get_medication_authorizations(
     """
     Get medication authorizations with filtering.
     """
-    query = db.query(MedicationAuthorization)
+    query = db.query(MedicationAuthorization).options(raiseload("*"))
 
     if child_id:
         query = query.filter(MedicationAuthorization.child_id == child_id)
@@ -83,17 +138,26 @@ async def get_medication_authorizations(
     if is_active is not None:
         query = query.filter(MedicationAuthorization.is_active == is_active)
 
-    offset = (page - 1) * page_size
-    authorizations = query.order_by(MedicationAuthorization.start_date.desc())\
-                         .offset(offset)\
-                         .limit(page_size)\
-                         .all()
+    sort_key = [MedicationAuthorization.start_date, MedicationAuthorization.id]
+
+    # Legacy offset pagination for clients that still send ?page=
+    if page is not None:
+        return offset_page(query, sort_key, page, page_size)
+
+    # Apply keyset pagination
+    authorizations = keyset_paginate(
+        query,
+        sort_key,
+        cursor,
+        page_size,
+        response
+    )
 
     return authorizations
 
 
 @router.get("/authorizations/child/{child_id}", response_model=List[MedicationAuthorizationResponse])
-async def get_child_medication_authorizations(
+def get_child_medication_authorizations(
     child_id: UUID,
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     db: Session = Depends(get_db),
@@ -103,14 +167,14 @@ async def get_child_medication_authorizations(
     Get all medication authorizations for a specific child.
     """
     # Verify child exists
-    child = db.query(Child).filter(Child.id == child_id).first()
-    if not child:
+    if not child_exists(db, child_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Child with ID {child_id} not found"
         )
 
     query = db.query(MedicationAuthorization)\
+        .options(raiseload("*"))\
         .filter(MedicationAuthorization.child_id == child_id)
 
     if is_active is not None:
@@ -122,7 +186,7 @@ async def get_child_medication_authorizations(
 
 
 @router.get("/authorizations/active/today", response_model=List[MedicationAuthorizationResponse])
-async def get_active_medications_today(
+def get_active_medications_today(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -132,14 +196,12 @@ async def get_active_medications_today(
     """
     today = date.today()
 
+    # The response has no relationship fields; fail loudly rather than lazy-load per row
     authorizations = db.query(MedicationAuthorization)\
+        .options(raiseload("*"))\
         .filter(
             MedicationAuthorization.is_active == True,
-            MedicationAuthorization.start_date <= today,
-            or_(
-                MedicationAuthorization.end_date.is_(None),
-                MedicationAuthorization.end_date >= today
-            )
+            date_in_period(today, MedicationAuthorization.start_date, MedicationAuthorization.end_date)
         )\
         .order_by(MedicationAuthorization.child_id)\
         .all()
@@ -148,61 +210,39 @@ async def get_active_medications_today(
 
 
 @router.get("/authorizations/{authorization_id}", response_model=MedicationAuthorizationResponse)
-async def get_medication_authorization(
-    authorization_id: UUID,
-    db: Session = Depends(get_db),
+def get_medication_authorization(
+    authorization: MedicationAuthorization = Depends(get_authorization_or_404),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get a specific medication authorization by ID.
     """
-    authorization = db.query(MedicationAuthorization)\
-        .filter(MedicationAuthorization.id == authorization_id)\
-        .first()
-
-    if not authorization:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Medication authorization with ID {authorization_id} not found"
-        )
-
     return authorization
 
 
 @router.put("/authorizations/{authorization_id}", response_model=MedicationAuthorizationResponse)
-async def update_medication_authorization(
-    authorization_id: UUID,
+def update_medication_authorization(
     auth_data: MedicationAuthorizationUpdate,
+    authorization: MedicationAuthorization = Depends(get_authorization_or_404),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Update a medication authorization.
     """
-    authorization = db.query(MedicationAuthorization)\
-        .filter(MedicationAuthorization.id == authorization_id)\
-        .first()
-
-    if not authorization:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Medication authorization with ID {authorization_id} not found"
-        )
-
     # Update only provided fields
     update_data = auth_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(authorization, field, value)
 
     db.commit()
-    db.refresh(authorization)
 
     return authorization
 
 
 @router.patch("/authorizations/{authorization_id}/deactivate", response_model=MedicationAuthorizationResponse)
-async def deactivate_medication_authorization(
-    authorization_id: UUID,
+def deactivate_medication_authorization(
+    authorization: MedicationAuthorization = Depends(get_authorization_or_404),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -210,25 +250,14 @@ async def deactivate_medication_authorization(
     Deactivate a medication authorization.
     Use this when medication is discontinued.
     """
-    authorization = db.query(MedicationAuthorization)\
-        .filter(MedicationAuthorization.id == authorization_id)\
-        .first()
-
-    if not authorization:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Medication authorization with ID {authorization_id} not found"
-        )
-
     authorization.is_active = False
     db.commit()
-    db.refresh(authorization)
 
     return authorization
 
 
 @router.delete("/authorizations/{authorization_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_medication_authorization(
+def delete_medication_authorization(
     authorization_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -243,18 +272,12 @@ async def delete_medication_authorization(
             detail="Only administrators can delete medication authorizations"
         )
 
-    authorization = db.query(MedicationAuthorization)\
-        .filter(MedicationAuthorization.id == authorization_id)\
-        .first()
-
-    if not authorization:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Medication authorization with ID {authorization_id} not found"
-        )
+    authorization = get_authorization_or_404(authorization_id, db)
 
     db.delete(authorization)
     db.commit()
+    # Deleting an authorization cascades to its logs
+    cache.delete_pattern("medication-logs:*")
 
     return None
 
@@ -264,7 +287,7 @@ async def delete_medication_authorization(
 # ============================================
 
 @router.post("/logs/", response_model=MedicationLogResponse, status_code=status.HTTP_201_CREATED)
-async def create_medication_log(
+def create_medication_log(
     log_data: MedicationLogCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -278,16 +301,14 @@ async def create_medication_log(
     - Staff signature
     - Date, time, and dosage
     """
-    # Verify child exists
-    child = db.query(Child).filter(Child.id == log_data.child_id).first()
-    if not child:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Child with ID {log_data.child_id} not found"
-        )
-
-    # Verify authorization exists and is active
-    authorization = db.query(MedicationAuthorization)\
+    # Verify authorization exists and is active; only the columns the
+    # checks below need are fetched
+    authorization = db.query(
+        MedicationAuthorization.child_id,
+        MedicationAuthorization.is_active,
+        MedicationAuthorization.start_date,
+        MedicationAuthorization.end_date
+    )\
         .filter(MedicationAuthorization.id == log_data.authorization_id)\
         .first()
 
@@ -303,8 +324,14 @@ async def create_medication_log(
             detail="Cannot log medication: Authorization is inactive"
         )
 
-    # Verify authorization matches the child
+    # Verify authorization matches the child; a matching authorization
+    # implies the child exists, so the child is only looked up on a mismatch
     if authorization.child_id != log_data.child_id:
+        if not child_exists(db, log_data.child_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Child with ID {log_data.child_id} not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Authorization does not match the specified child"
@@ -330,13 +357,13 @@ async def create_medication_log(
 
     db.add(new_log)
     db.commit()
-    db.refresh(new_log)
+    cache.delete_pattern("medication-logs:*")
 
     return new_log
 
 
 @router.get("/logs/", response_model=List[MedicationLogResponse])
-async def get_medication_logs(
+def get_medication_logs(
     child_id: Optional[UUID] = Query(None, description="Filter by child"),
     authorization_id: Optional[UUID] = Query(None, description="Filter by authorization"),
     administration_date: Optional[date] = Query(None, description="Filter by date"),
@@ -348,7 +375,7 @@ async def get_medication_logs(
     """
     Get medication administration logs with filtering.
     """
-    query = db.query(MedicationLog)
+    query = db.query(MedicationLog).options(raiseload("*"))
 
     if child_id:
         query = query.filter(MedicationLog.child_id == child_id)
@@ -372,10 +399,13 @@ async def get_medication_logs(
 
 
 @router.get("/logs/child/{child_id}", response_model=List[MedicationLogResponse])
-async def get_child_medication_logs(
+def get_child_medication_logs(
     child_id: UUID,
+    response: Response,
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    page_size: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -383,27 +413,30 @@ async def get_child_medication_logs(
     Get medication administration history for a specific child.
     """
     # Verify child exists
-    child = db.query(Child).filter(Child.id == child_id).first()
-    if not child:
+    if not child_exists(db, child_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Child with ID {child_id} not found"
         )
 
-    query = db.query(MedicationLog).filter(MedicationLog.child_id == child_id)
+    query = db.query(MedicationLog)\
+        .options(raiseload("*"))\
+        .filter(MedicationLog.child_id == child_id)
 
     if start_date:
         query = query.filter(MedicationLog.administration_date >= start_date)
     if end_date:
         query = query.filter(MedicationLog.administration_date <= end_date)
 
-    logs = query.order_by(MedicationLog.administration_date.desc()).all()
+    # Apply keyset pagination
+    logs = keyset_paginate(query, LOG_PAGE_ORDER, cursor, page_size, response)
 
     return logs
 
 
 @router.get("/logs/today", response_model=List[MedicationLogResponse])
-async def get_todays_medication_logs(
+@cached(prefix="medication-logs", expire=TODAYS_LOGS_TTL, response_model=List[MedicationLogResponse])
+def get_todays_medication_logs(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -414,6 +447,7 @@ async def get_todays_medication_logs(
     today = date.today()
 
     logs = db.query(MedicationLog)\
+        .options(raiseload("*"))\
         .filter(MedicationLog.administration_date == today)\
         .order_by(MedicationLog.administration_time.desc())\
         .all()
@@ -422,8 +456,11 @@ async def get_todays_medication_logs(
 
 
 @router.get("/logs/authorization/{authorization_id}", response_model=List[MedicationLogResponse])
-async def get_authorization_medication_logs(
+def get_authorization_medication_logs(
     authorization_id: UUID,
+    response: Response,
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    page_size: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -431,48 +468,33 @@ async def get_authorization_medication_logs(
     Get all administration logs for a specific medication authorization.
     """
     # Verify authorization exists
-    authorization = db.query(MedicationAuthorization)\
-        .filter(MedicationAuthorization.id == authorization_id)\
-        .first()
+    get_authorization_or_404(authorization_id, db)
 
-    if not authorization:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Medication authorization with ID {authorization_id} not found"
-        )
+    query = db.query(MedicationLog)\
+        .options(raiseload("*"))\
+        .filter(MedicationLog.authorization_id == authorization_id)
 
-    logs = db.query(MedicationLog)\
-        .filter(MedicationLog.authorization_id == authorization_id)\
-        .order_by(MedicationLog.administration_date.desc())\
-        .all()
+    # Apply keyset pagination
+    logs = keyset_paginate(query, LOG_PAGE_ORDER, cursor, page_size, response)
 
     return logs
 
 
 @router.get("/logs/{log_id}", response_model=MedicationLogResponse)
-async def get_medication_log(
-    log_id: UUID,
-    db: Session = Depends(get_db),
+def get_medication_log(
+    log: MedicationLog = Depends(get_log_or_404),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get a specific medication log by ID.
     """
-    log = db.query(MedicationLog).filter(MedicationLog.id == log_id).first()
-
-    if not log:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Medication log with ID {log_id} not found"
-        )
-
     return log
 
 
 @router.put("/logs/{log_id}", response_model=MedicationLogResponse)
-async def update_medication_log(
-    log_id: UUID,
+def update_medication_log(
     log_data: MedicationLogUpdate,
+    log: MedicationLog = Depends(get_log_or_404),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -480,14 +502,6 @@ async def update_medication_log(
     Update a medication log.
     Typically used to add parent notification status or additional notes.
     """
-    log = db.query(MedicationLog).filter(MedicationLog.id == log_id).first()
-
-    if not log:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Medication log with ID {log_id} not found"
-        )
-
     # Only allow updates by the person who administered or by admin
     if log.administered_by != current_user.id and current_user.role != "admin":
         raise HTTPException(
@@ -501,13 +515,13 @@ async def update_medication_log(
         setattr(log, field, value)
 
     db.commit()
-    db.refresh(log)
+    cache.delete_pattern("medication-logs:*")
 
     return log
 
 
 @router.delete("/logs/{log_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_medication_log(
+def delete_medication_log(
     log_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -522,22 +536,17 @@ async def delete_medication_log(
             detail="Only administrators can delete medication logs"
         )
 
-    log = db.query(MedicationLog).filter(MedicationLog.id == log_id).first()
-
-    if not log:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Medication log with ID {log_id} not found"
-        )
+    log = get_log_or_404(log_id, db)
 
     db.delete(log)
     db.commit()
+    cache.delete_pattern("medication-logs:*")
 
     return None
 
 
 @router.get("/schedule/child/{child_id}/date/{schedule_date}", response_model=dict)
-async def get_child_medication_schedule(
+def get_child_medication_schedule(
     child_id: UUID,
     schedule_date: date,
     db: Session = Depends(get_db),
@@ -547,61 +556,52 @@ async def get_child_medication_schedule(
     Get medication schedule for a child on a specific date.
     Shows what medications are due and what has been administered.
     """
-    # Verify child exists
-    child = db.query(Child).filter(Child.id == child_id).first()
-    if not child:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Child with ID {child_id} not found"
-        )
+    # Raises 404 for unknown children; names are cached briefly
+    child_name = get_child_name(db, child_id)
+
+    # One row per active authorization, with that day's administrations
+    # aggregated into a ready-to-serialize JSON array in the database
+    administration_times = func.coalesce(
+        func.json_agg(aggregate_order_by(
+            func.json_build_object(
+                "time", MedicationLog.administration_time,
+                "dosage_given", MedicationLog.dosage_given,
+                "administered_by", MedicationLog.administered_by
+            ),
+            MedicationLog.administration_time
+        )).filter(MedicationLog.id.isnot(None)),
+        literal_column("'[]'::json")
+    )
 
-    # Get active authorizations for the date
-    active_authorizations = db.query(MedicationAuthorization)\
-        .filter(
-            MedicationAuthorization.child_id == child_id,
-            MedicationAuthorization.is_active == True,
-            MedicationAuthorization.start_date <= schedule_date,
-            or_(
-                MedicationAuthorization.end_date.is_(None),
-                MedicationAuthorization.end_date >= schedule_date
+    medications = db.query(
+        MedicationAuthorization.id.label("authorization_id"),
+        MedicationAuthorization.medication_name,
+        MedicationAuthorization.dosage,
+        MedicationAuthorization.frequency,
+        MedicationAuthorization.administration_instructions.label("instructions"),
+        (func.count(MedicationLog.id) > 0).label("administered"),
+        administration_times.label("administration_times")
+    )\
+        .outerjoin(
+            MedicationLog,
+            and_(
+                MedicationLog.authorization_id == MedicationAuthorization.id,
+                MedicationLog.administration_date == schedule_date
             )
         )\
-        .all()
-
-    # Get logs for the date
-    logs_today = db.query(MedicationLog)\
         .filter(
-            MedicationLog.child_id == child_id,
-            MedicationLog.administration_date == schedule_date
+            MedicationAuthorization.child_id == child_id,
+            MedicationAuthorization.is_active == True,
+            date_in_period(schedule_date, MedicationAuthorization.start_date, MedicationAuthorization.end_date)
         )\
+        .group_by(MedicationAuthorization.id)\
         .all()
 
     schedule = {
         "child_id": str(child_id),
-        "child_name": f"{child.first_name} {child.last_name}",
+        "child_name": child_name,
         "date": schedule_date.isoformat(),
-        "medications": []
+        "medications": [dict(row._mapping) for row in medications]
     }
 
-    for auth in active_authorizations:
-        # Check if administered today
-        administered_logs = [log for log in logs_today if log.authorization_id == auth.id]
-
-        schedule["medications"].append({
-            "authorization_id": str(auth.id),
-            "medication_name": auth.medication_name,
-            "dosage": auth.dosage,
-            "frequency": auth.frequency,
-            "instructions": auth.administration_instructions,
-            "administered": len(administered_logs) > 0,
-            "administration_times": [
-                {
-                    "time": log.administration_time.isoformat(),
-                    "dosage_given": log.dosage_given,
-                    "administered_by": str(log.administered_by)
-                }
-                for log in administered_logs
-            ]
-        })
-
     return schedule
@@ -4,7 +4,7 @@
 from typing import List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 from sqlalchemy import or_
 
 from app.database import get_db
@@ -28,7 +28,7 @@ router = APIRouter()
 # ============================================
 
 @router.post("/", response_model=ParentResponse, status_code=status.HTTP_201_CREATED)
-async def create_parent(
+def create_parent(
     parent_data: ParentCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -47,7 +47,7 @@ async def create_parent(
 
 
 @router.get("/", response_model=List[ParentResponse])
-async def get_parents(
+def get_parents(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     search: Optional[str] = Query(None, description="Search by name, email, or phone"),
@@ -58,7 +58,7 @@ async def get_parents(
     Get paginated list of parents.
     Supports search by name, email, or phone.
     """
-    query = db.query(Parent)
+    query = db.query(Parent).options(raiseload("*"))
 
     # Apply search filter
     if search:
@@ -83,7 +83,7 @@ async def get_parents(
 
 
 @router.get("/{parent_id}", response_model=ParentResponse)
-async def get_parent(
+def get_parent(
     parent_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -91,7 +91,7 @@ async def get_parent(
     """
     Get a specific parent by ID.
     """
-    parent = db.query(Parent).filter(Parent.id == parent_id).first()
+    parent = db.get(Parent, parent_id)
 
     if not parent:
         raise HTTPException(
@@ -103,7 +103,7 @@ async def get_parent(
 
 
 @router.put("/{parent_id}", response_model=ParentResponse)
-async def update_parent(
+def update_parent(
     parent_id: UUID,
     parent_data: ParentUpdate,
     db: Session = Depends(get_db),
@@ -113,7 +113,7 @@ async def update_parent(
     Update a parent's information.
     Only updates fields that are provided.
     """
-    parent = db.query(Parent).filter(Parent.id == parent_id).first()
+    parent = db.get(Parent, parent_id)
 
     if not parent:
         raise HTTPException(
@@ -133,7 +133,7 @@ async def update_parent(
 
 
 @router.delete("/{parent_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_parent(
+def delete_parent(
     parent_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -149,7 +149,7 @@ async def delete_parent(
             detail="Only administrators can delete parent profiles"
         )
 
-    parent = db.query(Parent).filter(Parent.id == parent_id).first()
+    parent = db.get(Parent, parent_id)
 
     if not parent:
         raise HTTPException(
@@ -168,7 +168,7 @@ async def delete_parent(
 # ============================================
 
 @router.post("/relationships/", response_model=ChildParentResponse, status_code=status.HTTP_201_CREATED)
-async def create_child_parent_relationship(
+def create_child_parent_relationship(
     relationship_data: ChildParentCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -176,28 +176,29 @@ async def create_child_parent_relationship(
     """
     Create a relationship between a child and parent.
     """
-    # Verify child exists
-    child = db.query(Child).filter(Child.id == relationship_data.child_id).first()
-    if not child:
+    # Check the child, the parent and an existing link in one round trip
+    checks = db.query(
+        db.query(Child.id).filter(Child.id == relationship_data.child_id).exists(),
+        db.query(Parent.id).filter(Parent.id == relationship_data.parent_id).exists(),
+        db.query(ChildParent.id).filter(
+            ChildParent.child_id == relationship_data.child_id,
+            ChildParent.parent_id == relationship_data.parent_id
+        ).exists()
+    ).one()
+    child_found, parent_found, existing = checks
+
+    if not child_found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Child with ID {relationship_data.child_id} not found"
         )
 
-    # Verify parent exists
-    parent = db.query(Parent).filter(Parent.id == relationship_data.parent_id).first()
-    if not parent:
+    if not parent_found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Parent with ID {relationship_data.parent_id} not found"
         )
 
-    # Check if relationship already exists
-    existing = db.query(ChildParent).filter(
-        ChildParent.child_id == relationship_data.child_id,
-        ChildParent.parent_id == relationship_data.parent_id
-    ).first()
-
     if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -208,13 +209,12 @@ async def create_child_parent_relationship(
 
     db.add(new_relationship)
     db.commit()
-    db.refresh(new_relationship)
 
     return new_relationship
 
 
 @router.get("/relationships/child/{child_id}", response_model=List[ChildParentResponse])
-async def get_child_parents(
+def get_child_parents(
     child_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -223,6 +223,7 @@ async def get_child_parents(
     Get all parents/guardians for a specific child.
     """
     relationships = db.query(ChildParent)\
+        .options(raiseload("*"))\
         .filter(ChildParent.child_id == child_id)\
         .all()
 
@@ -230,7 +231,7 @@ async def get_child_parents(
 
 
 @router.get("/relationships/parent/{parent_id}", response_model=List[ChildParentResponse])
-async def get_parent_children(
+def get_parent_children(
     parent_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -239,6 +240,7 @@ async def get_parent_children(
     Get all children for a specific parent/guardian.
     """
     relationships = db.query(ChildParent)\
+        .options(raiseload("*"))\
         .filter(ChildParent.parent_id == parent_id)\
         .all()
 
@@ -246,7 +248,7 @@ async def get_parent_children(
 
 
 @router.put("/relationships/{relationship_id}", response_model=ChildParentResponse)
-async def update_child_parent_relationship(
+def update_child_parent_relationship(
     relationship_id: UUID,
     relationship_data: ChildParentUpdate,
     db: Session = Depends(get_db),
@@ -256,7 +258,7 @@ async def update_child_parent_relationship(
     Update a child-parent relationship.
     Can update relationship type, custody status, pickup authorization, etc.
     """
-    relationship = db.query(ChildParent).filter(ChildParent.id == relationship_id).first()
+    relationship = db.get(ChildParent, relationship_id)
 
     if not relationship:
         raise HTTPException(
@@ -276,7 +278,7 @@ async def update_child_parent_relationship(
 
 
 @router.delete("/relationships/{relationship_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_child_parent_relationship(
+def delete_child_parent_relationship(
     relationship_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -284,7 +286,7 @@ async def delete_child_parent_relationship(
     """
     Delete a child-parent relationship.
     """
-    relationship = db.query(ChildParent).filter(ChildParent.id == relationship_id).first()
+    relationship = db.get(ChildParent, relationship_id)
 
     if not relationship:
         raise HTTPException(
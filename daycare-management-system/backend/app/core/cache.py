@@ -0,0 +1,226 @@
+# Redis Response Cache
+# ============================================
+
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
+
+import orjson
+import redis
+from pydantic import TypeAdapter
+from sqlalchemy.exc import OperationalError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Endpoint parameters that never influence the cached payload
+_EXCLUDED_PARAMS = {"db", "current_user"}
+
+
+class RedisCache:
+    """
+    JSON cache backed by a shared Redis connection pool.
+    Redis errors are logged and treated as cache misses so the API
+    keeps serving from the database when Redis is unavailable.
+    """
+
+    def __init__(self, url: str, max_connections: int = 20):
+        self._pool = redis.ConnectionPool.from_url(
+            url,
+            max_connections=max_connections,
+            socket_connect_timeout=1,
+            socket_timeout=1,
+        )
+        self._client = redis.Redis(connection_pool=self._pool)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the decoded value for a key, or None on miss"""
+        try:
+            value = self._client.get(key)
+        except redis.RedisError as exc:
+            logger.warning("Cache read failed for %s: %s", key, exc)
+            return None
+        return orjson.loads(value) if value is not None else None
+
+    def set(self, key: str, value: Any, expire: int) -> None:
+        """Store a JSON-serializable value with a TTL in seconds"""
+        try:
+            self._client.setex(key, expire, orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS))
+        except redis.RedisError as exc:
+            logger.warning("Cache write failed for %s: %s", key, exc)
+
+    def delete_pattern(self, pattern: str) -> None:
+        """Invalidate every key matching a glob pattern (e.g. "activities:*")"""
+        try:
+            keys = list(self._client.scan_iter(match=pattern, count=500))
+            if keys:
+                self._client.delete(*keys)
+        except redis.RedisError as exc:
+            logger.warning("Cache invalidation failed for %s: %s", pattern, exc)
+
+
+cache = RedisCache(settings.REDIS_URL)
+
+# Cache keys currently being computed in this process (single-flight)
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _join_or_lead(key: str):
+    """Return (future, is_leader) for a key; the first caller becomes the leader"""
+    with _inflight_lock:
+        future = _inflight.get(key)
+        if future is not None:
+            return future, False
+        future = _inflight[key] = Future()
+        return future, True
+
+
+def _settle(key: str, future: Future, result: Any = None, error: Optional[BaseException] = None) -> None:
+    """Publish the leader's outcome to waiting callers and release the key"""
+    with _inflight_lock:
+        _inflight.pop(key, None)
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+def cached(
+    prefix: str,
+    expire: int = 60,
+    response_model: Any = None,
+    single_flight: bool = False,
+    single_flight_timeout: float = 5,
+    stale_if_error: int = 0
+) -> Callable:
+    """
+    Cache an endpoint's response in Redis.
+
+    Keys are built from the prefix, the endpoint name and a SHA-1 of the
+    sorted query/path parameters, so writes can invalidate a whole group
+    with cache.delete_pattern(f"{prefix}:*").
+
+    Args:
+        prefix: Key namespace shared by related endpoints
+        expire: Time-to-live in seconds
+        response_model: Schema used to serialize ORM results before caching
+        single_flight: Coalesce concurrent misses for the same key so only
+            one caller per process computes the result; the rest wait for it
+        single_flight_timeout: Seconds a waiting caller gives the leader before
+            computing the result itself, so a stalled leader (e.g. waiting on
+            a saturated connection pool) doesn't hold every follower's worker
+        stale_if_error: Keep a copy for this many seconds and serve it when
+            the database is unreachable (OperationalError); 0 disables
+    """
+    adapter = TypeAdapter(response_model) if response_model is not None else None
+
+    def encode(result: Any) -> Any:
+        if adapter is None:
+            return result
+        return adapter.dump_python(
+            adapter.validate_python(result, from_attributes=True),
+            mode="json",
+        )
+
+    def decorator(func: Callable) -> Callable:
+        def build_key(kwargs: dict) -> str:
+            params = sorted(
+                (name, value) for name, value in kwargs.items()
+                if name not in _EXCLUDED_PARAMS
+            )
+            digest = hashlib.sha1(json.dumps(params, default=str).encode()).hexdigest()
+            return f"{prefix}:{func.__name__}:{digest}"
+
+        def store(key: str, payload: Any) -> None:
+            cache.set(key, payload, expire)
+            if stale_if_error:
+                cache.set(f"{key}:stale", payload, stale_if_error)
+
+        def fallback(key: str, exc: OperationalError) -> Any:
+            stale = cache.get(f"{key}:stale") if stale_if_error else None
+            if stale is None:
+                raise exc
+            logger.warning("Serving stale %s after database error: %s", key, exc)
+            return stale
+
+        if inspect.iscoroutinefunction(func):
+            async def compute_async(key, args, kwargs):
+                try:
+                    payload = encode(await func(*args, **kwargs))
+                except OperationalError as exc:
+                    return fallback(key, exc)
+                store(key, payload)
+                return payload
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key = build_key(kwargs)
+                hit = cache.get(key)
+                if hit is not None:
+                    return hit
+                if not single_flight:
+                    return await compute_async(key, args, kwargs)
+
+                future, leader = _join_or_lead(key)
+                if not leader:
+                    try:
+                        # shield: timing out must not cancel the leader's future
+                        return await asyncio.wait_for(
+                            asyncio.shield(asyncio.wrap_future(future)), single_flight_timeout
+                        )
+                    except asyncio.TimeoutError:
+                        logger.warning("Single-flight wait timed out for %s; computing directly", key)
+                        return await compute_async(key, args, kwargs)
+                try:
+                    payload = await compute_async(key, args, kwargs)
+                except BaseException as exc:
+                    _settle(key, future, error=exc)
+                    raise
+                _settle(key, future, result=payload)
+                return payload
+
+            return async_wrapper
+
+        def compute(key, args, kwargs):
+            try:
+                payload = encode(func(*args, **kwargs))
+            except OperationalError as exc:
+                return fallback(key, exc)
+            store(key, payload)
+            return payload
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = build_key(kwargs)
+            hit = cache.get(key)
+            if hit is not None:
+                return hit
+            if not single_flight:
+                return compute(key, args, kwargs)
+
+            future, leader = _join_or_lead(key)
+            if not leader:
+                try:
+                    return future.result(timeout=single_flight_timeout)
+                except FutureTimeoutError:
+                    logger.warning("Single-flight wait timed out for %s; computing directly", key)
+                    return compute(key, args, kwargs)
+            try:
+                payload = compute(key, args, kwargs)
+            except BaseException as exc:
+                _settle(key, future, error=exc)
+                raise
+            _settle(key, future, result=payload)
+            return payload
+
+        return wrapper
+
+    return decorator
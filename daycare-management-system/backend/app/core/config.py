@@ -16,6 +16,11 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 20  # Persistent connections per worker process
+    DB_MAX_OVERFLOW: int = 40  # Extra connections allowed during bursts (e.g. pickup hour)
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a connection is replaced
+    DB_POOL_TIMEOUT: int = 10  # Seconds to wait for a free connection before failing
+    DB_POOL_WARM: int = 5  # Connections opened at startup so first requests skip the handshake
     
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
@@ -61,15 +66,30 @@ class Settings(BaseSettings):
     AGE_RANGE_MAX: str = "12 years"
 
     # Compliance
-    LATE_PICKUP_GRACE_MINUTES: int = 15  # Grace period before late fee
+    # Grace period before late fee. Stored in the attendance late-pickup
+    # generated columns by migration 662abb1855a8; changing it later needs
+    # a new migration that re-creates those columns
+    LATE_PICKUP_GRACE_MINUTES: int = 15
     LATE_PICKUP_FEE_PER_MINUTE: float = 1.00  # $1 per minute after grace
     VACCINE_GRACE_PERIOD_DAYS: int = 30  # New enrollment grace period
     DCFS_LICENSE_NUMBER: str = ""
 
+    # Pagination
+    ALLOW_OFFSET_PAGINATION: bool = True  # Honor legacy ?page= on keyset-paginated lists
+
     # File Upload
     MAX_UPLOAD_SIZE_MB: int = 10
     ALLOWED_FILE_EXTENSIONS: str | List[str] = ".pdf,.jpg,.jpeg,.png,.doc,.docx"
 
+    @field_validator("DATABASE_URL", mode="before")
+    @classmethod
+    def use_psycopg3_driver(cls, v: str) -> str:
+        # Plain postgresql:// URLs default to psycopg2; route them to psycopg 3
+        for prefix in ("postgresql://", "postgres://", "postgresql+psycopg2://"):
+            if isinstance(v, str) and v.startswith(prefix):
+                return "postgresql+psycopg://" + v[len(prefix):]
+        return v
+
     @field_validator("BACKEND_CORS_ORIGINS", mode="before")
     @classmethod
     def assemble_cors_origins(cls, v: str | List[str]) -> List[str]:
@@ -0,0 +1,146 @@
+# Keyset (Seek) Pagination
+# ============================================
+
+import base64
+import json
+from datetime import date, datetime, time
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+
+from app.core.config import settings
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Rebuild typed values from their JSON (ISO string) form
+_PARSERS = {
+    date: date.fromisoformat,
+    datetime: datetime.fromisoformat,
+    time: time.fromisoformat,
+    UUID: UUID,
+}
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """Encode the sort key of the last row as an opaque URL-safe token"""
+    raw = json.dumps(values, default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str, columns: List[Any]) -> List[Any]:
+    """
+    Decode a cursor back into typed values matching the sort columns.
+    Raises 400 if the token was not produced by encode_cursor().
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if len(values) != len(columns):
+            raise ValueError("cursor length mismatch")
+        return [
+            _PARSERS.get(column.type.python_type, lambda v: v)(value)
+            for column, value in zip(columns, values)
+        ]
+    # AttributeError: a non-string value reached a parser (e.g. UUID(5))
+    except (ValueError, TypeError, AttributeError, NotImplementedError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def keyset_page(
+    query: Query,
+    columns: List[Any],
+    cursor: Optional[str],
+    page_size: int,
+    descending: bool = True
+) -> Tuple[list, Optional[str]]:
+    """
+    Return one page of a query ordered by `columns` and the cursor for the next.
+
+    Rows after the cursor are selected with a row-value comparison so
+    every page is an index range scan regardless of depth.
+
+    Args:
+        query: Filtered query to paginate
+        columns: Sort key columns, most significant first; must end with
+            a unique column (usually the primary key) as tie-breaker
+        cursor: Token returned for the previous page, if any
+        page_size: Maximum rows to return
+        descending: Sort direction applied to every column
+
+    Returns:
+        (rows, next_cursor) - next_cursor is None on the last page
+    """
+    if cursor:
+        key = tuple_(*columns)
+        after = tuple_(*decode_cursor(cursor, columns))
+        query = query.filter(key < after if descending else key > after)
+
+    order = [column.desc() if descending else column.asc() for column in columns]
+    rows = query.order_by(*order)\
+                .limit(page_size + 1)\
+                .all()
+
+    if len(rows) <= page_size:
+        return rows, None
+
+    rows = rows[:page_size]
+    last = rows[-1]
+    return rows, encode_cursor([getattr(last, column.key) for column in columns])
+
+
+def require_offset_pagination() -> None:
+    """
+    Reject the legacy ?page= parameter with 400 once ALLOW_OFFSET_PAGINATION
+    is off, so an old client fails loudly instead of receiving the first
+    page for every page number.
+    """
+    if not settings.ALLOW_OFFSET_PAGINATION:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The page parameter is no longer supported; follow the next cursor instead"
+        )
+
+
+def offset_page(
+    query: Query,
+    columns: List[Any],
+    page: int,
+    page_size: int,
+    descending: bool = True
+) -> list:
+    """
+    Return one page of a keyset-paginated query by page number, for
+    clients that still send the legacy ?page= parameter. Rows come in the
+    same order as keyset_page. See require_offset_pagination().
+    """
+    require_offset_pagination()
+
+    order = [column.desc() if descending else column.asc() for column in columns]
+    return query.order_by(*order)\
+                .offset((page - 1) * page_size)\
+                .limit(page_size)\
+                .all()
+
+
+def keyset_paginate(
+    query: Query,
+    columns: List[Any],
+    cursor: Optional[str],
+    page_size: int,
+    response: Response,
+    descending: bool = True
+) -> list:
+    """
+    Return one page of a query (see keyset_page) for endpoints that return
+    a bare list. The next page's cursor is sent in the X-Next-Cursor
+    header, which is absent on the last page.
+    """
+    rows, next_cursor = keyset_page(query, columns, cursor, page_size, descending)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return rows
@@ -1,13 +1,16 @@
 # Security Utilities (Password Hashing, JWT Tokens)
 # ============================================
 
+import hashlib
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Optional
+from cachetools import TTLCache
 from passlib.context import CryptContext
 from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
 from app.core.config import settings
 
 # Password hashing context
@@ -21,6 +24,12 @@ pwd_context = CryptContext(
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_PREFIX}/auth/login")
 
+# blake2b(token) -> (detached User, token exp). Per-process and short-lived,
+# so a deactivated account is locked out within USER_CACHE_TTL seconds.
+USER_CACHE_TTL = 30
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL)
+_user_cache_lock = threading.Lock()
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password"""
@@ -73,16 +82,16 @@ def decode_access_token(token: str) -> Optional[dict]:
         return None
 
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(lambda: None)
-):
+def get_current_user(token: str = Depends(oauth2_scheme)):
     """
     Get the current authenticated user from the JWT token.
 
+    Resolved users are cached by token for USER_CACHE_TTL seconds, so
+    repeat requests skip both JWT verification and the user query. The
+    cached User is detached: its columns are loaded, relationships are not.
+
     Args:
         token: JWT token from Authorization header
-        db: Database session
 
     Returns:
         User object
@@ -90,12 +99,14 @@ async def get_current_user(
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    from app.database import get_db
+    from app.database import SessionLocal
     from app.models.user import User
 
-    # Get db session if not provided by dependency
-    if db is None:
-        db = next(get_db())
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    with _user_cache_lock:
+        hit = _user_cache.get(key)
+    if hit is not None and hit[1] > time.time():
+        return hit[0]
 
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -111,7 +122,9 @@ async def get_current_user(
     if email is None:
         raise credentials_exception
 
-    user = db.query(User).filter(User.email == email).first()
+    # Own short-lived session; closing it leaves the user detached but loaded
+    with SessionLocal() as session:
+        user = session.query(User).filter(User.email == email).first()
     if user is None:
         raise credentials_exception
 
@@ -121,4 +134,21 @@ async def get_current_user(
             detail="User account is inactive"
         )
 
+    with _user_cache_lock:
+        _user_cache[key] = (user, payload.get("exp", 0))
     return user
+
+
+def require_admin(current_user=Depends(get_current_user)):
+    """
+    Allow only administrators through.
+    Resolved before the endpoint body runs, so forbidden requests never reach the database.
+
+    Usage: current_user: User = Depends(require_admin)
+    """
+    if current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only administrators can perform this action"
+        )
+    return current_user
@@ -0,0 +1,93 @@
+# SQL Expression Helpers
+# ============================================
+
+from sqlalchemy import Boolean, Float, Integer
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class days_between(FunctionElement):
+    """
+    Whole days from `start` to `end` (end - start), computed in the database.
+
+    PostgreSQL subtracts dates natively; SQLite (used by the tests) needs
+    julianday() since it stores dates as text.
+    """
+    type = Integer()
+    name = "days_between"
+    inherit_cache = True
+
+
+@compiles(days_between)
+def _days_between_default(element, compiler, **kw):
+    start, end = element.clauses
+    return f"({compiler.process(end, **kw)} - {compiler.process(start, **kw)})"
+
+
+@compiles(days_between, "sqlite")
+def _days_between_sqlite(element, compiler, **kw):
+    start, end = element.clauses
+    return (
+        f"CAST(julianday({compiler.process(end, **kw)}) - "
+        f"julianday({compiler.process(start, **kw)}) AS INTEGER)"
+    )
+
+
+class hours_since(FunctionElement):
+    """
+    Hours elapsed from a local `day` + `time_of_day` until `now`, as a float.
+
+    Pass the app's datetime.now() as `now` rather than relying on the
+    database clock, whose session time zone may differ from the app's.
+    SQLite again goes through julianday(), which counts in days.
+    """
+    type = Float()
+    name = "hours_since"
+    inherit_cache = True
+
+
+@compiles(hours_since)
+def _hours_since_default(element, compiler, **kw):
+    day, time_of_day, now = element.clauses
+    return (
+        f"CAST(EXTRACT(EPOCH FROM ({compiler.process(now, **kw)} - ({compiler.process(day, **kw)} + "
+        f"{compiler.process(time_of_day, **kw)}))) AS DOUBLE PRECISION) / 3600"
+    )
+
+
+@compiles(hours_since, "sqlite")
+def _hours_since_sqlite(element, compiler, **kw):
+    day, time_of_day, now = element.clauses
+    return (
+        f"((julianday({compiler.process(now, **kw)}) - julianday({compiler.process(day, **kw)} || ' ' || "
+        f"{compiler.process(time_of_day, **kw)})) * 24)"
+    )
+
+
+class date_in_period(FunctionElement):
+    """
+    True when `day` falls within [start, end]; a NULL end is open-ended.
+
+    PostgreSQL tests containment in a daterange, which a GiST index on the
+    same expression can answer (see ix_medauth_active_range). A period that
+    ends before it starts is the empty range rather than an error. Other
+    databases get the equivalent pair of comparisons.
+    """
+    type = Boolean()
+    name = "date_in_period"
+    inherit_cache = True
+
+
+@compiles(date_in_period, "postgresql")
+def _date_in_period_postgresql(element, compiler, **kw):
+    day, start, end = (compiler.process(clause, **kw) for clause in element.clauses)
+    return (
+        f"((CASE WHEN {end} < {start} THEN 'empty'::daterange "
+        f"ELSE daterange({start}, {end}, '[]') END) @> {day})"
+    )
+
+
+@compiles(date_in_period)
+def _date_in_period_default(element, compiler, **kw):
+    day, start, end = (compiler.process(clause, **kw) for clause in element.clauses)
+    return f"({start} <= {day} AND ({end} IS NULL OR {end} >= {day}))"
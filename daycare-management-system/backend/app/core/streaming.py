@@ -0,0 +1,73 @@
+# Streaming Responses
+# ============================================
+
+from typing import Any, Callable, Dict
+
+import orjson
+from fastapi.responses import StreamingResponse
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Query, Session
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+JSON_MEDIA_TYPE = "application/json"
+
+
+def _stream_rows(bind, build_query, chunk_size: int):
+    """Run the query on a fresh session and yield rows from a server-side cursor"""
+    with Session(bind=bind) as session:
+        yield from build_query(session)\
+            .execution_options(stream_results=True)\
+            .yield_per(chunk_size)
+
+
+def ndjson_response(
+    db: Session,
+    build_query: Callable[[Session], Query],
+    serialize: Callable[[Row], Dict[str, Any]],
+    chunk_size: int = 500
+) -> StreamingResponse:
+    """
+    Stream a query as newline-delimited JSON, one object per row.
+
+    Rows are fetched through a server-side cursor in chunks of
+    `chunk_size`, so memory stays flat however large the report grows.
+    The request session is closed before the body is sent, so the query
+    is built and run on a fresh session bound to the same engine.
+
+    Args:
+        db: Request session (only its engine is used)
+        build_query: Builds the query to stream on the given session
+        serialize: Turns one result row into a JSON-serializable dict
+        chunk_size: Rows fetched per round trip
+    """
+    bind = db.get_bind()
+
+    def generate():
+        for row in _stream_rows(bind, build_query, chunk_size):
+            yield orjson.dumps(serialize(row)) + b"\n"
+
+    return StreamingResponse(generate(), media_type=NDJSON_MEDIA_TYPE)
+
+
+def json_array_response(
+    db: Session,
+    build_query: Callable[[Session], Query],
+    serialize: Callable[[Row], Dict[str, Any]],
+    chunk_size: int = 500
+) -> StreamingResponse:
+    """
+    Stream a query as a single JSON array, for endpoints whose callers
+    parse the whole body with response.json(). Same arguments and
+    session handling as ndjson_response.
+    """
+    bind = db.get_bind()
+
+    def generate():
+        yield b"["
+        for index, row in enumerate(_stream_rows(bind, build_query, chunk_size)):
+            if index:
+                yield b","
+            yield orjson.dumps(serialize(row))
+        yield b"]"
+
+    return StreamingResponse(generate(), media_type=JSON_MEDIA_TYPE)
@@ -1,13 +1,17 @@
 # FastAPI Dependencies (Auth, Database, etc.)
 # ============================================
 
-from typing import Optional
+import threading
+from typing import Optional, Tuple
+from uuid import UUID
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.core.security import decode_access_token
 from app.models.user import User
+from app.models.child import Child
 
 security = HTTPBearer()
 
@@ -64,4 +68,65 @@ async def get_current_admin_user(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions. Admin access required."
         )
-    return current_user
\ No newline at end of file
+    return current_user
+
+
+# child_id -> (first_name, last_name), or None for unknown IDs.
+# Per-process and short-lived; children endpoints invalidate on writes.
+_child_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_child_cache_lock = threading.Lock()
+
+
+def _lookup_child(db: Session, child_id: UUID) -> Optional[Tuple[str, str]]:
+    """Return the child's (first_name, last_name), consulting the TTL cache first"""
+    with _child_cache_lock:
+        if child_id in _child_cache:
+            return _child_cache[child_id]
+
+    row = db.query(Child.first_name, Child.last_name).filter(Child.id == child_id).first()
+    names = (row.first_name, row.last_name) if row else None
+
+    with _child_cache_lock:
+        _child_cache[child_id] = names
+    return names
+
+
+def invalidate_child_cache(child_id: UUID) -> None:
+    """Drop a cached child lookup after the child is created, changed or deleted"""
+    with _child_cache_lock:
+        _child_cache.pop(child_id, None)
+
+
+def child_exists(db: Session, child_id: UUID) -> bool:
+    """Check for a child with a single uncached EXISTS probe"""
+    return db.query(db.query(Child.id).filter(Child.id == child_id).exists()).scalar()
+
+
+def user_exists(db: Session, user_id: UUID) -> bool:
+    """Check for a user with a single EXISTS probe"""
+    return db.query(db.query(User.id).filter(User.id == user_id).exists()).scalar()
+
+
+def ensure_child_exists(db: Session, child_id: UUID) -> None:
+    """
+    Raise 404 unless the child exists.
+    Results are cached for a minute, so repeat calls skip the database.
+    """
+    if _lookup_child(db, child_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Child with ID {child_id} not found"
+        )
+
+
+def get_child_name(db: Session, child_id: UUID) -> str:
+    """
+    Return the child's full name, raising 404 if the child does not exist.
+    """
+    names = _lookup_child(db, child_id)
+    if names is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Child with ID {child_id} not found"
+        )
+    return f"{names[0]} {names[1]}"
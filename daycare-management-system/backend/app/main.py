@@ -3,16 +3,32 @@
 # FastAPI Application Entry Point
 
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.core.config import settings
 from app.api.v1.router import api_router
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.database import pool_stats, warm_pool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Pre-open database connections before serving traffic"""
+    await run_in_threadpool(warm_pool)
+    yield
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description="Daycare Management System for Netta's Bounce Around Daycare LLC - Chicago, IL",
     version="1.0.0",
-    openapi_url=f"{settings.API_V1_PREFIX}/openapi.json"
+    openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS Configuration - Allow frontend to connect
@@ -22,6 +38,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let browser clients read the keyset pagination cursor and ETags
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
 )
 
 # Include API routes
@@ -41,3 +59,8 @@ async def root():
 async def health_check():
     """Health check for monitoring"""
     return {"status": "healthy"}
+
+@app.get("/metrics")
+async def metrics():
+    """Connection pool usage for monitoring"""
+    return {"db_pool": pool_stats()}
@@ -1,7 +1,7 @@
 # Children & Family Models
 # ============================================
 
-from sqlalchemy import Column, String, Date, Boolean, Text, ForeignKey, Integer
+from sqlalchemy import Column, String, Date, Boolean, Text, ForeignKey, Integer, Index, UniqueConstraint, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.models.base import BaseModel
@@ -12,6 +12,17 @@ class Child(BaseModel):
     Core child profiles with medical and allergy information.
     """
     __tablename__ = "children"
+    __table_args__ = (
+        # Trigram indexes serve ILIKE '%term%' name searches
+        Index("idx_children_first_name_trgm", "first_name",
+              postgresql_using="gin", postgresql_ops={"first_name": "gin_trgm_ops"}),
+        Index("idx_children_last_name_trgm", "last_name",
+              postgresql_using="gin", postgresql_ops={"last_name": "gin_trgm_ops"}),
+        # Serves single-predicate "First Last" searches
+        Index("idx_children_full_name_trgm",
+              func.lower(text("first_name || ' ' || last_name")).label("full_name"),
+              postgresql_using="gin", postgresql_ops={"full_name": "gin_trgm_ops"}),
+    )
 
     first_name = Column(String(100), nullable=False)
     last_name = Column(String(100), nullable=False)
@@ -51,6 +62,18 @@ class Parent(BaseModel):
     Parent and guardian contact information.
     """
     __tablename__ = "parents"
+    __table_args__ = (
+        # Trigram indexes serve the ILIKE '%term%' search; the planner
+        # BitmapOrs them for the four-column OR filter
+        Index("idx_parents_first_name_trgm", "first_name",
+              postgresql_using="gin", postgresql_ops={"first_name": "gin_trgm_ops"}),
+        Index("idx_parents_last_name_trgm", "last_name",
+              postgresql_using="gin", postgresql_ops={"last_name": "gin_trgm_ops"}),
+        Index("idx_parents_email_trgm", "email",
+              postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}),
+        Index("idx_parents_phone_primary_trgm", "phone_primary",
+              postgresql_using="gin", postgresql_ops={"phone_primary": "gin_trgm_ops"}),
+    )
 
     first_name = Column(String(100), nullable=False)
     last_name = Column(String(100), nullable=False)
@@ -98,8 +121,12 @@ class EmergencyContact(BaseModel):
     DCFS requires minimum 2 emergency contacts per child.
     """
     __tablename__ = "emergency_contacts"
+    __table_args__ = (
+        # Also the index for listing a child's contacts in priority order
+        UniqueConstraint("child_id", "priority_order", name="uq_contact_priority"),
+    )
 
-    child_id = Column(UUID(as_uuid=True), ForeignKey("children.id"), nullable=False, index=True)
+    child_id = Column(UUID(as_uuid=True), ForeignKey("children.id"), nullable=False)
     name = Column(String(255), nullable=False)
     relationship_type = Column(String(100), nullable=False)
     phone_primary = Column(String(20), nullable=False)
@@ -119,6 +146,20 @@ class AuthorizedPickup(BaseModel):
     List of people authorized to pick up each child with photo verification.
     """
     __tablename__ = "authorized_pickup"
+    __table_args__ = (
+        Index("idx_authorized_pickup_name_trgm", "name",
+              postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        # Partial indexes cover only active rows, which is all the pickup lists read
+        Index("idx_authorized_pickup_active_name", "name", "id",
+              postgresql_where=text("is_active")),
+        Index("idx_authorized_pickup_active_no_photo", "created_at",
+              postgresql_where=text("is_active AND photo_url IS NULL")),
+        # Serves anchored LIKE 'prefix%' searches on the lowercased name
+        Index("idx_authorized_pickup_name_lower_pattern",
+              func.lower(text("name")).label("lower_name"),
+              postgresql_ops={"lower_name": "text_pattern_ops"},
+              postgresql_where=text("is_active")),
+    )
 
     child_id = Column(UUID(as_uuid=True), ForeignKey("children.id"), nullable=False, index=True)
     name = Column(String(255), nullable=False)
@@ -1,8 +1,10 @@
 # DCFS Compliance Models
 # ============================================
 
-from sqlalchemy import Column, String, Date, Boolean, Text, ForeignKey, DateTime, JSON
+from datetime import date
+from sqlalchemy import Column, String, Date, Boolean, Text, ForeignKey, DateTime, JSON, Index, and_, func, text
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from app.models.base import BaseModel
 
@@ -36,11 +38,16 @@ class ImmunizationRecord(BaseModel):
     Vaccination records with expiration tracking for DCFS compliance.
     """
     __tablename__ = "immunization_records"
+    __table_args__ = (
+        # Only dated records can expire; serves the expiring-soon range scan
+        Index("idx_immunizations_expiring", "expiration_date",
+              postgresql_where=text("expiration_date IS NOT NULL")),
+    )
 
     child_id = Column(UUID(as_uuid=True), ForeignKey("children.id"), nullable=False, index=True)
     vaccine_name = Column(String(255), nullable=False, index=True)
     administration_date = Column(Date, nullable=False)
-    expiration_date = Column(Date, index=True)
+    expiration_date = Column(Date)
     document_url = Column(String(500))
     provider_name = Column(String(255))
     notes = Column(Text)
@@ -58,18 +65,32 @@ class StaffCredential(BaseModel):
     Staff certifications and credentials required by DCFS (CPR, First Aid, etc).
     """
     __tablename__ = "staff_credentials"
-
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    __table_args__ = (
+        # Serves the per-user listing ordered by expiration (ASC is NULLS LAST)
+        Index("idx_staff_credentials_user_expiration", "user_id", "expiration_date"),
+        Index("idx_staff_credentials_expiring", "expiration_date",
+              postgresql_where=text("expiration_date IS NOT NULL")),
+    )
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     credential_type = Column(String(100), nullable=False, index=True)  # CPR, First Aid, Background Check, TB Test, DCFS Training
     credential_number = Column(String(100))
     issue_date = Column(Date, nullable=False)
-    expiration_date = Column(Date, index=True)
+    expiration_date = Column(Date)
     document_url = Column(String(500))
     is_verified = Column(Boolean, default=False, nullable=False)
-    is_expired = Column(Boolean, default=False, nullable=False, index=True)
 
     # Relationships
     user = relationship("User", back_populates="credentials")
 
+    @hybrid_property
+    def is_expired(self) -> bool:
+        """Derived from expiration_date so it can never go stale"""
+        return self.expiration_date is not None and self.expiration_date < date.today()
+
+    @is_expired.expression
+    def is_expired(cls):
+        return and_(cls.expiration_date.isnot(None), cls.expiration_date < func.current_date())
+
     def __repr__(self):
         return f"<StaffCredential {self.credential_type} for user_id={self.user_id}>"
@@ -1,8 +1,8 @@
 # Daily Operations Models
 # ============================================
 
-from sqlalchemy import Column, String, Date, Boolean, Text, ForeignKey, Integer, Time, DateTime
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Date, Boolean, Text, ForeignKey, Integer, Time, DateTime, Enum, FetchedValue, Index, UniqueConstraint, table, column, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.orm import relationship
 from app.models.base import BaseModel
 
@@ -12,6 +12,12 @@ class Attendance(BaseModel):
     Daily attendance tracking with electronic signatures for DCFS compliance.
     """
     __tablename__ = "attendance"
+    __table_args__ = (
+        UniqueConstraint("child_id", "attendance_date", name="uq_attendance_child_day"),
+        Index("ix_attendance_child_date", "child_id", text("attendance_date DESC")),
+        Index("ix_attendance_open", "attendance_date", postgresql_where=text("check_out_time IS NULL")),
+        Index("ix_attendance_late_gen", "attendance_date", postgresql_where=text("late_pickup_minutes > 0")),
+    )
 
     child_id = Column(UUID(as_uuid=True), ForeignKey("children.id"), nullable=False, index=True)
     attendance_date = Column(Date, nullable=False, index=True)
@@ -21,8 +27,11 @@ class Attendance(BaseModel):
     check_out_time = Column(Time)
     check_out_by_name = Column(String(255))
     check_out_signature_url = Column(String(500))
-    is_late_pickup = Column(Boolean, default=False, nullable=False)
-    late_pickup_minutes = Column(Integer, default=0, nullable=False)
+    # Generated from check_out_time in PostgreSQL (6:00 PM pickup, grace period from
+    # LATE_PICKUP_GRACE_MINUTES when migration 662abb1855a8 ran);
+    # the server defaults only apply to schemas created from metadata (tests)
+    is_late_pickup = Column(Boolean, server_default=text("false"), server_onupdate=FetchedValue(), nullable=False)
+    late_pickup_minutes = Column(Integer, server_default=text("0"), server_onupdate=FetchedValue(), nullable=False)
     notes = Column(Text)
     recorded_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
 
@@ -39,14 +48,21 @@ class Activity(BaseModel):
     Daily activity logs (meals, naps, diaper changes) used for AI report generation.
     """
     __tablename__ = "activities"
+    __table_args__ = (
+        Index("ix_activities_child_date_time", "child_id", text("activity_date DESC"), text("activity_time DESC")),
+    )
 
     child_id = Column(UUID(as_uuid=True), ForeignKey("children.id"), nullable=False, index=True)
     activity_date = Column(Date, nullable=False, index=True)
     activity_time = Column(DateTime, nullable=False)
-    activity_type = Column(String(50), nullable=False, index=True)  # meal, nap, diaper, play, learning, outdoor
+    activity_type = Column(
+        Enum("meal", "nap", "diaper", "play", "learning", "outdoor", name="activity_type_enum"),
+        nullable=False,
+        index=True
+    )
     activity_name = Column(String(255), nullable=False)
     description = Column(Text)
-    mood = Column(String(50))  # happy, sad, energetic, tired, cranky, neutral
+    mood = Column(Enum("happy", "sad", "energetic", "tired", "cranky", "neutral", name="activity_mood_enum"))
     duration_minutes = Column(Integer)
     notes = Column(Text)
     logged_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -59,6 +75,22 @@ class Activity(BaseModel):
         return f"<Activity {self.activity_type} for child_id={self.child_id} on {self.activity_date}>"
 
 
+# Read-only materialized view maintained by Alembic (not part of Base.metadata)
+# One pre-aggregated row per child per day, refreshed after activity writes.
+daily_activity_summary_view = table(
+    "mv_daily_activity_summary",
+    column("child_id", UUID(as_uuid=True)),
+    column("activity_date", Date),
+    column("total", Integer),
+    column("type_counts", JSONB),
+    column("total_nap_minutes", Integer),
+    column("meal_count", Integer),
+    column("diaper_count", Integer),
+    column("moods", ARRAY(String)),
+    column("predominant_mood", String),
+)
+
+
 class Photo(BaseModel):
     """
     Photo storage with metadata for daily reports and documentation.
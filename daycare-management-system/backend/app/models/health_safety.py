@@ -1,7 +1,7 @@
 # Health & Safety Models
 # ============================================
 
-from sqlalchemy import Column, String, Date, Boolean, Text, ForeignKey, Time, DateTime
+from sqlalchemy import Column, String, Date, Boolean, Text, ForeignKey, Time, DateTime, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.models.base import BaseModel
@@ -12,11 +12,22 @@ class IncidentReport(BaseModel):
     DCFS Form 337 - Incident and Accident Reports with required notifications.
     """
     __tablename__ = "incident_reports"
-
-    child_id = Column(UUID(as_uuid=True), ForeignKey("children.id"), nullable=False, index=True)
-    incident_date = Column(Date, nullable=False, index=True)
+    __table_args__ = (
+        # Keyset pagination order for the incident list
+        Index("ix_incident_date_time_id", text("incident_date DESC"), text("incident_time DESC"), text("id DESC")),
+        Index("ix_incident_child_date", "child_id", text("incident_date DESC"), text("incident_time DESC")),
+        Index("ix_incident_type_date", "incident_type", text("incident_date DESC")),
+        # Partial indexes for the parent and DCFS notification worklists
+        Index("ix_incident_pending_parent", text("incident_date DESC"), text("incident_time DESC"),
+              postgresql_where=text("parent_notified = false")),
+        Index("ix_incident_dcfs_required", text("incident_date DESC"),
+              postgresql_where=text("dcfs_notification_required = true")),
+    )
+
+    child_id = Column(UUID(as_uuid=True), ForeignKey("children.id"), nullable=False)
+    incident_date = Column(Date, nullable=False)
     incident_time = Column(Time, nullable=False)
-    incident_type = Column(String(50), nullable=False, index=True)  # injury, illness, behavioral, accident, other
+    incident_type = Column(String(50), nullable=False)  # injury, illness, behavioral, accident, other
     description = Column(Text, nullable=False)
     circumstances = Column(Text, nullable=False)
     injury_description = Column(Text)
@@ -27,7 +38,7 @@ class IncidentReport(BaseModel):
     parent_notified = Column(Boolean, default=False, nullable=False)
     parent_notified_at = Column(DateTime)
     parent_notification_method = Column(String(50))  # phone, email, in-person, sms
-    dcfs_notification_required = Column(Boolean, default=False, nullable=False, index=True)
+    dcfs_notification_required = Column(Boolean, default=False, nullable=False)
     dcfs_notified_at = Column(DateTime)
     staff_signature_url = Column(String(500))
     staff_signed_at = Column(DateTime)
@@ -46,6 +57,15 @@ class MedicationAuthorization(BaseModel):
     Parent authorization for medication administration - DCFS required.
     """
     __tablename__ = "medication_authorizations"
+    __table_args__ = (
+        # Keyset pagination order for the authorization list
+        Index("ix_medauth_start_id", text("start_date DESC"), text("id DESC")),
+        # Active-on-a-date lookups; must match the expression date_in_period() emits
+        Index("ix_medauth_active_range",
+              text("(CASE WHEN end_date < start_date THEN 'empty'::daterange "
+                   "ELSE daterange(start_date, end_date, '[]') END)"),
+              postgresql_using="gist", postgresql_where=text("is_active")).ddl_if(dialect="postgresql"),
+    )
 
     child_id = Column(UUID(as_uuid=True), ForeignKey("children.id"), nullable=False, index=True)
     medication_name = Column(String(255), nullable=False)
@@ -57,7 +77,7 @@ class MedicationAuthorization(BaseModel):
     prescribing_doctor = Column(String(255))
     parent_signature_url = Column(String(500))
     parent_signed_at = Column(DateTime)
-    is_active = Column(Boolean, default=True, nullable=False, index=True)
+    is_active = Column(Boolean, default=True, nullable=False)
 
     # Relationships
     child = relationship("Child", back_populates="medication_authorizations")
@@ -72,9 +92,16 @@ class MedicationLog(BaseModel):
     Log of actual medication administration with staff signatures.
     """
     __tablename__ = "medication_logs"
-
-    child_id = Column(UUID(as_uuid=True), ForeignKey("children.id"), nullable=False, index=True)
-    authorization_id = Column(UUID(as_uuid=True), ForeignKey("medication_authorizations.id"), nullable=False, index=True)
+    __table_args__ = (
+        # Keyset pagination order for the per-child and per-authorization histories
+        Index("ix_medlog_child_date_time_id", "child_id",
+              text("administration_date DESC"), text("administration_time DESC"), text("id DESC")),
+        Index("ix_medlog_auth_date_time_id", "authorization_id",
+              text("administration_date DESC"), text("administration_time DESC"), text("id DESC")),
+    )
+
+    child_id = Column(UUID(as_uuid=True), ForeignKey("children.id"), nullable=False)
+    authorization_id = Column(UUID(as_uuid=True), ForeignKey("medication_authorizations.id"), nullable=False)
     administration_date = Column(Date, nullable=False, index=True)
     administration_time = Column(Time, nullable=False)
     dosage_given = Column(String(100), nullable=False)
@@ -1,10 +1,10 @@
 # Children & Family Schemas
 # ============================================
 
-from datetime import date
+from datetime import date, datetime
 from typing import Optional, List
 from uuid import UUID
-from pydantic import BaseModel, EmailStr, field_validator
+from pydantic import BaseModel, EmailStr, field_validator, model_validator
 
 
 # ============================================
@@ -52,8 +52,8 @@ class ChildResponse(ChildBase):
     """Schema for child response"""
     id: UUID
     created_by: Optional[UUID] = None
-    created_at: date
-    updated_at: date
+    created_at: datetime
+    updated_at: datetime
 
     class Config:
         from_attributes = True
@@ -63,8 +63,9 @@ class ChildListResponse(BaseModel):
     """Schema for paginated child list"""
     children: List[ChildResponse]
     total: int
-    page: int
+    page: Optional[int] = None  # Only set for legacy offset pagination
     page_size: int
+    next_cursor: Optional[str] = None
 
 
 # ============================================
@@ -111,8 +112,8 @@ class ParentUpdate(BaseModel):
 class ParentResponse(ParentBase):
     """Schema for parent response"""
     id: UUID
-    created_at: date
-    updated_at: date
+    created_at: datetime
+    updated_at: datetime
 
     class Config:
         from_attributes = True
@@ -148,7 +149,7 @@ class ChildParentUpdate(BaseModel):
 class ChildParentResponse(ChildParentBase):
     """Schema for child-parent relationship response"""
     id: UUID
-    created_at: date
+    created_at: datetime
 
     class Config:
         from_attributes = True
@@ -183,12 +184,20 @@ class EmergencyContactUpdate(BaseModel):
     priority_order: Optional[int] = None
     notes: Optional[str] = None
 
+    @field_validator("name", "relationship_type", "phone_primary", "priority_order")
+    @classmethod
+    def reject_null(cls, value):
+        # Omit a field to leave it unchanged; these columns cannot be cleared
+        if value is None:
+            raise ValueError("cannot be null")
+        return value
+
 
 class EmergencyContactResponse(EmergencyContactBase):
     """Schema for emergency contact response"""
     id: UUID
-    created_at: date
-    updated_at: date
+    created_at: datetime
+    updated_at: datetime
 
     class Config:
         from_attributes = True
@@ -231,8 +240,44 @@ class AuthorizedPickupUpdate(BaseModel):
 class AuthorizedPickupResponse(AuthorizedPickupBase):
     """Schema for authorized pickup response"""
     id: UUID
-    created_at: date
-    updated_at: date
+    created_at: datetime
+    updated_at: datetime
 
     class Config:
         from_attributes = True
+
+
+class VerifiedPickupPerson(BaseModel):
+    """Authorized pickup details shown to staff at the door"""
+    id: UUID
+    name: str
+    relationship_type: str
+    phone: str
+    photo_url: Optional[str] = None
+    requires_password: bool
+    password_hint: Optional[str] = None
+    identification_notes: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+    @model_validator(mode="after")
+    def hide_unused_password_hint(self):
+        # A hint is only meaningful when a password is actually required
+        if not self.requires_password:
+            self.password_hint = None
+        return self
+
+
+class VerifyPickupResponse(BaseModel):
+    """
+    Schema for pickup verification.
+    pickup_person is set when authorized; pickup_name echoes the
+    searched name when not.
+    """
+    authorized: bool
+    child_id: UUID
+    child_name: str
+    pickup_name: Optional[str] = None
+    pickup_person: Optional[VerifiedPickupPerson] = None
+    message: str
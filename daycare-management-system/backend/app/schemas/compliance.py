@@ -2,9 +2,9 @@
 # ============================================
 
 from datetime import date, datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from uuid import UUID
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 # ============================================
@@ -71,6 +71,11 @@ class ImmunizationRecordCreate(ImmunizationRecordBase):
     pass
 
 
+class ImmunizationRecordBulkCreate(BaseModel):
+    """Schema for backfilling several immunization records at once"""
+    records: List[ImmunizationRecordCreate] = Field(..., min_length=1, max_length=500)
+
+
 class ImmunizationRecordUpdate(BaseModel):
     """Schema for updating an immunization record"""
     vaccine_name: Optional[str] = None
@@ -105,7 +110,6 @@ class StaffCredentialBase(BaseModel):
     expiration_date: Optional[date] = None
     document_url: Optional[str] = None
     is_verified: bool = False
-    is_expired: bool = False
 
 
 class StaffCredentialCreate(StaffCredentialBase):
@@ -113,6 +117,11 @@ class StaffCredentialCreate(StaffCredentialBase):
     pass
 
 
+class StaffCredentialBulkCreate(BaseModel):
+    """Schema for adding several staff credentials at once"""
+    credentials: List[StaffCredentialCreate] = Field(..., min_length=1, max_length=500)
+
+
 class StaffCredentialUpdate(BaseModel):
     """Schema for updating a staff credential"""
     credential_type: Optional[str] = None
@@ -121,12 +130,12 @@ class StaffCredentialUpdate(BaseModel):
     expiration_date: Optional[date] = None
     document_url: Optional[str] = None
     is_verified: Optional[bool] = None
-    is_expired: Optional[bool] = None
 
 
 class StaffCredentialResponse(StaffCredentialBase):
     """Schema for staff credential response"""
     id: UUID
+    is_expired: bool
     created_at: datetime
     updated_at: datetime
 
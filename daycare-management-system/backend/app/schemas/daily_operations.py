@@ -2,7 +2,7 @@
 # ============================================
 
 from datetime import date, datetime, time
-from typing import Optional
+from typing import Literal, Optional
 from uuid import UUID
 from pydantic import BaseModel
 
@@ -58,15 +58,19 @@ class AttendanceResponse(AttendanceBase):
 # ACTIVITY SCHEMAS
 # ============================================
 
+ActivityType = Literal["meal", "nap", "diaper", "play", "learning", "outdoor"]
+ActivityMood = Literal["happy", "sad", "energetic", "tired", "cranky", "neutral"]
+
+
 class ActivityBase(BaseModel):
     """Base activity schema"""
     child_id: UUID
     activity_date: date
     activity_time: datetime
-    activity_type: str  # meal, nap, diaper, play, learning, outdoor
+    activity_type: ActivityType
     activity_name: str
     description: Optional[str] = None
-    mood: Optional[str] = None  # happy, sad, energetic, tired, cranky, neutral
+    mood: Optional[ActivityMood] = None
     duration_minutes: Optional[int] = None
     notes: Optional[str] = None
 
@@ -78,10 +82,10 @@ class ActivityCreate(ActivityBase):
 
 class ActivityUpdate(BaseModel):
     """Schema for updating an activity"""
-    activity_type: Optional[str] = None
+    activity_type: Optional[ActivityType] = None
     activity_name: Optional[str] = None
     description: Optional[str] = None
-    mood: Optional[str] = None
+    mood: Optional[ActivityMood] = None
     duration_minutes: Optional[int] = None
     notes: Optional[str] = None
 
@@ -96,6 +100,21 @@ class ActivityResponse(ActivityBase):
         from_attributes = True
 
 
+class ActivityListItem(BaseModel):
+    """Compact activity row for list endpoints"""
+    id: UUID
+    child_id: UUID
+    activity_date: date
+    activity_time: datetime
+    activity_type: ActivityType
+    activity_name: str
+    mood: Optional[ActivityMood] = None
+    duration_minutes: Optional[int] = None
+
+    class Config:
+        from_attributes = True
+
+
 # ============================================
 # PHOTO SCHEMAS
 # ============================================
@@ -2,21 +2,24 @@
 # ============================================
 
 from datetime import date, datetime, time
-from typing import Optional
+from typing import List, Literal, Optional
 from uuid import UUID
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 # ============================================
 # INCIDENT REPORT SCHEMAS
 # ============================================
 
+IncidentType = Literal["injury", "illness", "behavioral", "accident", "other"]
+NotificationMethod = Literal["phone", "email", "in-person", "sms"]
+
 class IncidentReportBase(BaseModel):
     """Base incident report schema"""
     child_id: UUID
     incident_date: date
     incident_time: time
-    incident_type: str  # injury, illness, behavioral, accident, other
+    incident_type: IncidentType
     description: str
     circumstances: str
     injury_description: Optional[str] = None
@@ -26,7 +29,7 @@ class IncidentReportBase(BaseModel):
     photo_url: Optional[str] = None
     parent_notified: bool = False
     parent_notified_at: Optional[datetime] = None
-    parent_notification_method: Optional[str] = None  # phone, email, in-person, sms
+    parent_notification_method: Optional[NotificationMethod] = None
     dcfs_notification_required: bool = False
     dcfs_notified_at: Optional[datetime] = None
     staff_signature_url: Optional[str] = None
@@ -40,7 +43,7 @@ class IncidentReportCreate(IncidentReportBase):
 
 class IncidentReportUpdate(BaseModel):
     """Schema for updating an incident report"""
-    incident_type: Optional[str] = None
+    incident_type: Optional[IncidentType] = None
     description: Optional[str] = None
     circumstances: Optional[str] = None
     injury_description: Optional[str] = None
@@ -50,13 +53,19 @@ class IncidentReportUpdate(BaseModel):
     photo_url: Optional[str] = None
     parent_notified: Optional[bool] = None
     parent_notified_at: Optional[datetime] = None
-    parent_notification_method: Optional[str] = None
+    parent_notification_method: Optional[NotificationMethod] = None
     dcfs_notification_required: Optional[bool] = None
     dcfs_notified_at: Optional[datetime] = None
     staff_signature_url: Optional[str] = None
     staff_signed_at: Optional[datetime] = None
 
 
+class IncidentParentNotificationBulk(BaseModel):
+    """Schema for marking several incident reports as parent notified at once"""
+    report_ids: List[UUID] = Field(..., min_length=1, max_length=500)
+    notification_method: NotificationMethod
+
+
 class IncidentReportResponse(IncidentReportBase):
     """Schema for incident report response"""
     id: UUID
@@ -68,6 +77,21 @@ class IncidentReportResponse(IncidentReportBase):
         from_attributes = True
 
 
+class IncidentReportListItem(BaseModel):
+    """Compact incident row for list endpoints (description cut to 100 characters)"""
+    id: UUID
+    child_id: UUID
+    incident_type: IncidentType
+    incident_date: date
+    incident_time: time
+    description: str
+    parent_notified: bool
+    dcfs_notification_required: bool
+
+    class Config:
+        from_attributes = True
+
+
 # ============================================
 # MEDICATION AUTHORIZATION SCHEMAS
 # ============================================
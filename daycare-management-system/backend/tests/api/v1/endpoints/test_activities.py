@@ -0,0 +1,78 @@
+# Activities Endpoint Tests
+# ============================================
+
+import base64
+import json
+import pytest
+from datetime import date, datetime, timedelta
+from fastapi import status
+from app.core.config import settings
+
+
+@pytest.fixture(scope="function")
+def activities(db, test_child, test_user):
+    """Five activities for test_child, one per hour"""
+    from app.models.daily_operations import Activity
+
+    start = datetime(2024, 3, 1, 8, 0)
+    rows = [
+        Activity(
+            child_id=test_child.id,
+            activity_date=start.date(),
+            activity_time=start + timedelta(hours=i),
+            activity_type="play",
+            activity_name=f"Play {i}",
+            logged_by=test_user.id
+        )
+        for i in range(5)
+    ]
+    db.add_all(rows)
+    db.commit()
+    return rows
+
+
+class TestActivityPagination:
+    """Test keyset pagination of the activity list"""
+
+    def test_cursor_round_trip(self, client, signed_in, activities):
+        """Test that following X-Next-Cursor walks every row exactly once"""
+        seen = []
+        cursor = None
+        while True:
+            params = {"page_size": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = client.get(f"{settings.API_V1_PREFIX}/activities/", params=params)
+            assert response.status_code == status.HTTP_200_OK
+            seen += [item["activity_name"] for item in response.json()]
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+
+        assert seen == [f"Play {i}" for i in reversed(range(5))]
+
+    @pytest.mark.parametrize("cursor", [
+        "not-a-cursor",
+        base64.urlsafe_b64encode(b'["2024-01-01"]').decode(),
+        base64.urlsafe_b64encode(json.dumps(["2024-01-01", "2024-01-01 10:00:00", 5]).encode()).decode(),
+    ])
+    def test_invalid_cursor(self, client, signed_in, activities, cursor):
+        """Test that malformed cursors are rejected with 400, not 500"""
+        response = client.get(f"{settings.API_V1_PREFIX}/activities/", params={"cursor": cursor})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"] == "Invalid pagination cursor"
+
+    def test_legacy_page_parameter(self, client, signed_in, activities):
+        """Test that ?page= still pages by offset in keyset order"""
+        response = client.get(
+            f"{settings.API_V1_PREFIX}/activities/",
+            params={"page": 2, "page_size": 2}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["activity_name"] for item in response.json()] == ["Play 2", "Play 1"]
+
+    def test_legacy_page_parameter_disabled(self, client, signed_in, activities, monkeypatch):
+        """Test that ?page= is rejected rather than ignored once offset pagination is off"""
+        monkeypatch.setattr(settings, "ALLOW_OFFSET_PAGINATION", False)
+        response = client.get(f"{settings.API_V1_PREFIX}/activities/", params={"page": 2})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,59 @@
+# Attendance Endpoint Tests
+# ============================================
+
+import pytest
+from datetime import date
+from fastapi import status
+from app.core.config import settings
+from app.models.daily_operations import Attendance
+
+
+def check_in(client, child_id):
+    """Check a child in at 8:00 AM"""
+    return client.post(
+        f"{settings.API_V1_PREFIX}/attendance/check-in",
+        json={
+            "child_id": str(child_id),
+            "check_in_time": "08:00:00",
+            "check_in_by_name": "Jane Johnson"
+        }
+    )
+
+
+class TestCheckIn:
+    """Test child check-in"""
+
+    def test_check_in(self, client, signed_in, db, test_child, test_user):
+        """Test checking a child in for today"""
+        response = check_in(client, test_child.id)
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert data["child_id"] == str(test_child.id)
+        assert data["attendance_date"] == date.today().isoformat()
+        assert data["check_in_by_name"] == "Jane Johnson"
+        assert data["recorded_by"] == str(test_user.id)
+
+    def test_check_in_twice(self, client, signed_in, db, test_child):
+        """Test that a second check-in on the same day is rejected"""
+        assert check_in(client, test_child.id).status_code == status.HTTP_201_CREATED
+
+        response = check_in(client, test_child.id)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"] == "Child already checked in today"
+        assert db.query(Attendance).filter(Attendance.child_id == test_child.id).count() == 1
+
+    def test_check_in_inactive_child(self, client, signed_in, db, test_child):
+        """Test that an inactive child cannot be checked in"""
+        test_child.is_active = False
+        db.commit()
+
+        response = check_in(client, test_child.id)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"] == "Cannot check in inactive child"
+        assert db.query(Attendance).count() == 0
+
+    def test_check_in_unknown_child(self, client, signed_in, db):
+        """Test checking in a child that does not exist"""
+        response = check_in(client, "00000000-0000-0000-0000-000000000000")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert db.query(Attendance).count() == 0
@@ -149,6 +149,70 @@ class TestImmunizationRecords:
         assert data[0]["days_until_expiration"] <= 30
 
 
+    def test_create_immunization_records_bulk(self, client, signed_in, test_child, db):
+        """Test backfilling several immunization records in one request"""
+        from app.models.compliance import ImmunizationRecord
+
+        response = client.post(
+            f"{settings.API_V1_PREFIX}/compliance/immunizations/bulk",
+            json={
+                "records": [
+                    {
+                        "child_id": str(test_child.id),
+                        "vaccine_name": vaccine,
+                        "administration_date": "2023-06-15",
+                        "provider_name": "Dr. Smith"
+                    }
+                    for vaccine in ("MMR", "DTaP", "Polio")
+                ]
+            }
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert [record["vaccine_name"] for record in data] == ["MMR", "DTaP", "Polio"]
+        assert all(record["child_id"] == str(test_child.id) for record in data)
+        assert db.query(ImmunizationRecord).count() == 3
+
+    def test_create_immunization_records_bulk_unknown_child(self, client, signed_in, test_child, db):
+        """Test that an unknown child rejects the whole batch"""
+        from uuid import uuid4
+        from app.models.compliance import ImmunizationRecord
+
+        unknown_id = uuid4()
+        response = client.post(
+            f"{settings.API_V1_PREFIX}/compliance/immunizations/bulk",
+            json={
+                "records": [
+                    {
+                        "child_id": str(child_id),
+                        "vaccine_name": "MMR",
+                        "administration_date": "2023-06-15"
+                    }
+                    for child_id in (test_child.id, unknown_id)
+                ]
+            }
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json()["detail"] == f"Children not found: {unknown_id}"
+        assert db.query(ImmunizationRecord).count() == 0
+
+    def test_create_immunization_records_bulk_too_many(self, client, signed_in, test_child, db):
+        """Test that a batch over the 500 record cap is rejected"""
+        from app.models.compliance import ImmunizationRecord
+
+        record = {
+            "child_id": str(test_child.id),
+            "vaccine_name": "MMR",
+            "administration_date": "2023-06-15"
+        }
+        response = client.post(
+            f"{settings.API_V1_PREFIX}/compliance/immunizations/bulk",
+            json={"records": [record] * 501}
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert db.query(ImmunizationRecord).count() == 0
+
+
 class TestStaffCredentials:
     """Test staff credential endpoints"""
 
@@ -196,6 +260,59 @@ class TestStaffCredentials:
         assert len(data) > 0
         assert data[0]["credential_type"] == "First Aid"
 
+    def test_get_user_credentials_query_count(self, client, auth_headers, test_user, db, count_queries):
+        """Test that listing credentials does not issue a query per row"""
+        from app.models.compliance import StaffCredential
+
+        db.add_all([
+            StaffCredential(
+                user_id=test_user.id,
+                credential_type="CPR",
+                credential_number=f"CPR{i}",
+                issue_date=date.today(),
+                expiration_date=date.today() + timedelta(days=365 + i)
+            )
+            for i in range(5)
+        ])
+        db.commit()
+
+        with count_queries() as queries:
+            response = client.get(
+                f"{settings.API_V1_PREFIX}/compliance/staff-credentials/user/{test_user.id}",
+                headers=auth_headers
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 5
+        # Current user lookup, user existence check and the list itself
+        assert len(queries) <= 3
+
+    def test_credential_reports_query_count(self, client, auth_headers, test_user, db, count_queries):
+        """Test that the expiring and expired reports take one query regardless of size"""
+        from app.models.compliance import StaffCredential
+
+        db.add_all([
+            StaffCredential(
+                user_id=test_user.id,
+                credential_type="CPR",
+                issue_date=date(2022, 1, 1),
+                expiration_date=date.today() + timedelta(days=offset)
+            )
+            for offset in (-90, -10, 5, 20)
+        ])
+        db.commit()
+
+        for path in ("expiring/soon?days=30", "expired/list"):
+            with count_queries() as queries:
+                response = client.get(
+                    f"{settings.API_V1_PREFIX}/compliance/staff-credentials/{path}",
+                    headers=auth_headers
+                )
+
+            assert response.status_code == status.HTTP_200_OK
+            # Current user lookup and the report itself (or a cache hit)
+            assert len(queries) <= 2
+
     def test_get_expired_credentials(self, client, auth_headers, test_user, db):
         """Test getting expired credentials"""
         from app.models.compliance import StaffCredential
@@ -206,8 +323,7 @@ class TestStaffCredentials:
             credential_number="BC123456",
             issue_date=date(2022, 1, 1),
             expiration_date=date.today() - timedelta(days=30),
-            is_verified=True,
-            is_expired=True
+            is_verified=True
         )
         db.add(expired_credential)
         db.commit()
@@ -260,3 +376,110 @@ class TestStaffCredentials:
             }
         )
         assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+    def test_create_staff_credentials_bulk(self, client, signed_in, test_user, test_admin, db):
+        """Test adding credentials for several staff in one request"""
+        from app.models.compliance import StaffCredential
+
+        response = client.post(
+            f"{settings.API_V1_PREFIX}/compliance/staff-credentials/bulk",
+            json={
+                "credentials": [
+                    {
+                        "user_id": str(user.id),
+                        "credential_type": "CPR",
+                        "issue_date": "2024-01-15",
+                        "expiration_date": "2026-01-15"
+                    }
+                    for user in (test_user, test_admin)
+                ]
+            }
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert [credential["user_id"] for credential in data] == [str(test_user.id), str(test_admin.id)]
+        assert db.query(StaffCredential).count() == 2
+
+    def test_create_staff_credentials_bulk_invalid_type(self, client, signed_in, test_user, db):
+        """Test that one invalid credential type rejects the whole batch"""
+        from app.models.compliance import StaffCredential
+
+        response = client.post(
+            f"{settings.API_V1_PREFIX}/compliance/staff-credentials/bulk",
+            json={
+                "credentials": [
+                    {
+                        "user_id": str(test_user.id),
+                        "credential_type": credential_type,
+                        "issue_date": "2024-01-15"
+                    }
+                    for credential_type in ("CPR", "Pilot License")
+                ]
+            }
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"].startswith("Invalid credential type")
+        assert db.query(StaffCredential).count() == 0
+
+    def test_create_staff_credentials_bulk_unknown_user(self, client, signed_in, test_user, db):
+        """Test that an unknown user rejects the whole batch"""
+        from uuid import uuid4
+        from app.models.compliance import StaffCredential
+
+        unknown_id = uuid4()
+        response = client.post(
+            f"{settings.API_V1_PREFIX}/compliance/staff-credentials/bulk",
+            json={
+                "credentials": [
+                    {
+                        "user_id": str(user_id),
+                        "credential_type": "CPR",
+                        "issue_date": "2024-01-15"
+                    }
+                    for user_id in (test_user.id, unknown_id)
+                ]
+            }
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json()["detail"] == f"Users not found: {unknown_id}"
+        assert db.query(StaffCredential).count() == 0
+
+
+class TestEmergencyContactCompliance:
+    """Test the emergency contact compliance report"""
+
+    def test_missing_contacts_query_count(self, client, auth_headers, db, count_queries):
+        """Test that the missing contacts report counts contacts in one query"""
+        from app.models.child import Child, EmergencyContact
+
+        children = [
+            Child(
+                first_name=f"Child{i}",
+                last_name="Test",
+                date_of_birth=date(2020, 1, 1),
+                enrollment_date=date(2024, 1, 1),
+                is_active=True
+            )
+            for i in range(3)
+        ]
+        db.add_all(children)
+        db.commit()
+        db.add(EmergencyContact(
+            child_id=children[0].id,
+            name="Grandma Test",
+            relationship_type="grandparent",
+            phone_primary="555-0100",
+            priority_order=1
+        ))
+        db.commit()
+
+        with count_queries() as queries:
+            response = client.get(
+                f"{settings.API_V1_PREFIX}/emergency-contacts/compliance/missing",
+                headers=auth_headers
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        # Current user lookup and the aggregate report (or a cache hit)
+        assert len(queries) <= 2
@@ -0,0 +1,157 @@
+# Emergency Contacts Endpoint Tests
+# ============================================
+
+import pytest
+from types import SimpleNamespace
+from fastapi import status
+from sqlalchemy.exc import IntegrityError
+from app.core.config import settings
+from app.models.child import EmergencyContact
+
+
+@pytest.fixture(scope="function")
+def contacts(db, test_child):
+    """Four emergency contacts for test_child in priority slots 1-4"""
+    rows = [
+        EmergencyContact(
+            child_id=test_child.id,
+            name=f"Contact {i}",
+            relationship_type="aunt",
+            phone_primary="555-0100",
+            priority_order=i
+        )
+        for i in range(1, 5)
+    ]
+    db.add_all(rows)
+    db.commit()
+    return rows
+
+
+def contact_order(db, child_id):
+    """Contact names in priority order, read back from the database"""
+    rows = db.query(EmergencyContact.name, EmergencyContact.priority_order)\
+        .filter(EmergencyContact.child_id == child_id)\
+        .order_by(EmergencyContact.priority_order)\
+        .all()
+    assert [row.priority_order for row in rows] == list(range(1, len(rows) + 1))
+    return [row.name for row in rows]
+
+
+def constraint_violation(constraint_name):
+    """IntegrityError shaped like psycopg's, naming the violated constraint"""
+    orig = Exception("duplicate key value violates unique constraint")
+    orig.diag = SimpleNamespace(constraint_name=constraint_name)
+    return IntegrityError("UPDATE emergency_contacts", {}, orig)
+
+
+class TestCreateEmergencyContact:
+    """Test emergency contact creation"""
+
+    def test_create_contact(self, client, signed_in, test_child, contacts):
+        """Test creating a contact in a free priority slot"""
+        response = client.post(
+            f"{settings.API_V1_PREFIX}/emergency-contacts/",
+            json={
+                "child_id": str(test_child.id),
+                "name": "Contact 5",
+                "relationship_type": "uncle",
+                "phone_primary": "555-0105",
+                "priority_order": 5
+            }
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["priority_order"] == 5
+
+    def test_create_contact_priority_taken(self, client, signed_in, db, test_child, contacts):
+        """Test that a contact cannot take another contact's priority slot"""
+        response = client.post(
+            f"{settings.API_V1_PREFIX}/emergency-contacts/",
+            json={
+                "child_id": str(test_child.id),
+                "name": "Contact 5",
+                "relationship_type": "uncle",
+                "phone_primary": "555-0105",
+                "priority_order": 2
+            }
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert contact_order(db, test_child.id) == [f"Contact {i}" for i in range(1, 5)]
+
+    def test_create_contact_unknown_child(self, client, signed_in):
+        """Test creating a contact for a child that does not exist"""
+        response = client.post(
+            f"{settings.API_V1_PREFIX}/emergency-contacts/",
+            json={
+                "child_id": "00000000-0000-0000-0000-000000000000",
+                "name": "Contact 1",
+                "relationship_type": "uncle",
+                "phone_primary": "555-0105",
+                "priority_order": 1
+            }
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestUpdateEmergencyContact:
+    """Test emergency contact updates"""
+
+    def test_update_priority_taken(self, client, signed_in, db, contacts, monkeypatch):
+        """Test that a uq_contact_priority violation is reported as 400"""
+        def collide(*args, **kwargs):
+            raise constraint_violation("uq_contact_priority")
+
+        monkeypatch.setattr(db, "execute", collide)
+        response = client.put(
+            f"{settings.API_V1_PREFIX}/emergency-contacts/{contacts[0].id}",
+            json={"priority_order": 2}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "Priority order 2" in response.json()["detail"]
+
+    def test_update_other_constraint_reraised(self, client, signed_in, db, contacts, monkeypatch):
+        """Test that violations of any other constraint are not reported as a priority clash"""
+        def collide(*args, **kwargs):
+            raise constraint_violation("emergency_contacts_child_id_fkey")
+
+        monkeypatch.setattr(db, "execute", collide)
+        with pytest.raises(IntegrityError):
+            client.put(
+                f"{settings.API_V1_PREFIX}/emergency-contacts/{contacts[0].id}",
+                json={"priority_order": 2}
+            )
+
+
+class TestReorderEmergencyContact:
+    """Test moving a contact to a new priority slot"""
+
+    @pytest.mark.parametrize("index,new_priority,expected", [
+        # Move up: the contacts in between shift down one slot
+        (3, 2, [1, 4, 2, 3]),
+        # Move down: the contacts in between shift up one slot
+        (0, 3, [2, 3, 1, 4]),
+        # Into the neighbouring occupied slot: the two contacts swap
+        (1, 3, [1, 3, 2, 4]),
+    ])
+    def test_reorder(self, client, signed_in, db, test_child, contacts, index, new_priority, expected):
+        """Test that reordering keeps every other contact in a unique slot"""
+        response = client.patch(
+            f"{settings.API_V1_PREFIX}/emergency-contacts/{contacts[index].id}/reorder/{new_priority}"
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["priority_order"] == new_priority
+        assert contact_order(db, test_child.id) == [f"Contact {i}" for i in expected]
+
+    def test_reorder_same_slot(self, client, signed_in, db, test_child, contacts):
+        """Test that moving a contact onto its own slot changes nothing"""
+        response = client.patch(
+            f"{settings.API_V1_PREFIX}/emergency-contacts/{contacts[2].id}/reorder/3"
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert contact_order(db, test_child.id) == [f"Contact {i}" for i in range(1, 5)]
+
+    def test_reorder_not_found(self, client, signed_in):
+        """Test reordering a contact that does not exist"""
+        response = client.patch(
+            f"{settings.API_V1_PREFIX}/emergency-contacts/00000000-0000-0000-0000-000000000000/reorder/1"
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,83 @@
+# Incident Reports Endpoint Tests
+# ============================================
+
+import pytest
+from datetime import date, time
+from uuid import uuid4
+from fastapi import status
+from app.core.config import settings
+from app.models.health_safety import IncidentReport
+
+
+@pytest.fixture(scope="function")
+def incidents(db, test_child, test_user):
+    """Three incident reports for test_child, parents not yet notified"""
+    rows = [
+        IncidentReport(
+            child_id=test_child.id,
+            incident_date=date(2024, 3, 1),
+            incident_time=time(9 + i, 0),
+            incident_type="injury",
+            description="Scraped knee on the playground",
+            circumstances="Running during outdoor play",
+            action_taken="Cleaned and bandaged",
+            reported_by=test_user.id
+        )
+        for i in range(3)
+    ]
+    db.add_all(rows)
+    db.commit()
+    return rows
+
+
+def notified_ids(db):
+    """IDs of the reports currently marked as parent notified"""
+    db.expire_all()
+    return {row.id for row in db.query(IncidentReport.id).filter(IncidentReport.parent_notified == True)}
+
+
+class TestBulkParentNotification:
+    """Test marking several incident reports as parent notified"""
+
+    def test_notify_all(self, client, signed_in, db, incidents):
+        """Test that every listed report is marked notified"""
+        response = client.post(
+            f"{settings.API_V1_PREFIX}/incidents/bulk/notify-parent",
+            json={
+                "report_ids": [str(report.id) for report in incidents],
+                "notification_method": "phone"
+            }
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"updated": 3}
+        assert notified_ids(db) == {report.id for report in incidents}
+
+        methods = db.query(IncidentReport.parent_notification_method).distinct().all()
+        assert methods == [("phone",)]
+
+    def test_notify_unknown_report(self, client, signed_in, db, incidents):
+        """Test that an unknown ID fails the whole request and updates nothing"""
+        unknown_id = uuid4()
+        response = client.post(
+            f"{settings.API_V1_PREFIX}/incidents/bulk/notify-parent",
+            json={
+                "report_ids": [str(incidents[0].id), str(unknown_id)],
+                "notification_method": "email"
+            }
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert str(unknown_id) in response.json()["detail"]
+        assert str(incidents[0].id) not in response.json()["detail"]
+        assert notified_ids(db) == set()
+
+    def test_notify_too_many_reports(self, client, signed_in, db, incidents):
+        """Test that a request over the 500 report cap is rejected"""
+        response = client.post(
+            f"{settings.API_V1_PREFIX}/incidents/bulk/notify-parent",
+            json={
+                "report_ids": [str(uuid4()) for _ in range(501)],
+                "notification_method": "phone"
+            }
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert notified_ids(db) == set()
@@ -2,15 +2,16 @@
 # ============================================
 
 import pytest
+from contextlib import contextmanager
 from typing import Generator
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
 from app.database import Base, get_db
-from app.core.security import get_password_hash
+from app.core.security import get_current_user, get_password_hash
 from app.models.user import User
 from app.models.child import Child, Parent, ChildParent
 from app.core.config import settings
@@ -24,7 +25,7 @@ engine = create_engine(
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 
 @pytest.fixture(scope="function")
@@ -39,6 +40,28 @@ def db() -> Generator:
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(scope="function")
+def count_queries():
+    """
+    Context manager that collects the SQL statements run inside it.
+    Used to catch N+1 regressions in list endpoints.
+    """
+    @contextmanager
+    def counter():
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+    return counter
+
+
 @pytest.fixture(scope="function")
 def client(db) -> Generator:
     """Create a test client with database dependency override"""
@@ -88,6 +111,14 @@ def test_admin(db) -> User:
     return admin
 
 
+@pytest.fixture(scope="function")
+def signed_in(client, test_user):
+    """Authenticate requests as test_user without going through login"""
+    app.dependency_overrides[get_current_user] = lambda: test_user
+    yield
+    app.dependency_overrides.pop(get_current_user, None)
+
+
 @pytest.fixture(scope="function")
 def auth_headers(client, test_user) -> dict:
     """Get authentication headers for test user"""